@@ -0,0 +1,208 @@
+'''
+Times the fetcher dataframe to context transforms, outage remarks cleanup and
+docx rendering for growing table sizes, records the results in a json history file
+and fails if any benchmark is slower than the recent runs by more than a threshold
+run with "python -m benchmarks.benchmarkSuite" from the project folder
+'''
+import argparse
+import datetime as dt
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import timeit
+import numpy as np
+import pandas as pd
+from typing import Callable, Dict, List, Tuple
+from src.fetchers.freqProfileFetcher import FrequencyProfileFetcher
+from src.fetchers.vdiFetcher import VdiFetcher
+from src.fetchers.voltStatsFetcher import VoltStatsFetcher
+from src.fetchers.angleViolFetcher import AnglViolationsFetcher
+from src.fetchers.outageEventsFetcher import filterMajorGenUnitOutages, filterTransElOutages, filterLongTimeUnrevivedForcedOutages
+from src.config.voltStatsLayout import getVoltStatsLayout
+from src.utils.stringUtils import removeRedundantRemarks, combineTagReasonRemarks, cleanOutageReasons
+from src.app.weeklyReportGenerator import WeeklyReportGenerator
+
+tmplPath = 'assets/weekly_report_template.docx'
+defaultHistoryPath = 'benchmarks/benchmark_history.json'
+
+# benchmark name, function to be timed and number of timing repeats
+IBenchmark = Tuple[str, Callable[[], object], int]
+
+
+def getTransformBenchmarks(rndGen: np.random.Generator) -> List[IBenchmark]:
+    """benchmarks of the dataframe to context transforms of the fetchers with a year of daily data
+    """
+    days = pd.date_range('2020-04-01', '2021-03-31')
+    freqCols = ['MAXIMUM', 'MINIMUM', 'AVERAGE', 'LESS_THAN_BAND', 'BETWEEN_BAND',
+                'GREATER_THAN_BAND', 'OUT_OF_BAND', 'OUT_OF_BAND_INHRS', 'FDI']
+    freqDf = pd.DataFrame({col: rndGen.uniform(0, 100, len(days)) for col in freqCols})
+    freqDf['DATE_KEY'] = days
+    freqDf['ID'] = np.arange(len(days))
+
+    stnNodes = [k.split('|') for k in getVoltStatsLayout()['stnColIndsMap'].keys()]
+    voltDf = pd.DataFrame({'DATE_KEY': np.repeat(days.values, len(stnNodes)),
+                           'NODE_NAME': [n.upper() for v, n in stnNodes]*len(days),
+                           'NODE_VOLTAGE': [int(v) for v, n in stnNodes]*len(days),
+                           'MAXIMUM': rndGen.uniform(400, 420, len(days)*len(stnNodes)),
+                           'MINIMUM': rndGen.uniform(380, 400, len(days)*len(stnNodes))})
+
+    numVdiRows = 52*60
+    vdiCols = ['MAXIMUM', 'MINIMUM', 'LESS_THAN_BAND', 'BETWEEN_BAND', 'GREATER_THAN_BAND',
+               'LESS_THAN_BAND_INHRS', 'GREATER_THAN_BAND_INHRS', 'OUT_OF_BAND_INHRS', 'VDI']
+    vdiDf = pd.DataFrame({col: rndGen.uniform(0, 100, numVdiRows) for col in vdiCols})
+    vdiDf['NODE_NAME'] = ['node{0}'.format(i % 60) for i in range(numVdiRows)]
+    vdiDf['NODE_VOLTAGE'] = [[400, 765][i % 2] for i in range(numVdiRows)]
+    for col in ['ID', 'MAPPING_ID', 'WEEK_START_DATE']:
+        vdiDf[col] = 0
+
+    numAngleRows = len(days)*25
+    angleDf = pd.DataFrame({'ANGLE_PAIR': ['pair{0}'.format(i % 25) for i in range(numAngleRows)],
+                            'ANG_LIM': rndGen.uniform(20, 40, numAngleRows), 'VIOL_PERC': rndGen.uniform(0, 10, numAngleRows),
+                            'MAX_VIOL': rndGen.uniform(0, 50, numAngleRows), 'MIN_VIOL': rndGen.uniform(0, 5, numAngleRows)})
+
+    freqFetcher = FrequencyProfileFetcher(None)
+    vdiFetcher = VdiFetcher(None)
+    voltFetcher = VoltStatsFetcher(None)
+    angleFetcher = AnglViolationsFetcher(None)
+    return [
+        ('transform.freqProfile', lambda: freqFetcher.toContextDict(freqDf.copy()), 5),
+        ('transform.vdi', lambda: vdiFetcher.toDerivedVDIDict(vdiDf.copy()), 5),
+        ('transform.voltStats', lambda: voltFetcher.toVoltStatsDict(voltDf), 5),
+        ('transform.anglViols', lambda: angleFetcher.toAnglViolsSummary(angleDf), 5)
+    ]
+
+
+def getOutageEvents(rndGen: np.random.Generator, numEvents: int) -> List[dict]:
+    """random outage events spread around the week of 10-Aug-2020
+    """
+    outageEvents = []
+    for i in range(numEvents):
+        outageDt = dt.datetime(2020, 8, 10) - dt.timedelta(hours=float(rndGen.uniform(0, 24*400)))
+        revivalDt = None if rndGen.random() < 0.2 else outageDt + \
+            dt.timedelta(hours=float(rndGen.lognormal(3, 1.5)))
+        outageEvents.append({'elName': 'element{0}'.format(i), 'owners': ['A', 'B', None][i % 3],
+                             'capacity': [50, 210, 500][i % 3],
+                             'entityName': ['GENERATING_UNIT', 'AC_TRANSMISSION_LINE_CIRCUIT', 'ICT'][i % 3],
+                             'shutdownTypeName': ['FORCED', 'PLANNED'][i % 2],
+                             'outageDt': outageDt, 'revivalDt': revivalDt, 'outageDate': '', 'outageTime': '',
+                             'revivalDate': '', 'revivalTime': '', 'reason': ''})
+    return outageEvents
+
+
+def getOutageBenchmarks(rndGen: np.random.Generator, numEvents: int) -> List[IBenchmark]:
+    """benchmarks of outage remarks cleanup and outage section filters over a large outage set
+    """
+    tags = ['Outage', 'RSD', 'Voltage Regulation', 'Manually opened due to high voltage', 'Tripped', None]
+    reasons = ['RSD', 'VR. high voltage', 'MOHV', 'Boiler tube leakage', None]
+    remarks = ['rsd.', 'vr. to control voltage', 'MOHV', 'Due to low demand', '', None]
+    remarkRows = [(tags[i % len(tags)], reasons[i % len(reasons)], remarks[i % len(remarks)])
+                  for i in range(numEvents)]
+
+    def cleanRemarks():
+        return [combineTagReasonRemarks(*removeRedundantRemarks(*r)) for r in remarkRows]
+
+    outageEvents = getOutageEvents(rndGen, numEvents)
+    startDt, endDt = dt.datetime(2020, 8, 10), dt.datetime(2020, 8, 16, 23, 59, 59)
+    return [
+        ('outages.remarks.{0}'.format(numEvents), cleanRemarks, 5),
+        ('outages.remarksBatch.{0}'.format(numEvents), lambda: cleanOutageReasons(*zip(*remarkRows)), 5),
+        ('outages.filters.{0}'.format(numEvents), lambda: (filterMajorGenUnitOutages(outageEvents, startDt, endDt),
+                                                           filterTransElOutages(outageEvents, startDt, endDt),
+                                                           filterLongTimeUnrevivedForcedOutages(outageEvents, endDt)), 5)
+    ]
+
+
+def getRenderBenchmarks(numOutageRowsList: List[int], dumpFolder: str) -> List[IBenchmark]:
+    """benchmarks of docx rendering with growing number of outage rows in the report
+    """
+    wklyRprtGntr = WeeklyReportGenerator(None)
+    reportCxt = wklyRprtGntr.getInitialReportContext(
+        dt.datetime(2020, 8, 10), dt.datetime(2020, 8, 16, 23, 59, 59))
+    outage = {'elName': '400KV-BHILAI-KORADI-1', 'owners': 'PGCIL', 'capacity': '400', 'outageDate': '10-08-2020',
+              'outageTime': '10:00', 'revivalDate': 'Still out', 'revivalTime': 'Still out',
+              'reason': 'Tripped / Distance protection operated'}
+    benchmarks: List[IBenchmark] = []
+    for numRows in numOutageRowsList:
+        rowsCxt = dict(reportCxt, transOtgs=[outage]*numRows, genOtgs=[outage]*(numRows//10))
+        benchmarks.append(('render.outageRows.{0}'.format(numRows),
+                           lambda c=rowsCxt: wklyRprtGntr.generateReportWithContext(c, tmplPath, dumpFolder), 1 if numRows >= 10000 else 3))
+    return benchmarks
+
+
+def runBenchmarks(benchmarks: List[IBenchmark]) -> Dict[str, float]:
+    """run each benchmark after a warm up run
+
+    Returns:
+        Dict[str, float]: best time in seconds of each benchmark
+    """
+    results: Dict[str, float] = {}
+    for name, func, numRepeats in benchmarks:
+        func()
+        results[name] = min(timeit.repeat(func, number=1, repeat=numRepeats))
+        print('{0:<32} {1:10.4f} s'.format(name, results[name]))
+    return results
+
+
+def findRegressions(results: Dict[str, float], history: List[dict], threshold: float, numBaselineRuns: int = 5) -> Dict[str, Tuple[float, float]]:
+    """compare the results with the median of the recent runs of each benchmark in history
+
+    Args:
+        results (Dict[str, float]): time in seconds of each benchmark
+        history (List[dict]): previous runs, oldest first
+        threshold (float): allowed slowdown fraction, like 0.2 for 20 %
+        numBaselineRuns (int, optional): number of recent runs used as baseline. Defaults to 5.
+
+    Returns:
+        Dict[str, Tuple[float, float]]: (baseline secs, current secs) of the regressed benchmarks
+    """
+    regressions: Dict[str, Tuple[float, float]] = {}
+    for name, secs in results.items():
+        prevSecs = [run['results'][name] for run in history if name in run['results']]
+        if len(prevSecs) == 0:
+            continue
+        baselineSecs = statistics.median(prevSecs[-numBaselineRuns:])
+        if secs > baselineSecs*(1 + threshold):
+            regressions[name] = (baselineSecs, secs)
+    return regressions
+
+
+def loadHistory(historyPath: str) -> List[dict]:
+    if not os.path.isfile(historyPath):
+        return []
+    with open(historyPath) as f:
+        return json.load(f)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--history', help="json file of benchmark history", default=defaultHistoryPath)
+    parser.add_argument('--threshold', help="allowed slowdown fraction before failing, like 0.2 for 20 %%",
+                        type=float, default=0.2)
+    parser.add_argument('--quick', help="skip the largest outage sets and render sizes", action='store_true')
+    parser.add_argument('--no_record', help="do not add this run to history", action='store_true')
+    args = parser.parse_args()
+
+    rndGen = np.random.default_rng(0)
+    outageSetSizes = [1000, 10000] if args.quick else [1000, 10000, 100000]
+    renderSizes = [100, 1000] if args.quick else [100, 1000, 10000]
+    with tempfile.TemporaryDirectory() as dumpFolder:
+        benchmarks = getTransformBenchmarks(rndGen)
+        for numEvents in outageSetSizes:
+            benchmarks += getOutageBenchmarks(rndGen, numEvents)
+        benchmarks += getRenderBenchmarks(renderSizes, dumpFolder)
+        results = runBenchmarks(benchmarks)
+
+    history = loadHistory(args.history)
+    regressions = findRegressions(results, history, args.threshold)
+    if not args.no_record:
+        history.append({'time': dt.datetime.now().isoformat(timespec='seconds'),
+                        'python': platform.python_version(), 'machine': platform.node(),
+                        'results': results})
+        with open(args.history, 'w') as f:
+            json.dump(history, f, indent=2)
+    for name, (baselineSecs, secs) in regressions.items():
+        print('REGRESSION {0}: {1:0.4f} s -> {2:0.4f} s'.format(name, baselineSecs, secs))
+    sys.exit(1 if len(regressions) > 0 else 0)
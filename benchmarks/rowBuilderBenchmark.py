@@ -0,0 +1,40 @@
+'''
+Compares the per row dataframe indexing loop with the columnar row builder
+run with "python -m benchmarks.rowBuilderBenchmark" from the project folder
+'''
+import timeit
+import numpy as np
+import pandas as pd
+from src.utils.dfUtils import buildRowsFromColumns, toFixed2Strs
+
+numRows = 10000
+numRepeats = 5
+
+valCols = ['MAXIMUM', 'MINIMUM', 'AVERAGE', 'LESS_THAN_BAND', 'BETWEEN_BAND',
+           'GREATER_THAN_BAND', 'OUT_OF_BAND', 'OUT_OF_BAND_INHRS', 'FDI']
+rndGen = np.random.default_rng(0)
+df = pd.DataFrame({col: rndGen.uniform(0, 100, numRows) for col in valCols})
+df['DATE_KEY'] = np.arange(numRows) % 31 + 1
+
+
+def buildRowsWithLoop():
+    rows = []
+    for ind in df.index:
+        row = {'date_day': df['DATE_KEY'][ind]}
+        for col in valCols:
+            row[col] = "{:0.2f}".format(df[col][ind])
+        rows.append(row)
+    return rows
+
+
+def buildRowsWithColumns():
+    rowSpec = {'date_day': ('DATE_KEY', None)}
+    rowSpec.update({col: (col, toFixed2Strs) for col in valCols})
+    return buildRowsFromColumns(df, rowSpec)
+
+
+if __name__ == '__main__':
+    loopSecs = min(timeit.repeat(buildRowsWithLoop, number=1, repeat=numRepeats))
+    colSecs = min(timeit.repeat(buildRowsWithColumns, number=1, repeat=numRepeats))
+    print('rows: {0}, per row loop: {1:0.4f} s, columnar: {2:0.4f} s, speedup: {3:0.1f}x'.format(
+        numRows, loopSecs, colSecs, loopSecs/colSecs))
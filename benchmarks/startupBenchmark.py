@@ -0,0 +1,63 @@
+'''
+Measures the startup time of the entry points in fresh interpreters
+and reports the slowest imports as per "python -X importtime"
+run with "python -m benchmarks.startupBenchmark" from the project folder
+'''
+import sys
+import time
+import subprocess
+from typing import List, Tuple
+
+numRepeats = 5
+numTopImports = 10
+
+# modules imported by server.py before it starts serving, server.py itself needs config.xlsx and the app db
+serverImportsCode = 'import flask, src.config.appConfig, src.appLogger, src.db.appDbPool, src.app.sectionCache, ' + \
+    'src.utils.timeUtils, src.app.weeklyReportGenerator, src.app.reportBatchExecutor, ' + \
+    'src.app.reportJobsManager, src.app.appMetrics'
+
+startupCommands = [
+    ('index.py --help', ['index.py', '--help']),
+    ('server.py imports', ['-c', serverImportsCode]),
+    ('python baseline', ['-c', 'pass'])
+]
+
+
+def parseImportTimes(importTimeLog: str) -> List[Tuple[str, int]]:
+    """parse the log of -X importtime into cumulative import time of each module
+
+    Args:
+        importTimeLog (str): stderr of the interpreter run with -X importtime
+
+    Returns:
+        List[Tuple[str, int]]: (module name, cumulative import time in microseconds), slowest first
+    """
+    importTimes = []
+    for line in importTimeLog.splitlines():
+        if not(line.startswith('import time:')) or ('self [us]' in line):
+            continue
+        _, cumulativeUs, moduleName = line[len('import time:'):].split('|')
+        importTimes.append((moduleName.strip(), int(cumulativeUs)))
+    return sorted(importTimes, key=lambda t: t[1], reverse=True)
+
+
+def measureStartup(cmdArgs: List[str]) -> Tuple[float, List[Tuple[str, int]]]:
+    """run a command in fresh interpreters and get its best wall time and import times of that run
+    """
+    bestSecs, bestImportTimes = None, []
+    for _ in range(numRepeats):
+        startTime = time.perf_counter()
+        proc = subprocess.run([sys.executable, '-X', 'importtime'] + cmdArgs,
+                              stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+        runSecs = time.perf_counter() - startTime
+        if bestSecs is None or runSecs < bestSecs:
+            bestSecs, bestImportTimes = runSecs, parseImportTimes(proc.stderr)
+    return bestSecs, bestImportTimes
+
+
+if __name__ == '__main__':
+    for name, cmdArgs in startupCommands:
+        startupSecs, importTimes = measureStartup(cmdArgs)
+        print('{0}: {1:0.3f} s'.format(name, startupSecs))
+        for moduleName, cumulativeUs in importTimes[:numTopImports]:
+            print('    {0:>8.1f} ms  {1}'.format(cumulativeUs/1000, moduleName))
@@ -1,56 +1,112 @@
 import argparse
 import datetime as dt
-from src.utils.timeUtils import getMondayBeforeDt, getSundayAfterDt
-from src.config.appConfig import getConfig
+from src.utils.timeUtils import getMondayBeforeDt, getWeekWindows
+from src.config.appConfig import getConfig, getConfigVal
 from src.typeDefs.appConfig import IAppConfig
+from src.typeDefs.cursorOpts import ICursorOpts
+from typing import Optional
 from src.app.weeklyReportGenerator import WeeklyReportGenerator
 from src.appLogger import initAppLogger
+from src.db.appDbPool import initAppDbPool
+from src.app.sectionCache import initSectionCache
+from src.app.daySliceStore import initDaySliceStore
+from src.app.reportArtifactStore import initReportArtifactStore
+from src.app.reportBatchExecutor import ReportBatchExecutor
 
-# get start and end dates from command line
-# initialise default command line input values
-startDate = dt.datetime.now() - dt.timedelta(days=7)
-startDate = getMondayBeforeDt(startDate)
-endDate = startDate + dt.timedelta(days=6)
+# render worker processes import this module, so run only when executed as a script
+if __name__ == '__main__':
+    # get start and end dates from command line
+    # initialise default command line input values
+    startDate = dt.datetime.now() - dt.timedelta(days=7)
+    startDate = getMondayBeforeDt(startDate)
+    endDate = startDate + dt.timedelta(days=6)
 
-# get an instance of argument parser from argparse module
-parser = argparse.ArgumentParser()
-# setup arguements
-parser.add_argument('--start_date', help="Enter Start date in yyyy-mm-dd format",
-                    default=dt.datetime.strftime(startDate, '%Y-%m-%d'))
-parser.add_argument('--end_date', help="Enter last date in yyyy-mm-dd format",
-                    default=dt.datetime.strftime(endDate, '%Y-%m-%d'))
-# get the dictionary of command line inputs entered by the user
-args = parser.parse_args()
+    # get an instance of argument parser from argparse module
+    parser = argparse.ArgumentParser()
+    # setup arguements
+    parser.add_argument('--start_date', help="Enter Start date in yyyy-mm-dd format",
+                        default=dt.datetime.strftime(startDate, '%Y-%m-%d'))
+    parser.add_argument('--end_date', help="Enter last date in yyyy-mm-dd format",
+                        default=dt.datetime.strftime(endDate, '%Y-%m-%d'))
+    parser.add_argument('--refresh_cache', help="Fetch all report sections from db even if they are present in section cache",
+                        action='store_true')
+    parser.add_argument('--refresh_sections', help="Fetch only these comma separated report sections from db, like violMsgs,ictCons. Other sections are taken from section cache",
+                        default=None)
+    parser.add_argument('--from_snapshot', help="Render the reports again from the context snapshots saved in dump folder, without using db",
+                        action='store_true')
+    parser.add_argument('--accumulate_till', help="Enter a date in yyyy-mm-dd format to only store the day slices of daily sections of its week till that date, instead of generating reports",
+                        default=None)
+    parser.add_argument('--config_file', help="Enter the app config file path, config.json or config.toml can be used instead of config.xlsx",
+                        default='config.xlsx')
+    # get the dictionary of command line inputs entered by the user
+    args = parser.parse_args()
 
-# access each command line input from the dictionary
-startDate = dt.datetime.strptime(args.start_date, '%Y-%m-%d')
-endDate = dt.datetime.strptime(args.end_date, '%Y-%m-%d')
-# get app config
-appConfig: IAppConfig = getConfig()
+    # access each command line input from the dictionary
+    startDate = dt.datetime.strptime(args.start_date, '%Y-%m-%d')
+    endDate = dt.datetime.strptime(args.end_date, '%Y-%m-%d')
+    # get app config
+    appConfig: IAppConfig = getConfig(args.config_file)
 
-# initialize logger
-appLogger = initAppLogger(appConfig)
+    # initialize logger
+    appLogger = initAppLogger(appConfig)
 
-# get app db connection string from config file
-appDbConStr: str = appConfig['appDbConStr']
-dumpFolder: str = appConfig['dumpFolder']
+    # create the app db connection pool from config file, db is not used while rendering from snapshots
+    appDbPool = None if args.from_snapshot else initAppDbPool(appConfig)
+    # create the on-disk section cache
+    sectionCache = initSectionCache(appConfig)
+    # create the on-disk store of day slices of daily sections
+    daySliceStore = initDaySliceStore(appConfig)
+    # create the content addressed store of generated reports
+    artifactStore = initReportArtifactStore(appConfig)
+    dumpFolder: str = appConfig['dumpFolder']
+    fetchWorkers: int = int(getConfigVal(appConfig, 'fetchWorkers', 1))
+    renderWorkers: int = int(getConfigVal(appConfig, 'renderWorkers', 2))
+    prefetchWeeks: int = int(getConfigVal(appConfig, 'prefetchWeeks', 2))
+    fetchBatchWeeks: int = int(getConfigVal(appConfig, 'fetchBatchWeeks', 13))
+    outageCursorOpts: ICursorOpts = {'arraySize': int(getConfigVal(appConfig, 'outageFetchArraySize', 1000)),
+                                     'prefetchRows': int(getConfigVal(appConfig, 'outageFetchPrefetchRows', 1000))}
+    # sections not fetched within these durations are left out of the report as data unavailable
+    sectionTimeoutSecs: Optional[float] = getConfigVal(appConfig, 'sectionTimeoutSecs')
+    deadlineSecs: Optional[float] = getConfigVal(appConfig, 'generationDeadlineSecs')
 
-# generate report word file
-tmplPath: str = "assets/weekly_report_template.docx"
+    # generate report word file
+    tmplPath: str = "assets/weekly_report_template.docx"
 
-# create weekly report
-wklyRprtGntr = WeeklyReportGenerator(appDbConStr)
-# use while loop to create multiple reports at once
-currDt: dt.datetime = startDate
-while currDt <= endDate:
-    currStartDt = getMondayBeforeDt(currDt)
-    currEndDt = getSundayAfterDt(currStartDt)
-    isWeeklyReportGenerationSuccess: bool = wklyRprtGntr.generateWeeklyReport(
-        currStartDt, currEndDt, tmplPath, dumpFolder)
-    currDt = currEndDt + dt.timedelta(days=1)
-if isWeeklyReportGenerationSuccess:
-    # print('Weekly report word file generation done!')
-    appLogger.info('Weekly report word file generation done!')
-else:
-    # print('Weekly report word file generation unsuccessful...')
-    appLogger.error('Weekly report word file generation unsuccessful...')
+    # create weekly report
+    wklyRprtGntr = WeeklyReportGenerator(
+        appDbPool, fetchWorkers, sectionCache, outageCursorOpts,
+        sectionTimeoutSecs=None if sectionTimeoutSecs is None else float(sectionTimeoutSecs),
+        deadlineSecs=None if deadlineSecs is None else float(deadlineSecs),
+        daySliceStore=daySliceStore, artifactStore=artifactStore)
+    weekWindows = getWeekWindows(startDate, endDate)
+    refreshSections = None if args.refresh_sections is None else [
+        s.strip() for s in args.refresh_sections.split(',') if s.strip() != '']
+    if not(args.accumulate_till is None) and (daySliceStore is None):
+        appLogger.error('day slices can be accumulated only if day slice store is configured',
+                        extra={'accumulateTill': args.accumulate_till})
+    elif not(args.accumulate_till is None):
+        # store the day slices of the running week, so that week end generation fetches only a few days
+        numDataDays = wklyRprtGntr.accumulateDaySlices(
+            dt.datetime.strptime(args.accumulate_till, '%Y-%m-%d'))
+        appLogger.info('day slices accumulation done!', extra={'numDataDays': numDataDays})
+    elif len(weekWindows) == 0:
+        appLogger.error('no weeks between start and end dates, start date should not be after end date',
+                        extra={'startDate': args.start_date, 'endDate': args.end_date})
+    elif not(refreshSections is None) and (sectionCache is None):
+        appLogger.error('report sections can be refreshed only if section cache is configured, '
+                        'since other sections are reused from section cache', extra={'refreshSections': refreshSections})
+    else:
+        # fetch upcoming weeks while earlier weeks are rendered in worker processes
+        batchExecutor = ReportBatchExecutor(
+            wklyRprtGntr, renderWorkers, prefetchWeeks, fetchBatchWeeks)
+        # create multiple reports at once
+        weekResults = batchExecutor.run(weekWindows,
+                                        tmplPath, dumpFolder, args.refresh_cache, refreshSections=refreshSections,
+                                        fromSnapshot=args.from_snapshot)
+        isWeeklyReportGenerationSuccess: bool = all(weekResults)
+        if isWeeklyReportGenerationSuccess:
+            # print('Weekly report word file generation done!')
+            appLogger.info('Weekly report word file generation done!')
+        else:
+            # print('Weekly report word file generation unsuccessful...')
+            appLogger.error('Weekly report word file generation unsuccessful...')
@@ -1,25 +1,27 @@
 '''
 This is the web server that acts as a service that creates outages raw data
 '''
+import os
 import datetime as dt
-from src.config.appConfig import getConfig
+from src.config.appConfig import getConfig, getConfigVal
 from src.appLogger import initAppLogger
+from src.db.appDbPool import initAppDbPool
+from src.app.sectionCache import initSectionCache
+from src.app.daySliceStore import initDaySliceStore
+from src.app.reportArtifactStore import initReportArtifactStore
 from src.config.appConfig import IAppConfig
-from src.utils.timeUtils import getMondayBeforeDt, getSundayAfterDt
+from src.typeDefs.cursorOpts import ICursorOpts
+from typing import List, Optional
+from src.utils.timeUtils import getWeekWindows
 from src.app.weeklyReportGenerator import WeeklyReportGenerator
-from flask import Flask, request, jsonify
-
-# get application config
-appConfig: IAppConfig = getConfig()
-
-# initialize logger
-appLogger = initAppLogger(appConfig)
+from src.app.reportBatchExecutor import ReportBatchExecutor
+from src.app.reportJobsManager import initReportJobsManager
+from src.app.appMetrics import getAppMetrics
+from flask import Flask, request, jsonify, url_for, Response
+from werkzeug.wsgi import wrap_file
 
 app = Flask(__name__)
 
-# Set the secret key to some random bytes
-app.secret_key = appConfig['flaskSecret']
-
 
 @app.route('/')
 def hello():
@@ -35,28 +37,168 @@ def create_weekly_report():
         endDate = dt.datetime.strptime(reqData['endDate'], '%Y-%m-%d')
     except Exception as ex:
         return jsonify({'message': 'Unable to parse start and end dates of this request body'}), 400
-    # get app db connection string from config file
+    weekWindows = getWeekWindows(startDate, endDate)
+    if len(weekWindows) == 0:
+        return jsonify({'message': 'no weeks between start and end dates of this request body, start date should not be after end date'}), 400
+    # fetch all sections from db even if they are cached, if requested
+    refreshCache: bool = bool(reqData.get('refreshCache', False))
+    # fetch only these sections from db and reuse the last saved copy of other sections, if requested
+    refreshSections: Optional[List[str]] = reqData.get('refreshSections', None)
+    if not(refreshSections is None) and not(isinstance(refreshSections, list)):
+        return jsonify({'message': 'refreshSections of this request body should be a list of section names'}), 400
+    # render again from the context snapshots saved in dump folder without using db, if requested
+    fromSnapshot: bool = bool(reqData.get('fromSnapshot', False))
+    # get app config from config file
     appConfig: IAppConfig = getConfig()
-    appDbConStr: str = appConfig['appDbConStr']
     dumpFolder: str = appConfig['dumpFolder']
+    fetchWorkers: int = int(getConfigVal(appConfig, 'fetchWorkers', 1))
+    renderWorkers: int = int(getConfigVal(appConfig, 'renderWorkers', 2))
+    prefetchWeeks: int = int(getConfigVal(appConfig, 'prefetchWeeks', 2))
+    fetchBatchWeeks: int = int(getConfigVal(appConfig, 'fetchBatchWeeks', 13))
+    outageCursorOpts: ICursorOpts = {'arraySize': int(getConfigVal(appConfig, 'outageFetchArraySize', 1000)),
+                                     'prefetchRows': int(getConfigVal(appConfig, 'outageFetchPrefetchRows', 1000))}
+    # sections not fetched within these durations are left out of the report as data unavailable
+    sectionTimeoutSecs: Optional[float] = getConfigVal(appConfig, 'sectionTimeoutSecs')
+    deadlineSecs: Optional[float] = getConfigVal(appConfig, 'generationDeadlineSecs')
     # generate report word file
     tmplPath: str = "assets/weekly_report_template.docx"
     # create weekly report
-    wklyRprtGntr = WeeklyReportGenerator(appDbConStr)
-    # use while loop to create multiple reports at once
-    currDt: dt.datetime = startDate
-    while currDt <= endDate:
-        currStartDt = getMondayBeforeDt(currDt)
-        currEndDt = getSundayAfterDt(currStartDt)
-        isWeeklyReportGenerationSuccess: bool = wklyRprtGntr.generateWeeklyReport(
-            currStartDt, currEndDt, tmplPath, dumpFolder)
-        currDt = currEndDt + dt.timedelta(days=1)
+    wklyRprtGntr = WeeklyReportGenerator(
+        appDbPool, fetchWorkers, sectionCache, outageCursorOpts,
+        sectionTimeoutSecs=None if sectionTimeoutSecs is None else float(sectionTimeoutSecs),
+        deadlineSecs=None if deadlineSecs is None else float(deadlineSecs),
+        daySliceStore=daySliceStore, artifactStore=artifactStore)
+    if not(refreshSections is None):
+        unknownSections = [s for s in refreshSections if not(s in wklyRprtGntr.getReportSectionNames())]
+        if len(unknownSections) > 0:
+            return jsonify({'message': 'unknown report sections to refresh: {0}'.format(', '.join(map(str, unknownSections))),
+                            'reportSections': wklyRprtGntr.getReportSectionNames()}), 400
+        if sectionCache is None:
+            return jsonify({'message': 'refreshSections needs the section cache, since other sections are reused from section cache, but section cache is not configured'}), 400
+    # fetch upcoming weeks while earlier weeks are rendered
+    batchExecutor = ReportBatchExecutor(
+        wklyRprtGntr, renderWorkers, prefetchWeeks, fetchBatchWeeks)
+    if bool(reqData.get('runAsJob', False)):
+        # generate the reports in background and return the job id immediately
+        def generateWeeks(jobWeekWindows, onWeekDone):
+            batchExecutor.run(jobWeekWindows, tmplPath,
+                              dumpFolder, refreshCache, onWeekDone, refreshSections, fromSnapshot)
+        jobId = reportJobsManager.submitJob(weekWindows, generateWeeks)
+        if jobId is None:
+            return jsonify({'message': 'weekly report job queue is full, please try again later'}), 503
+        return jsonify({'message': 'weekly report job submitted', 'jobId': jobId,
+                        'statusUrl': url_for('get_weekly_report_job', jobId=jobId)}), 202
+    # create multiple reports at once
+    weekResults = batchExecutor.run(
+        weekWindows, tmplPath, dumpFolder, refreshCache, refreshSections=refreshSections, fromSnapshot=fromSnapshot)
+    isWeeklyReportGenerationSuccess: bool = all(weekResults)
     if isWeeklyReportGenerationSuccess:
         return jsonify({'message': 'weekly report generation successful!!!', 'startDate': startDate, 'endDate': endDate})
     else:
         return jsonify({'message': 'weekly report generation was not success'}), 500
 
 
+@app.route('/weekly_report/<jobId>')
+def get_weekly_report_job(jobId: str):
+    # get the status and per week progress of a weekly report job
+    job = reportJobsManager.getJob(jobId)
+    if job is None:
+        return jsonify({'message': 'weekly report job not found'}), 404
+    return jsonify(job)
+
+
+@app.route('/db_pool_stats')
+def get_db_pool_stats():
+    # get the app db connection pool size and session wait statistics
+    return jsonify(appDbPool.getStats())
+
+
+@app.route('/section_cache_stats')
+def get_section_cache_stats():
+    # get the section cache hit, miss counters and size
+    if sectionCache is None:
+        return jsonify({'message': 'section cache is not configured'}), 404
+    return jsonify(sectionCache.getStats())
+
+
+@app.route('/day_slices', methods=['POST'])
+def accumulate_day_slices():
+    # fetch and store the day slices of daily sections of the running week till the requested day, yesterday by default
+    if daySliceStore is None:
+        return jsonify({'message': 'day slice store is not configured'}), 404
+    reqData = request.get_json(silent=True) or {}
+    try:
+        uptoDay = dt.datetime.strptime(reqData['date'], '%Y-%m-%d') if 'date' in reqData \
+            else dt.datetime.now() - dt.timedelta(days=1)
+    except Exception as ex:
+        return jsonify({'message': 'Unable to parse date of this request body'}), 400
+    wklyRprtGntr = WeeklyReportGenerator(appDbPool, daySliceStore=daySliceStore)
+    numDataDays = wklyRprtGntr.accumulateDaySlices(uptoDay)
+    return jsonify({'message': 'day slices accumulation complete', 'numDataDays': numDataDays})
+
+
+@app.route('/reports')
+def get_reports():
+    # get the latest stored report of each week
+    if artifactStore is None:
+        return jsonify({'message': 'report artifact store is not configured'}), 404
+    return jsonify(artifactStore.listReportArtifacts())
+
+
+@app.route('/reports/<reportFilename>')
+def download_report(reportFilename: str):
+    # download a stored report, clients that already have the same report get 304 via If-None-Match
+    if artifactStore is None:
+        return jsonify({'message': 'report artifact store is not configured'}), 404
+    artifactInfo = artifactStore.getReportArtifact(reportFilename)
+    if artifactInfo is None:
+        return jsonify({'message': 'report not found'}), 404
+    if request.if_none_match.contains(artifactInfo['artifactKey']):
+        notModifiedResp = Response(status=304)
+        notModifiedResp.set_etag(artifactInfo['artifactKey'])
+        return notModifiedResp
+    try:
+        reportFile = open(artifactStore.getArtifactPath(artifactInfo['artifactKey']), 'rb')
+    except FileNotFoundError:
+        return jsonify({'message': 'report not found'}), 404
+    reportResp = Response(wrap_file(request.environ, reportFile), direct_passthrough=True,
+                          mimetype='application/vnd.openxmlformats-officedocument.wordprocessingml.document')
+    reportResp.content_length = os.fstat(reportFile.fileno()).st_size
+    reportResp.headers['Content-Disposition'] = 'attachment; filename="{0}"'.format(reportFilename)
+    reportResp.set_etag(artifactInfo['artifactKey'])
+    return reportResp
+
+
+@app.route('/metrics')
+def get_metrics():
+    # get section fetch, render metrics and in-flight generations in prometheus text format
+    return Response(getAppMetrics().toPromText(), mimetype='text/plain; version=0.0.4')
+
+
 if __name__ == '__main__':
+    # the service is set up only when this file is run, since render worker processes
+    # spawned on windows import this file again as __mp_main__
+
+    # get application config
+    appConfig: IAppConfig = getConfig()
+
+    # initialize logger
+    appLogger = initAppLogger(appConfig)
+
+    # create the app db connection pool once for the service
+    appDbPool = initAppDbPool(appConfig)
+
+    # create the on-disk section cache once for the service
+    sectionCache = initSectionCache(appConfig)
+    # create the on-disk store of day slices of daily sections
+    daySliceStore = initDaySliceStore(appConfig)
+    # create the content addressed store of generated reports
+    artifactStore = initReportArtifactStore(appConfig)
+
+    # create the background report jobs manager once for the service
+    reportJobsManager = initReportJobsManager(appConfig)
+
+    # Set the secret key to some random bytes
+    app.secret_key = appConfig['flaskSecret']
     app.run(host="0.0.0.0", port=int(appConfig['flaskPort']), debug=True)
     appLogger.info("started weekly report service")
@@ -0,0 +1,167 @@
+import math
+import threading
+from typing import Dict, List, Sequence, Tuple
+
+# upper bounds in seconds of the duration histogram buckets
+defaultSecsBuckets = [0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300]
+
+
+def formatLabels(labelNames: Sequence[str], labelVals: Sequence[str]) -> str:
+    """format labels like {section="genOtgs",le="0.5"} as per prometheus text exposition format
+    """
+    if len(labelNames) == 0:
+        return ''
+    labelStrs = ['{0}="{1}"'.format(n, str(v).replace('\\', '\\\\').replace('"', '\\"'))
+                 for n, v in zip(labelNames, labelVals)]
+    return '{' + ','.join(labelStrs) + '}'
+
+
+def formatVal(val: float) -> str:
+    if math.isinf(val):
+        return '+Inf'
+    return repr(float(val))
+
+
+class MetricCounter():
+    """thread safe counter with optional labels, exported as prometheus counter
+    """
+    metricType: str = 'counter'
+
+    def __init__(self, name: str, helpText: str, labelNames: Sequence[str] = ()):
+        """constructor method
+
+        Args:
+            name (str): metric name
+            helpText (str): description of the metric
+            labelNames (Sequence[str], optional): names of the metric labels. Defaults to ().
+        """
+        self.name = name
+        self.helpText = helpText
+        self.labelNames = tuple(labelNames)
+        self.vals: Dict[Tuple[str, ...], float] = {}
+        self.lock = threading.Lock()
+
+    def inc(self, *labelVals: str, amount: float = 1) -> None:
+        with self.lock:
+            self.vals[labelVals] = self.vals.get(labelVals, 0) + amount
+
+    def getValue(self, *labelVals: str) -> float:
+        with self.lock:
+            return self.vals.get(labelVals, 0)
+
+    def toPromLines(self) -> List[str]:
+        lines = ['# HELP {0} {1}'.format(self.name, self.helpText),
+                 '# TYPE {0} {1}'.format(self.name, self.metricType)]
+        with self.lock:
+            if len(self.labelNames) == 0 and len(self.vals) == 0:
+                lines.append('{0} 0.0'.format(self.name))
+            for labelVals, val in sorted(self.vals.items()):
+                lines.append('{0}{1} {2}'.format(
+                    self.name, formatLabels(self.labelNames, labelVals), formatVal(val)))
+        return lines
+
+
+class MetricGauge(MetricCounter):
+    """thread safe gauge with optional labels, exported as prometheus gauge
+    """
+    metricType: str = 'gauge'
+
+    def dec(self, *labelVals: str, amount: float = 1) -> None:
+        self.inc(*labelVals, amount=-amount)
+
+
+class MetricHistogram():
+    """thread safe histogram with optional labels, exported as prometheus histogram
+    """
+
+    def __init__(self, name: str, helpText: str, labelNames: Sequence[str] = (), buckets: Sequence[float] = defaultSecsBuckets):
+        """constructor method
+
+        Args:
+            name (str): metric name
+            helpText (str): description of the metric
+            labelNames (Sequence[str], optional): names of the metric labels. Defaults to ().
+            buckets (Sequence[float], optional): upper bounds of the buckets. Defaults to defaultSecsBuckets.
+        """
+        self.name = name
+        self.helpText = helpText
+        self.labelNames = tuple(labelNames)
+        self.buckets = sorted(buckets) + [math.inf]
+        # bucket counts, sum and count of observations for each label values
+        self.vals: Dict[Tuple[str, ...], Tuple[List[int], float, int]] = {}
+        self.lock = threading.Lock()
+
+    def observe(self, val: float, *labelVals: str) -> None:
+        with self.lock:
+            bucketCounts, valsSum, valsCount = self.vals.get(
+                labelVals, ([0]*len(self.buckets), 0, 0))
+            for bucketInd, upperBound in enumerate(self.buckets):
+                if val <= upperBound:
+                    bucketCounts[bucketInd] += 1
+            self.vals[labelVals] = (bucketCounts, valsSum + val, valsCount + 1)
+
+    def getCount(self, *labelVals: str) -> int:
+        with self.lock:
+            return self.vals.get(labelVals, ([], 0, 0))[2]
+
+    def toPromLines(self) -> List[str]:
+        lines = ['# HELP {0} {1}'.format(self.name, self.helpText),
+                 '# TYPE {0} histogram'.format(self.name)]
+        with self.lock:
+            for labelVals, (bucketCounts, valsSum, valsCount) in sorted(self.vals.items()):
+                for upperBound, bucketCount in zip(self.buckets, bucketCounts):
+                    lines.append('{0}_bucket{1} {2}'.format(self.name, formatLabels(
+                        self.labelNames + ('le',), labelVals + (formatVal(upperBound),)), bucketCount))
+                labelsStr = formatLabels(self.labelNames, labelVals)
+                lines.append('{0}_sum{1} {2}'.format(self.name, labelsStr, formatVal(valsSum)))
+                lines.append('{0}_count{1} {2}'.format(self.name, labelsStr, valsCount))
+        return lines
+
+
+class AppMetrics():
+    """registry of the report generation metrics of the service
+    """
+    __instance = None
+
+    def __init__(self):
+        self.sectionFetchSecs = MetricHistogram(
+            'mis_report_section_fetch_seconds', 'time taken for fetching a report section from db', ['section'])
+        self.sectionRows = MetricCounter(
+            'mis_report_section_rows_total', 'number of table rows fetched for a report section', ['section'])
+        self.sectionBytes = MetricCounter(
+            'mis_report_section_bytes_total', 'pickled size of the fetched report section payloads', ['section'])
+        self.sectionCacheHits = MetricCounter(
+            'mis_report_section_cache_hits_total', 'number of report sections served from section cache', ['section'])
+        self.sectionFailures = MetricCounter(
+            'mis_report_section_failures_total', 'number of failed report section fetches', ['section'])
+        self.renderSecs = MetricHistogram(
+            'mis_report_render_seconds', 'time taken for rendering and saving a weekly report file')
+        self.renderFailures = MetricCounter(
+            'mis_report_render_failures_total', 'number of failed weekly report renders')
+        self.renderSkips = MetricCounter(
+            'mis_report_render_skips_total', 'number of weekly report renders skipped since identical report is in artifact store')
+        self.generationsInFlight = MetricGauge(
+            'mis_report_generations_in_flight', 'number of weekly report generations in progress')
+
+    def toPromText(self) -> str:
+        """get all the metrics in prometheus text exposition format
+
+        Returns:
+            str: metrics text
+        """
+        lines: List[str] = []
+        for metric in [self.sectionFetchSecs, self.sectionRows, self.sectionBytes, self.sectionCacheHits, self.sectionFailures,
+                       self.renderSecs, self.renderFailures, self.renderSkips, self.generationsInFlight]:
+            lines.extend(metric.toPromLines())
+        return '\n'.join(lines) + '\n'
+
+    @staticmethod
+    def getInstance():
+        """ Static access method. """
+        if AppMetrics.__instance == None:
+            AppMetrics.__instance = AppMetrics()
+        return AppMetrics.__instance
+
+
+def getAppMetrics() -> AppMetrics:
+    return AppMetrics.getInstance()
@@ -0,0 +1,182 @@
+import os
+import gzip
+import json
+import math
+import datetime as dt
+from typing import Any
+from src.typeDefs.reportContext import IReportCxt
+
+# increment this whenever the snapshot encoding changes, snapshots of other versions are not loaded
+contextSnapshotVersion = 1
+# file extension of the context snapshots written next to the generated reports
+snapshotFileExt = '.ctx.json.gz'
+# key of the type tag in encoded values that are not plain json values
+typeTagKey = '__t'
+
+
+def encodeSnapshotVal(val: Any) -> Any:
+    """encode a report context value into json compatible value.
+    datetimes, tuples, numpy scalars and pandas timestamps are encoded as tagged objects, so that they are decoded back exactly
+
+    Args:
+        val (Any): report context value
+
+    Returns:
+        Any: json compatible value
+    """
+    if val is None or type(val) in (str, bool, int):
+        return val
+    if type(val) == float:
+        # json has no representation for nan and infinity
+        return val if math.isfinite(val) else {typeTagKey: 'float', 'v': repr(val)}
+    if isinstance(val, dict):
+        if all([type(k) == str for k in val.keys()]) and not(typeTagKey in val):
+            return {k: encodeSnapshotVal(v) for k, v in val.items()}
+        return {typeTagKey: 'dict', 'v': [[encodeSnapshotVal(k), encodeSnapshotVal(v)] for k, v in val.items()]}
+    if type(val) == list:
+        return [encodeSnapshotVal(v) for v in val]
+    if type(val) == tuple:
+        return {typeTagKey: 'tuple', 'v': [encodeSnapshotVal(v) for v in val]}
+    if type(val) == dt.datetime:
+        return {typeTagKey: 'datetime', 'v': val.isoformat()}
+    if type(val) == dt.date:
+        return {typeTagKey: 'date', 'v': val.isoformat()}
+    valModule = type(val).__module__.split('.')[0]
+    if valModule == 'numpy' and hasattr(val, 'dtype') and val.shape == ():
+        # numpy scalars are stored with their dtype, float values are stored as repr for exact round trip
+        if val.dtype.kind in ('M', 'm'):
+            return {typeTagKey: 'np', 'dtype': str(val.dtype), 'v': str(val.astype('int64').item())}
+        if val.dtype.kind == 'U':
+            return {typeTagKey: 'np', 'dtype': str(val.dtype), 'v': val.item()}
+        if val.dtype.kind in ('b', 'i', 'u', 'f', 'c'):
+            return {typeTagKey: 'np', 'dtype': str(val.dtype), 'v': repr(val.item())}
+    if valModule == 'pandas' and type(val).__name__ == 'Timestamp':
+        return {typeTagKey: 'pdTimestamp', 'v': val.isoformat()}
+    if valModule == 'pandas' and type(val).__name__ == 'Timedelta':
+        return {typeTagKey: 'pdTimedelta', 'v': val.value}
+    raise TypeError("report context value of type {0} can not be stored in snapshot".format(type(val).__name__))
+
+
+def decodeSnapshotVal(val: Any) -> Any:
+    """decode a value encoded by encodeSnapshotVal
+
+    Args:
+        val (Any): json value
+
+    Returns:
+        Any: report context value
+    """
+    if isinstance(val, list):
+        return [decodeSnapshotVal(v) for v in val]
+    if not(isinstance(val, dict)):
+        return val
+    if not(typeTagKey in val):
+        return {k: decodeSnapshotVal(v) for k, v in val.items()}
+    valType = val[typeTagKey]
+    if valType == 'float':
+        return float(val['v'])
+    if valType == 'dict':
+        return {decodeSnapshotVal(k): decodeSnapshotVal(v) for k, v in val['v']}
+    if valType == 'tuple':
+        return tuple([decodeSnapshotVal(v) for v in val['v']])
+    if valType == 'datetime':
+        return dt.datetime.fromisoformat(val['v'])
+    if valType == 'date':
+        return dt.date.fromisoformat(val['v'])
+    if valType == 'np':
+        import numpy as np
+        valDtype = np.dtype(val['dtype'])
+        if valDtype.kind in ('M', 'm'):
+            return np.array(int(val['v']), dtype='int64').astype(valDtype)[()]
+        if valDtype.kind == 'U':
+            return np.str_(val['v'])
+        if valDtype.kind == 'b':
+            return np.bool_(val['v'] == 'True')
+        if valDtype.kind == 'c':
+            return valDtype.type(complex(val['v']))
+        if valDtype.kind in ('i', 'u'):
+            return valDtype.type(int(val['v']))
+        return valDtype.type(float(val['v']))
+    if valType == 'pdTimestamp':
+        import pandas as pd
+        return pd.Timestamp(val['v'])
+    if valType == 'pdTimedelta':
+        import pandas as pd
+        return pd.Timedelta(int(val['v']), unit='ns')
+    raise ValueError("unknown type {0} in context snapshot".format(valType))
+
+
+def encodeContextJson(reportContext: IReportCxt) -> bytes:
+    """serialize a report context into canonical versioned json.
+    Same report context always gives the same bytes, hence it can be hashed for identifying the context
+
+    Args:
+        reportContext (IReportCxt): report context object
+
+    Returns:
+        bytes: utf-8 encoded json
+    """
+    snapshotStr = json.dumps({'version': contextSnapshotVersion, 'context': encodeSnapshotVal(reportContext)},
+                             ensure_ascii=False, separators=(',', ':'), allow_nan=False)
+    return snapshotStr.encode('utf-8')
+
+
+def dumpContextSnapshot(reportContext: IReportCxt) -> bytes:
+    """serialize a report context into versioned and gzip compressed json snapshot.
+    Same report context always gives the same snapshot bytes
+
+    Args:
+        reportContext (IReportCxt): report context object
+
+    Returns:
+        bytes: compressed snapshot
+    """
+    return gzip.compress(encodeContextJson(reportContext), mtime=0)
+
+
+def loadContextSnapshotBytes(snapshotBytes: bytes) -> IReportCxt:
+    """deserialize a report context snapshot created by dumpContextSnapshot
+
+    Args:
+        snapshotBytes (bytes): compressed snapshot
+
+    Returns:
+        IReportCxt: report context object
+    """
+    snapshotObj = json.loads(gzip.decompress(snapshotBytes).decode('utf-8'))
+    if not(snapshotObj.get('version', None) == contextSnapshotVersion):
+        raise ValueError("context snapshot version {0} is not supported, supported version is {1}".format(
+            snapshotObj.get('version', None), contextSnapshotVersion))
+    return decodeSnapshotVal(snapshotObj['context'])
+
+
+def saveContextSnapshot(reportContext: IReportCxt, snapshotPath: str) -> int:
+    """save the snapshot of a report context to a file
+
+    Args:
+        reportContext (IReportCxt): report context object
+        snapshotPath (str): snapshot file path
+
+    Returns:
+        int: size of snapshot file in bytes
+    """
+    snapshotBytes = dumpContextSnapshot(reportContext)
+    # write to a temporary file first, so that readers never see a partial snapshot
+    tmpPath = snapshotPath + '.tmp'
+    with open(tmpPath, 'wb') as f:
+        f.write(snapshotBytes)
+    os.replace(tmpPath, snapshotPath)
+    return len(snapshotBytes)
+
+
+def loadContextSnapshot(snapshotPath: str) -> IReportCxt:
+    """load a report context from a snapshot file
+
+    Args:
+        snapshotPath (str): snapshot file path
+
+    Returns:
+        IReportCxt: report context object
+    """
+    with open(snapshotPath, 'rb') as f:
+        return loadContextSnapshotBytes(f.read())
@@ -0,0 +1,110 @@
+import os
+import pickle
+import threading
+import datetime as dt
+from typing import Any, Optional
+from src.typeDefs.appConfig import IAppConfig
+from src.config.appConfig import getConfigVal
+
+# increment this whenever the columns of any daily section rows change,
+# so that day slices stored by older versions are not used
+daySliceSchemaVersion = 1
+
+
+class DaySliceStore():
+    """on-disk store of the fetched rows of daily-granular report sections, one entry per section per day.
+    Day slices are accumulated through the running week, so that the week end generation fetches only the missing days.
+    Entries of days older than the retention period are purged
+    """
+
+    def __init__(self, storeFolder: str, retentionDays: int = 35, schemaVersion: int = daySliceSchemaVersion):
+        """constructor method
+
+        Args:
+            storeFolder (str): folder in which the day slices are stored
+            retentionDays (int, optional): day slices older than these many days are purged. Defaults to 35.
+            schemaVersion (int, optional): version of day slice rows format. Defaults to daySliceSchemaVersion.
+        """
+        self.storeFolder = storeFolder
+        self.retentionDays = retentionDays
+        self.schemaVersion = schemaVersion
+        self.lock = threading.Lock()
+        os.makedirs(storeFolder, exist_ok=True)
+
+    def getEntryPath(self, sectionName: str, day: dt.datetime) -> str:
+        entryFilename = '{0}_{1}_v{2}.pkl'.format(
+            sectionName, dt.datetime.strftime(day, '%Y%m%d'), self.schemaVersion)
+        return os.path.join(self.storeFolder, entryFilename)
+
+    def isStorable(self, day: dt.datetime) -> bool:
+        """check if the day is complete, so that its derived data is final and can be stored
+
+        Args:
+            day (dt.datetime): day of the slice
+
+        Returns:
+            bool: True if the day ended before today
+        """
+        return day.date() < dt.date.today()
+
+    def get(self, sectionName: str, day: dt.datetime) -> Optional[Any]:
+        """get the stored rows of a section for a day
+
+        Args:
+            sectionName (str): name of report section
+            day (dt.datetime): day of the slice
+
+        Returns:
+            Optional[Any]: rows of the day, None if not present in store
+        """
+        entryPath = self.getEntryPath(sectionName, day)
+        with self.lock:
+            try:
+                with open(entryPath, 'rb') as f:
+                    return pickle.load(f)
+            except (OSError, EOFError, pickle.UnpicklingError):
+                return None
+
+    def put(self, sectionName: str, day: dt.datetime, daySlice: Any) -> None:
+        """store the rows of a section for a day and purge the day slices older than the retention period
+
+        Args:
+            sectionName (str): name of report section
+            day (dt.datetime): day of the slice
+            daySlice (Any): rows of the day
+        """
+        entryPath = self.getEntryPath(sectionName, day)
+        with self.lock:
+            # write to a temporary file first, so that readers never see a partial entry
+            tmpPath = entryPath + '.tmp'
+            with open(tmpPath, 'wb') as f:
+                pickle.dump(daySlice, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmpPath, entryPath)
+            self.purgeEntries()
+
+    def purgeEntries(self) -> None:
+        oldestDayStr = dt.datetime.strftime(
+            dt.datetime.now() - dt.timedelta(days=self.retentionDays), '%Y%m%d')
+        for entry in os.scandir(self.storeFolder):
+            if not(entry.is_file() and entry.name.endswith('.pkl')):
+                continue
+            # entry names are like freqProfile_20200810_v1.pkl
+            entryDayStr = entry.name.rsplit('_', 2)[-2]
+            if entryDayStr < oldestDayStr:
+                os.remove(entry.path)
+
+
+def initDaySliceStore(appConfig: IAppConfig) -> Optional[DaySliceStore]:
+    """create the day slice store as per app config, store is disabled if daySliceFolder is not configured
+
+    Args:
+        appConfig (IAppConfig): application config
+
+    Returns:
+        Optional[DaySliceStore]: day slice store, None if disabled
+    """
+    storeFolder = getConfigVal(appConfig, 'daySliceFolder')
+    if storeFolder is None:
+        return None
+    retentionDays = int(getConfigVal(appConfig, 'daySliceRetentionDays', 35))
+    return DaySliceStore(storeFolder, retentionDays)
@@ -0,0 +1,201 @@
+import os
+import json
+import shutil
+import hashlib
+import datetime as dt
+from typing import Dict, List, Optional, Tuple
+from src.typeDefs.appConfig import IAppConfig
+from src.typeDefs.reportContext import IReportCxt
+from src.typeDefs.reportArtifact import IReportArtifact
+from src.config.appConfig import getConfigVal
+from src.app.contextSnapshot import encodeContextJson
+
+# sha256 digest of each template file along with the file modified time and size at hashing
+tmplDigestCache: Dict[str, Tuple[int, int, str]] = {}
+
+
+def getTemplateDigest(tmplPath: str) -> str:
+    """get the sha256 digest of a template file, the file is hashed again only if it is modified
+
+    Args:
+        tmplPath (str): full file path of the template
+
+    Returns:
+        str: hex digest of template file
+    """
+    tmplAbsPath = os.path.abspath(tmplPath)
+    tmplStat = os.stat(tmplAbsPath)
+    cachedDigest = tmplDigestCache.get(tmplAbsPath, None)
+    if (cachedDigest is not None) and cachedDigest[0:2] == (tmplStat.st_mtime_ns, tmplStat.st_size):
+        return cachedDigest[2]
+    tmplHash = hashlib.sha256()
+    with open(tmplAbsPath, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024*1024), b''):
+            tmplHash.update(chunk)
+    tmplDigestCache[tmplAbsPath] = (tmplStat.st_mtime_ns, tmplStat.st_size, tmplHash.hexdigest())
+    return tmplHash.hexdigest()
+
+
+class ReportArtifactStore():
+    """content addressed on-disk store of generated reports with size bounded LRU eviction.
+    A report is identified by the hash of its canonical report context and template digest,
+    so identical reports are rendered only once. The latest report of each report file name is indexed for downloads.
+    Store files are written atomically, so the store can be shared by render worker processes
+    """
+
+    def __init__(self, storeFolder: str, maxSizeBytes: int):
+        """constructor method
+
+        Args:
+            storeFolder (str): folder in which the reports and the index are stored
+            maxSizeBytes (int): least recently used reports are evicted to keep total size below this
+        """
+        self.storeFolder = storeFolder
+        self.maxSizeBytes = maxSizeBytes
+        self.indexFolder = os.path.join(storeFolder, 'index')
+        os.makedirs(self.indexFolder, exist_ok=True)
+
+    def getArtifactKey(self, reportContext: IReportCxt, tmplPath: str) -> str:
+        """get the content address of the report of a context and template
+
+        Args:
+            reportContext (IReportCxt): report context object
+            tmplPath (str): full file path of the template
+
+        Returns:
+            str: hex digest that identifies the report
+        """
+        artifactHash = hashlib.sha256(getTemplateDigest(tmplPath).encode('ascii'))
+        artifactHash.update(encodeContextJson(reportContext))
+        return artifactHash.hexdigest()
+
+    def getArtifactPath(self, artifactKey: str) -> str:
+        return os.path.join(self.storeFolder, artifactKey + '.docx')
+
+    def getIndexPath(self, reportFilename: str) -> str:
+        return os.path.join(self.indexFolder, reportFilename + '.json')
+
+    def restoreArtifact(self, artifactKey: str, reportPath: str) -> bool:
+        """copy a stored report to the report path if it is present in store
+
+        Args:
+            artifactKey (str): content address of report
+            reportPath (str): file path at which report is required
+
+        Returns:
+            bool: True if report is present in store and copied
+        """
+        artifactPath = self.getArtifactPath(artifactKey)
+        try:
+            # mark the artifact as recently used
+            os.utime(artifactPath)
+            copyAtomic(artifactPath, reportPath)
+        except FileNotFoundError:
+            return False
+        return True
+
+    def putArtifact(self, artifactKey: str, reportPath: str, startDt: dt.datetime, endDt: dt.datetime) -> None:
+        """store a generated report, index it as the latest report of its file name
+        and evict least recently used reports if store size is exceeded
+
+        Args:
+            artifactKey (str): content address of report
+            reportPath (str): file path of generated report
+            startDt (dt.datetime): start date of report
+            endDt (dt.datetime): end date of report
+        """
+        copyAtomic(reportPath, self.getArtifactPath(artifactKey))
+        self.indexArtifact(artifactKey, os.path.basename(reportPath), startDt, endDt)
+        self.evictEntries()
+
+    def indexArtifact(self, artifactKey: str, reportFilename: str, startDt: dt.datetime, endDt: dt.datetime) -> None:
+        """index a stored report as the latest report of its file name
+
+        Args:
+            artifactKey (str): content address of report
+            reportFilename (str): report file name like Weekly_no_20_10-08-2020_to_16-08-2020.docx
+            startDt (dt.datetime): start date of report
+            endDt (dt.datetime): end date of report
+        """
+        artifactInfo: IReportArtifact = {
+            'reportFilename': reportFilename,
+            'artifactKey': artifactKey,
+            'startDate': dt.datetime.strftime(startDt, '%Y-%m-%d'),
+            'endDate': dt.datetime.strftime(endDt, '%Y-%m-%d'),
+            'sizeBytes': os.path.getsize(self.getArtifactPath(artifactKey)),
+            'createdAt': dt.datetime.now().isoformat(timespec='seconds')
+        }
+        indexPath = self.getIndexPath(reportFilename)
+        tmpPath = '{0}.{1}.tmp'.format(indexPath, os.getpid())
+        with open(tmpPath, 'w') as f:
+            json.dump(artifactInfo, f)
+        os.replace(tmpPath, indexPath)
+
+    def getReportArtifact(self, reportFilename: str) -> Optional[IReportArtifact]:
+        """get the latest stored report of a report file name
+
+        Args:
+            reportFilename (str): report file name like Weekly_no_20_10-08-2020_to_16-08-2020.docx
+
+        Returns:
+            Optional[IReportArtifact]: stored report info, None if not present in store
+        """
+        # report file names are used as index file names, hence path separators are not allowed
+        if not(os.path.basename(reportFilename) == reportFilename):
+            return None
+        try:
+            with open(self.getIndexPath(reportFilename)) as f:
+                artifactInfo: IReportArtifact = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not(os.path.isfile(self.getArtifactPath(artifactInfo['artifactKey']))):
+            return None
+        return artifactInfo
+
+    def listReportArtifacts(self) -> List[IReportArtifact]:
+        """get the latest stored report of all the report file names
+
+        Returns:
+            List[IReportArtifact]: stored reports info ordered by report start date
+        """
+        artifacts = [self.getReportArtifact(e.name[:-len('.json')]) for e in os.scandir(self.indexFolder)
+                     if e.is_file() and e.name.endswith('.json')]
+        return sorted([a for a in artifacts if a is not None], key=lambda a: (a['startDate'], a['reportFilename']))
+
+    def evictEntries(self) -> None:
+        entries = [e for e in os.scandir(self.storeFolder)
+                   if e.is_file() and e.name.endswith('.docx')]
+        totalSize = sum([e.stat().st_size for e in entries])
+        for entry in sorted(entries, key=lambda e: e.stat().st_mtime):
+            if totalSize <= self.maxSizeBytes:
+                break
+            totalSize -= entry.stat().st_size
+            try:
+                os.remove(entry.path)
+            except FileNotFoundError:
+                # already evicted by another render worker
+                pass
+
+
+def copyAtomic(srcPath: str, dstPath: str) -> None:
+    """copy a file through a temporary file, so that readers never see a partial file
+    """
+    tmpPath = '{0}.{1}.tmp'.format(dstPath, os.getpid())
+    shutil.copyfile(srcPath, tmpPath)
+    os.replace(tmpPath, dstPath)
+
+
+def initReportArtifactStore(appConfig: IAppConfig) -> Optional[ReportArtifactStore]:
+    """create the report artifact store as per app config, store is disabled if artifactStoreFolder is not configured
+
+    Args:
+        appConfig (IAppConfig): application config
+
+    Returns:
+        Optional[ReportArtifactStore]: report artifact store, None if disabled
+    """
+    storeFolder = getConfigVal(appConfig, 'artifactStoreFolder')
+    if storeFolder is None:
+        return None
+    maxSizeMb = float(getConfigVal(appConfig, 'artifactStoreMaxMb', 2048))
+    return ReportArtifactStore(storeFolder, int(maxSizeMb*1024*1024))
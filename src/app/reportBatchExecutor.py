@@ -0,0 +1,165 @@
+import os
+import queue
+import threading
+import datetime as dt
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Callable, Deque, List, Optional, Tuple
+from src.app.weeklyReportGenerator import WeeklyReportGenerator, renderReport, renderReportWithStats, recordRenderStats, getReportFilename, getSnapshotFilename
+from src.app.contextSnapshot import loadContextSnapshot
+from src.app.appMetrics import getAppMetrics
+from src.typeDefs.reportContext import IReportCxt
+from src.appLogger import getAppLogger
+
+IWeekDoneCallback = Callable[[int, Optional[str]], None]
+
+
+class ReportBatchExecutor():
+    """generates the reports of many weeks as a pipeline.
+    A fetch thread fetches the contexts of upcoming weeks into a bounded queue
+    while earlier weeks are rendered in a pool of render worker processes.
+    Week contexts are fetched in batches of consecutive weeks with one query per section for each batch.
+    So up to fetchBatchWeeks week contexts are held in memory while a batch is queued,
+    prefetchWeeks only bounds how many of them wait in the queue ahead of the renders
+    """
+
+    def __init__(self, reportGenerator: WeeklyReportGenerator, renderWorkers: int = 2, prefetchWeeks: int = 2, fetchBatchWeeks: int = 13):
+        """constructor method
+
+        Args:
+            reportGenerator (WeeklyReportGenerator): report generator used for fetching the week contexts
+            renderWorkers (int, optional): number of render worker processes, 0 renders in the calling process. Defaults to 2.
+            prefetchWeeks (int, optional): max number of fetched week contexts waiting for render in the queue. Defaults to 2.
+            fetchBatchWeeks (int, optional): max number of weeks fetched together,
+            this sets the bound of week contexts held in memory by the fetch thread. Defaults to 13.
+        """
+        self.reportGenerator = reportGenerator
+        self.renderWorkers = renderWorkers
+        self.prefetchWeeks = max(prefetchWeeks, 1)
+        self.fetchBatchWeeks = max(fetchBatchWeeks, 1)
+        self.appLogger = getAppLogger()
+
+    def fetchContexts(self, weekWindows: List[Tuple[dt.datetime, dt.datetime]], tmplPath: str, refreshCache: bool, ctxQueue: queue.Queue, stopEvent: threading.Event,
+                      refreshSections: Optional[List[str]] = None) -> None:
+        for batchStartInd in range(0, len(weekWindows), self.fetchBatchWeeks):
+            if stopEvent.is_set():
+                break
+            batchWindows = weekWindows[batchStartInd:batchStartInd+self.fetchBatchWeeks]
+            try:
+                reportCtxts = self.reportGenerator.getReportContextObjs(
+                    batchWindows, refreshCache, tmplPath, refreshSections)
+            except Exception as err:
+                self.appLogger.error("error while fetching weekly report contexts",
+                                     exc_info=err, extra={"startDate": dt.datetime.strftime(batchWindows[0][0], '%Y-%m-%d'),
+                                                          "endDate": dt.datetime.strftime(batchWindows[-1][1], '%Y-%m-%d')})
+                reportCtxts = [None]*len(batchWindows)
+            for weekOffset, reportCtxt in enumerate(reportCtxts):
+                # blocks when the renders lag behind, so that at most one fetched batch is held in memory
+                ctxQueue.put((batchStartInd + weekOffset, reportCtxt))
+        ctxQueue.put(None)
+
+    def loadSnapshotContexts(self, weekWindows: List[Tuple[dt.datetime, dt.datetime]], snapshotFolder: str, ctxQueue: queue.Queue, stopEvent: threading.Event) -> None:
+        for weekInd, (startDt, endDt) in enumerate(weekWindows):
+            if stopEvent.is_set():
+                break
+            snapshotPath = os.path.join(snapshotFolder, getSnapshotFilename(startDt, endDt))
+            try:
+                reportCtxt = loadContextSnapshot(snapshotPath)
+            except Exception as err:
+                self.appLogger.error("error while loading weekly report context snapshot",
+                                     exc_info=err, extra={"startDate": dt.datetime.strftime(startDt, '%Y-%m-%d'),
+                                                          "endDate": dt.datetime.strftime(endDt, '%Y-%m-%d'),
+                                                          "snapshotPath": snapshotPath})
+                reportCtxt = None
+            ctxQueue.put((weekInd, reportCtxt))
+        ctxQueue.put(None)
+
+    def run(self, weekWindows: List[Tuple[dt.datetime, dt.datetime]], tmplPath: str, dumpFolder: str, refreshCache: bool = False, onWeekDone: Optional[IWeekDoneCallback] = None,
+            refreshSections: Optional[List[str]] = None, fromSnapshot: bool = False) -> List[bool]:
+        """generate the reports of all the weeks.
+        In snapshot mode, week contexts are loaded from the context snapshots saved in dump folder
+        instead of fetching them from db, and the snapshots are not saved again
+
+        Args:
+            weekWindows (List[Tuple[dt.datetime, dt.datetime]]): (start date, end date) of each week
+            tmplPath (str): full file path of the template file
+            dumpFolder (str): folder path where the generated reports are to be dumped
+            refreshCache (bool, optional): fetch all sections from db even if they are present in section cache. Defaults to False.
+            onWeekDone (Optional[IWeekDoneCallback], optional): called with week index and output file path
+            (None if not success) as each week finishes. Defaults to None.
+            refreshSections (Optional[List[str]], optional): names of the only sections to be fetched from db,
+            other sections are taken from their last saved copy in section cache. Defaults to None.
+            fromSnapshot (bool, optional): render the weeks from their saved context snapshots without db. Defaults to False.
+
+        Returns:
+            List[bool]: generation success flag of each week
+        """
+        results: List[bool] = [False]*len(weekWindows)
+
+        def finishWeek(weekInd: int, isSuccess: bool) -> None:
+            results[weekInd] = isSuccess
+            if not(onWeekDone is None):
+                startDt, endDt = weekWindows[weekInd]
+                onWeekDone(weekInd, os.path.join(dumpFolder, getReportFilename(
+                    startDt, endDt)) if isSuccess else None)
+
+        ctxQueue: queue.Queue = queue.Queue(maxsize=self.prefetchWeeks)
+        stopEvent = threading.Event()
+        if fromSnapshot:
+            fetchThread = threading.Thread(target=self.loadSnapshotContexts, args=(
+                weekWindows, dumpFolder, ctxQueue, stopEvent), daemon=True)
+        else:
+            fetchThread = threading.Thread(target=self.fetchContexts, args=(
+                weekWindows, tmplPath, refreshCache, ctxQueue, stopEvent, refreshSections), daemon=True)
+        saveSnapshot = not(fromSnapshot)
+        artifactStore = self.reportGenerator.artifactStore
+        renderPool = ProcessPoolExecutor(
+            max_workers=self.renderWorkers) if self.renderWorkers > 0 else None
+        pendingRenders: Deque[Tuple[int, IReportCxt, Future]] = deque()
+
+        def finishOldestRender() -> None:
+            weekInd, reportCtxt, renderFut = pendingRenders.popleft()
+            try:
+                renderStats = renderFut.result()
+            except Exception as err:
+                self.appLogger.error("error in report render worker", exc_info=err)
+                appMetrics.renderFailures.inc()
+                finishWeek(weekInd, False)
+                return
+            # render stats of worker processes are recorded in this process for exporting them
+            recordRenderStats(reportCtxt, renderStats)
+            finishWeek(weekInd, renderStats['isSuccess'])
+
+        appMetrics = getAppMetrics()
+        appMetrics.generationsInFlight.inc()
+        fetchThread.start()
+        try:
+            while True:
+                item = ctxQueue.get()
+                if item is None:
+                    break
+                weekInd, reportCtxt = item
+                if reportCtxt is None:
+                    finishWeek(weekInd, False)
+                elif renderPool is None:
+                    finishWeek(weekInd, renderReport(reportCtxt, tmplPath, dumpFolder, saveSnapshot, artifactStore))
+                else:
+                    # keep at most one render per worker in flight
+                    while len(pendingRenders) >= self.renderWorkers:
+                        finishOldestRender()
+                    pendingRenders.append((weekInd, reportCtxt, renderPool.submit(
+                        renderReportWithStats, reportCtxt, tmplPath, dumpFolder, saveSnapshot, artifactStore)))
+            while len(pendingRenders) > 0:
+                finishOldestRender()
+        finally:
+            stopEvent.set()
+            # unblock the fetch thread if it is waiting on a full queue
+            while fetchThread.is_alive():
+                try:
+                    ctxQueue.get(timeout=0.1)
+                except queue.Empty:
+                    pass
+            if not(renderPool is None):
+                renderPool.shutdown()
+            appMetrics.generationsInFlight.dec()
+        return results
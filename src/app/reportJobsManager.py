@@ -0,0 +1,146 @@
+import copy
+import uuid
+import threading
+import datetime as dt
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple
+from src.typeDefs.appConfig import IAppConfig
+from src.typeDefs.reportJob import IReportJob
+from src.config.appConfig import getConfigVal
+from src.appLogger import getAppLogger
+
+# job status values
+jobStatusQueued = 'queued'
+jobStatusRunning = 'running'
+jobStatusDone = 'done'
+jobStatusFailed = 'failed'
+
+# generates the reports of the weeks of a job, reports each finished week with its
+# week index and output file path (None if not success) through the callback
+IGenerateWeeks = Callable[[List[Tuple[dt.datetime, dt.datetime]],
+                           Callable[[int, Optional[str]], None]], None]
+
+
+class ReportJobsManager():
+    """runs multi week report generation jobs on a bounded background worker pool
+    and keeps their per week progress till the job expires
+    """
+
+    def __init__(self, maxWorkers: int = 2, maxPendingJobs: int = 20, jobTtlSecs: int = 86400):
+        """constructor method
+
+        Args:
+            maxWorkers (int, optional): number of jobs that run concurrently. Defaults to 2.
+            maxPendingJobs (int, optional): max number of queued and running jobs, new jobs are rejected beyond this. Defaults to 20.
+            jobTtlSecs (int, optional): finished jobs are forgotten after this duration. Defaults to 86400.
+        """
+        self.executor = ThreadPoolExecutor(max_workers=maxWorkers)
+        self.maxPendingJobs = maxPendingJobs
+        self.jobTtl = dt.timedelta(seconds=jobTtlSecs)
+        self.jobs: Dict[str, IReportJob] = {}
+        self.jobFinishTimes: Dict[str, dt.datetime] = {}
+        self.lock = threading.Lock()
+        self.appLogger = getAppLogger()
+
+    def submitJob(self, weekWindows: List[Tuple[dt.datetime, dt.datetime]], generateWeeks: IGenerateWeeks) -> Optional[str]:
+        """enqueue a report generation job
+
+        Args:
+            weekWindows (List[Tuple[dt.datetime, dt.datetime]]): (start date, end date) of each week to be generated
+            generateWeeks (IGenerateWeeks): generates the reports of the weeks and calls the supplied callback
+            with week index and output file path (None if generation is not success) as each week finishes
+
+        Returns:
+            Optional[str]: job id, None if the job queue is full
+        """
+        if len(weekWindows) == 0:
+            raise ValueError("report generation job should have at least one week")
+        self.purgeExpiredJobs()
+        with self.lock:
+            numPendingJobs = len([j for j in self.jobs.values() if j['status'] in [
+                jobStatusQueued, jobStatusRunning]])
+            if numPendingJobs >= self.maxPendingJobs:
+                return None
+            jobId = uuid.uuid4().hex
+            job: IReportJob = {
+                'jobId': jobId,
+                'status': jobStatusQueued,
+                'startDate': dt.datetime.strftime(weekWindows[0][0], '%Y-%m-%d'),
+                'endDate': dt.datetime.strftime(weekWindows[-1][1], '%Y-%m-%d'),
+                'numWeeks': len(weekWindows),
+                'numWeeksDone': 0,
+                'weeks': [{'startDate': dt.datetime.strftime(w[0], '%Y-%m-%d'),
+                           'endDate': dt.datetime.strftime(w[1], '%Y-%m-%d'),
+                           'status': jobStatusQueued, 'outputPath': None} for w in weekWindows],
+                'createdAt': dt.datetime.now().isoformat(timespec='seconds'),
+                'finishedAt': None
+            }
+            self.jobs[jobId] = job
+        self.executor.submit(self.runJob, jobId, weekWindows, generateWeeks)
+        return jobId
+
+    def runJob(self, jobId: str, weekWindows: List[Tuple[dt.datetime, dt.datetime]], generateWeeks: IGenerateWeeks) -> None:
+        job = self.jobs[jobId]
+        with self.lock:
+            job['status'] = jobStatusRunning
+            for week in job['weeks']:
+                week['status'] = jobStatusRunning
+
+        def onWeekDone(weekInd: int, outputPath: Optional[str]) -> None:
+            with self.lock:
+                job['weeks'][weekInd]['status'] = jobStatusFailed if outputPath is None else jobStatusDone
+                job['weeks'][weekInd]['outputPath'] = outputPath
+                job['numWeeksDone'] += 1
+        try:
+            generateWeeks(weekWindows, onWeekDone)
+        except Exception as err:
+            self.appLogger.error("error while running weekly report job {0}".format(
+                jobId), exc_info=err)
+        with self.lock:
+            # weeks that did not finish are marked as failed
+            for week in job['weeks']:
+                if week['status'] == jobStatusRunning:
+                    week['status'] = jobStatusFailed
+            isJobSuccess = all([w['status'] == jobStatusDone for w in job['weeks']])
+            job['status'] = jobStatusDone if isJobSuccess else jobStatusFailed
+            finishTime = dt.datetime.now()
+            job['finishedAt'] = finishTime.isoformat(timespec='seconds')
+            self.jobFinishTimes[jobId] = finishTime
+
+    def getJob(self, jobId: str) -> Optional[IReportJob]:
+        """get the status and per week progress of a job
+
+        Args:
+            jobId (str): job id
+
+        Returns:
+            Optional[IReportJob]: copy of the job, None if job is not present or expired
+        """
+        self.purgeExpiredJobs()
+        with self.lock:
+            job = self.jobs.get(jobId, None)
+            return copy.deepcopy(job)
+
+    def purgeExpiredJobs(self) -> None:
+        """forget the jobs that finished before the job TTL
+        """
+        with self.lock:
+            expiredJobIds = [jobId for jobId, finishTime in self.jobFinishTimes.items()
+                             if dt.datetime.now() - finishTime > self.jobTtl]
+            for jobId in expiredJobIds:
+                del self.jobFinishTimes[jobId]
+                del self.jobs[jobId]
+
+
+def initReportJobsManager(appConfig: IAppConfig) -> ReportJobsManager:
+    """create the report jobs manager as per app config
+
+    Args:
+        appConfig (IAppConfig): application config
+
+    Returns:
+        ReportJobsManager: report jobs manager
+    """
+    return ReportJobsManager(maxWorkers=int(getConfigVal(appConfig, 'reportJobWorkers', 2)),
+                             maxPendingJobs=int(getConfigVal(appConfig, 'reportJobsMaxPending', 20)),
+                             jobTtlSecs=int(getConfigVal(appConfig, 'reportJobTtlSecs', 86400)))
@@ -0,0 +1,154 @@
+import os
+import pickle
+import threading
+import datetime as dt
+from typing import Optional
+from src.typeDefs.appConfig import IAppConfig
+from src.typeDefs.sectionCacheStats import ISectionCacheStats
+from src.config.appConfig import getConfigVal
+
+# increment this whenever the format of any report section payload changes,
+# so that payloads cached by older versions are not used
+sectionCacheSchemaVersion = 1
+
+
+class SectionCache():
+    """on-disk cache of fetched report section payloads with size bounded LRU eviction.
+    Each payload is stored in a separate file and the file modified time is used as last access time
+    """
+
+    def __init__(self, cacheFolder: str, maxSizeBytes: int, minAgeDays: int = 7, schemaVersion: int = sectionCacheSchemaVersion):
+        """constructor method
+
+        Args:
+            cacheFolder (str): folder in which the section payloads are stored
+            maxSizeBytes (int): least recently used payloads are evicted to keep total size below this
+            minAgeDays (int, optional): sections of windows that ended at least these many days ago are served from cache. Defaults to 7.
+            schemaVersion (int, optional): version of section payloads format. Defaults to sectionCacheSchemaVersion.
+        """
+        self.cacheFolder = cacheFolder
+        self.maxSizeBytes = maxSizeBytes
+        self.minAgeDays = minAgeDays
+        self.schemaVersion = schemaVersion
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+        os.makedirs(cacheFolder, exist_ok=True)
+
+    def getEntryPath(self, sectionName: str, startDt: dt.datetime, endDt: dt.datetime) -> str:
+        entryFilename = '{0}_{1}_{2}_v{3}.pkl'.format(sectionName, dt.datetime.strftime(
+            startDt, '%Y%m%d%H%M%S'), dt.datetime.strftime(endDt, '%Y%m%d%H%M%S'), self.schemaVersion)
+        return os.path.join(self.cacheFolder, entryFilename)
+
+    def isServable(self, endDt: dt.datetime) -> bool:
+        """check if the sections of a window are old enough to be served from cache
+
+        Args:
+            endDt (dt.datetime): end time of window
+
+        Returns:
+            bool: True if window ended at least minAgeDays ago
+        """
+        return (dt.datetime.now() - endDt) >= dt.timedelta(days=self.minAgeDays)
+
+    def get(self, sectionName: str, startDt: dt.datetime, endDt: dt.datetime) -> Optional[dict]:
+        """get the cached payload of a section
+
+        Args:
+            sectionName (str): name of report section
+            startDt (dt.datetime): start time of window
+            endDt (dt.datetime): end time of window
+
+        Returns:
+            Optional[dict]: section payload, None if not present in cache
+        """
+        entryPath = self.getEntryPath(sectionName, startDt, endDt)
+        with self.lock:
+            try:
+                with open(entryPath, 'rb') as f:
+                    sectionCxt = pickle.load(f)
+                # mark the entry as recently used
+                os.utime(entryPath)
+            except (OSError, EOFError, pickle.UnpicklingError):
+                self.misses += 1
+                return None
+            self.hits += 1
+            return sectionCxt
+
+    def put(self, sectionName: str, startDt: dt.datetime, endDt: dt.datetime, sectionCxt: dict) -> int:
+        """store the payload of a section and evict least recently used entries if cache size is exceeded
+
+        Args:
+            sectionName (str): name of report section
+            startDt (dt.datetime): start time of window
+            endDt (dt.datetime): end time of window
+            sectionCxt (dict): section payload
+
+        Returns:
+            int: size of the stored entry in bytes
+        """
+        sectionPayload = pickle.dumps(sectionCxt, protocol=pickle.HIGHEST_PROTOCOL)
+        self.putPickled(sectionName, startDt, endDt, sectionPayload)
+        return len(sectionPayload)
+
+    def putPickled(self, sectionName: str, startDt: dt.datetime, endDt: dt.datetime, sectionPayload: bytes) -> None:
+        """store the already pickled payload of a section and evict least recently used entries if cache size is exceeded
+
+        Args:
+            sectionName (str): name of report section
+            startDt (dt.datetime): start time of window
+            endDt (dt.datetime): end time of window
+            sectionPayload (bytes): pickled section payload
+        """
+        entryPath = self.getEntryPath(sectionName, startDt, endDt)
+        with self.lock:
+            # write to a temporary file first, so that readers never see a partial entry
+            tmpPath = entryPath + '.tmp'
+            with open(tmpPath, 'wb') as f:
+                f.write(sectionPayload)
+            os.replace(tmpPath, entryPath)
+            self.evictEntries()
+
+    def evictEntries(self) -> None:
+        entries = [e for e in os.scandir(self.cacheFolder)
+                   if e.is_file() and e.name.endswith('.pkl')]
+        totalSize = sum([e.stat().st_size for e in entries])
+        for entry in sorted(entries, key=lambda e: e.stat().st_mtime):
+            if totalSize <= self.maxSizeBytes:
+                break
+            totalSize -= entry.stat().st_size
+            os.remove(entry.path)
+
+    def getStats(self) -> ISectionCacheStats:
+        """get the hit, miss counters and size of the cache
+
+        Returns:
+            ISectionCacheStats: cache statistics
+        """
+        with self.lock:
+            entries = [e for e in os.scandir(self.cacheFolder)
+                       if e.is_file() and e.name.endswith('.pkl')]
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'numEntries': len(entries),
+                'sizeBytes': sum([e.stat().st_size for e in entries]),
+                'maxSizeBytes': self.maxSizeBytes
+            }
+
+
+def initSectionCache(appConfig: IAppConfig) -> Optional[SectionCache]:
+    """create the section cache as per app config, cache is disabled if sectionCacheFolder is not configured
+
+    Args:
+        appConfig (IAppConfig): application config
+
+    Returns:
+        Optional[SectionCache]: section cache, None if disabled
+    """
+    cacheFolder = getConfigVal(appConfig, 'sectionCacheFolder')
+    if cacheFolder is None:
+        return None
+    maxSizeMb = float(getConfigVal(appConfig, 'sectionCacheMaxMb', 500))
+    minAgeDays = int(getConfigVal(appConfig, 'sectionCacheMinAgeDays', 7))
+    return SectionCache(cacheFolder, int(maxSizeMb*1024*1024), minAgeDays)
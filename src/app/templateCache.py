@@ -0,0 +1,136 @@
+import io
+import os
+import threading
+from typing import Dict, FrozenSet, Optional, Tuple
+from jinja2 import Environment, Template
+from docxtpl import DocxTemplate
+
+
+class CachingJinjaEnv(Environment):
+    """jinja environment that compiles each template source only once
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.compiledTmpls: Dict[str, Template] = {}
+        self.compileLock = threading.Lock()
+
+    def from_string(self, source, *args, **kwargs) -> Template:
+        if not(isinstance(source, str)) or len(args) > 0 or len(kwargs) > 0:
+            return super().from_string(source, *args, **kwargs)
+        with self.compileLock:
+            tmpl = self.compiledTmpls.get(source, None)
+            if tmpl is None:
+                tmpl = super().from_string(source)
+                self.compiledTmpls[source] = tmpl
+            return tmpl
+
+
+class ParsedDocxTemplate():
+    """template file contents along with the patched xml and compiled jinja templates
+    of its parts, shared by all the renders of one version of the template file
+    """
+
+    def __init__(self, tmplPath: str, mtime: float):
+        self.mtime = mtime
+        with open(tmplPath, 'rb') as f:
+            self.tmplBytes = f.read()
+        self.patchedXmls: Dict[str, str] = {}
+        self.patchLock = threading.Lock()
+        self.jinjaEnv = CachingJinjaEnv()
+        self.tmplVars: Optional[FrozenSet[str]] = None
+        self.tmplVarsLock = threading.Lock()
+
+
+class CachedDocxTemplate(DocxTemplate):
+    """docx template that reuses the patched xml and compiled jinja templates of a parsed template.
+    Each instance has its own document, so it can be rendered and saved independently
+    """
+
+    def __init__(self, parsedTmpl: ParsedDocxTemplate):
+        super().__init__(io.BytesIO(parsedTmpl.tmplBytes))
+        self.parsedTmpl = parsedTmpl
+
+    def patch_xml(self, src_xml):
+        with self.parsedTmpl.patchLock:
+            patchedXml = self.parsedTmpl.patchedXmls.get(src_xml, None)
+        if patchedXml is None:
+            patchedXml = super().patch_xml(src_xml)
+            with self.parsedTmpl.patchLock:
+                self.parsedTmpl.patchedXmls[src_xml] = patchedXml
+        return patchedXml
+
+    def render(self, context, jinja_env=None, *args, **kwargs):
+        if jinja_env is None:
+            jinja_env = self.parsedTmpl.jinjaEnv
+        return super().render(context, jinja_env, *args, **kwargs)
+
+
+class TemplateCache():
+    """process wide cache of parsed docx templates keyed by template path and modification time
+    """
+    __instance = None
+
+    @staticmethod
+    def getInstance():
+        """ Static access method. """
+        if TemplateCache.__instance == None:
+            TemplateCache.__instance = TemplateCache()
+        return TemplateCache.__instance
+
+    def __init__(self):
+        self.parsedTmpls: Dict[str, ParsedDocxTemplate] = {}
+        self.lock = threading.Lock()
+
+    def getParsedTemplate(self, tmplPath: str) -> ParsedDocxTemplate:
+        """get the parsed template, the template file is parsed again only if it is modified after the last parse
+        """
+        tmplKey = os.path.abspath(tmplPath)
+        mtime = os.path.getmtime(tmplKey)
+        with self.lock:
+            parsedTmpl = self.parsedTmpls.get(tmplKey, None)
+            if parsedTmpl is None or parsedTmpl.mtime != mtime:
+                parsedTmpl = ParsedDocxTemplate(tmplKey, mtime)
+                self.parsedTmpls[tmplKey] = parsedTmpl
+        return parsedTmpl
+
+    def getTemplate(self, tmplPath: str) -> DocxTemplate:
+        """get a fresh docx template for rendering.
+        The template file is parsed again only if it is modified after the last parse
+
+        Args:
+            tmplPath (str): full file path of the template
+
+        Returns:
+            DocxTemplate: docx template ready for rendering
+        """
+        return CachedDocxTemplate(self.getParsedTemplate(tmplPath))
+
+    def getTemplateVariables(self, tmplPath: str) -> FrozenSet[str]:
+        """get the names of the context variables referenced by a template.
+        Variables are read once per version of the template file
+
+        Args:
+            tmplPath (str): full file path of the template
+
+        Returns:
+            FrozenSet[str]: names of the report context keys used in the template
+        """
+        parsedTmpl = self.getParsedTemplate(tmplPath)
+        with parsedTmpl.tmplVarsLock:
+            if parsedTmpl.tmplVars is None:
+                parsedTmpl.tmplVars = frozenset(CachedDocxTemplate(
+                    parsedTmpl).get_undeclared_template_variables(parsedTmpl.jinjaEnv))
+            return parsedTmpl.tmplVars
+
+    def clear(self) -> None:
+        with self.lock:
+            self.parsedTmpls = {}
+
+
+def getDocxTemplate(tmplPath: str) -> DocxTemplate:
+    return TemplateCache.getInstance().getTemplate(tmplPath)
+
+
+def getTemplateVariables(tmplPath: str) -> FrozenSet[str]:
+    return TemplateCache.getInstance().getTemplateVariables(tmplPath)
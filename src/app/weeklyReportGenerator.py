@@ -1,61 +1,304 @@
 import os
+import time
+import pickle
 import datetime as dt
-from src.utils.timeUtils import getWeekNumOfFinYr, getFinYearForDt, getMondayBeforeDt
-from src.fetchers.genUnitOutagesFetcher import fetchMajorGenUnitOutages
-from src.fetchers.transElOutagesFetcher import fetchTransElOutages
-from src.fetchers.longTimeUnrevivedForcedOutagesFetcher import fetchlongTimeUnrevivedForcedOutages
-from src.fetchers.freqProfileFetcher import FrequencyProfileFetcher
-from src.fetchers.vdiFetcher import VdiFetcher
-from src.fetchers.voltStatsFetcher import VoltStatsFetcher
-from src.fetchers.angleViolFetcher import AnglViolationsFetcher
-from src.fetchers.iegcViolMsgsFetcher import IegcViolMsgsFetcher
-from src.fetchers.ictConstraintsFetcher import IctConstraintsFetcher
-from src.fetchers.transmissionConstraintsFetcher import TransConstraintsFetcher
-from src.fetchers.hvNodesInfoFetcher import HvNodesInfoFetcher
-from src.fetchers.lvNodesInfoFetcher import LvNodesInfoFetcher
+from src.db.appDbPool import AppDbPool
+from src.app.sectionCache import SectionCache
+from src.app.daySliceStore import DaySliceStore
+from src.app.reportArtifactStore import ReportArtifactStore
+from src.app.appMetrics import getAppMetrics
+from src.app.contextSnapshot import saveContextSnapshot, snapshotFileExt
+from src.utils.timeUtils import getWeekNumOfFinYr, getFinYearForDt, getFinYearLabel, getMondayBeforeDt, getFinWeeks
+# fetchers that need pandas and the docx template engine are imported on first use, so that the entry points
+# start without loading them. outageEventsFetcher has no pandas dependency, hence it is imported here
+from src.fetchers.outageEventsFetcher import OutageEventsFetcher
+from src.config.voltStatsLayout import getVoltStatsLayout
 from src.typeDefs.stationwiseVdiData import IStationwiseVdi
 from src.typeDefs.outage import IOutage
 from src.typeDefs.iegcViolMsg import IIegcViolMsg
 from src.typeDefs.angleViolSummary import IAngleViolSummary
+from src.typeDefs.freqProfileData import IFreqProfile
 from src.typeDefs.ictConstraint import IIctConstraint
 from src.typeDefs.transConstraint import ITransConstraint
 from src.typeDefs.hvNodesInfo import IHvNodesInfo
 from src.typeDefs.lvNodesInfo import ILvNodesInfo
 from src.typeDefs.appConfig import IAppConfig
-from src.typeDefs.reportContext import IReportCxt
-from typing import List
-from docxtpl import DocxTemplate, InlineImage
+from src.typeDefs.reportContext import IReportCxt, VoltageStatsDict
+from src.typeDefs.reportSection import IReportSection
+from src.typeDefs.renderStats import IRenderStats
+from src.typeDefs.finWeek import IFinWeek
+from src.typeDefs.cursorOpts import ICursorOpts
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from functools import partial
 from src.appLogger import getAppLogger
 # from docx2pdf import convert
 
 
+def getReportFilename(startDt: dt.datetime, endDt: dt.datetime) -> str:
+    """get the file name of the generated weekly report
+
+    Args:
+        startDt (dt.datetime): start date of report
+        endDt (dt.datetime): end date of report
+
+    Returns:
+        str: report file name like Weekly_no_20_10-08-2020_to_16-08-2020.docx
+    """
+    return 'Weekly_no_{0}_{1}_to_{2}.docx'.format(getWeekNumOfFinYr(startDt), dt.datetime.strftime(
+        startDt, '%d-%m-%Y'), dt.datetime.strftime(endDt, '%d-%m-%Y'))
+
+
+def getSnapshotFilename(startDt: dt.datetime, endDt: dt.datetime) -> str:
+    """get the file name of the report context snapshot that is saved next to the generated weekly report
+
+    Args:
+        startDt (dt.datetime): start date of report
+        endDt (dt.datetime): end date of report
+
+    Returns:
+        str: snapshot file name like Weekly_no_20_10-08-2020_to_16-08-2020.ctx.json.gz
+    """
+    return os.path.splitext(getReportFilename(startDt, endDt))[0] + snapshotFileExt
+
+
+def renderReportWithStats(reportContext: IReportCxt, tmplPath: str, dumpFolder: str, saveSnapshot: bool = True,
+                          artifactStore: Optional[ReportArtifactStore] = None) -> IRenderStats:
+    """render the report file at the desired dump folder location 
+    based on the template file and report context object.
+    The report context snapshot is also saved next to the report, so that the report can be rendered again without db.
+    If an identical report is present in artifact store, it is copied to the dump folder instead of rendering.
+    This is a module level function so that it can be run in render worker processes
+
+    Args:
+        reportContext (IReportCxt): report context object
+        tmplPath (str): full file path of the template
+        dumpFolder (str): folder path for dumping the generated report
+        saveSnapshot (bool, optional): save the report context snapshot. Defaults to True.
+        artifactStore (Optional[ReportArtifactStore], optional): store of generated reports. Defaults to None.
+
+    Returns:
+        IRenderStats: success flag, render and save duration and size of the report file
+    """
+    startDateLogString = dt.datetime.strftime(reportContext['startDtObj'], '%Y-%m-%d')
+    endDateLogString = dt.datetime.strftime(reportContext['endDtObj'], '%Y-%m-%d')
+    logExtra = {"startDate": startDateLogString,
+                "endDate": endDateLogString}
+    renderStartTime = time.perf_counter()
+    dumpFileFullPath = os.path.join(dumpFolder, getReportFilename(
+        reportContext['startDtObj'], reportContext['endDtObj']))
+    snapshotPath = os.path.join(dumpFolder, getSnapshotFilename(
+        reportContext['startDtObj'], reportContext['endDtObj']))
+    artifactKey: Optional[str] = None
+    isRenderSkipped = False
+    if not(artifactStore is None):
+        try:
+            artifactKey = artifactStore.getArtifactKey(reportContext, tmplPath)
+            isRenderSkipped = artifactStore.restoreArtifact(artifactKey, dumpFileFullPath)
+        except Exception as err:
+            getAppLogger().error(
+                "error while looking up weekly report in artifact store", exc_info=err, extra=logExtra)
+            artifactKey = None
+    if not(isRenderSkipped):
+        try:
+            from src.app.templateCache import getDocxTemplate
+            doc = getDocxTemplate(tmplPath)
+            # # signature Image
+            # signatureImgPath = 'assets/signature.png'
+            # signImg = InlineImage(doc, signatureImgPath)
+            # reportContext['signature'] = signImg
+            doc.render(reportContext)
+            doc.save(dumpFileFullPath)
+        except Exception as err:
+            getAppLogger().error(
+                "error while saving weekly report from context", exc_info=err, extra=logExtra)
+            return {'isSuccess': False, 'renderSecs': time.perf_counter() - renderStartTime, 'reportBytes': 0,
+                    'isRenderSkipped': False}
+    # snapshot of a skipped render is the same as the saved one, hence it is saved only if missing
+    if saveSnapshot and not(isRenderSkipped and os.path.isfile(snapshotPath)):
+        try:
+            saveContextSnapshot(reportContext, snapshotPath)
+        except Exception as err:
+            # report is usable even if snapshot is not saved
+            getAppLogger().error(
+                "error while saving weekly report context snapshot", exc_info=err, extra=logExtra)
+    if not(artifactKey is None):
+        try:
+            if isRenderSkipped:
+                # the restored report becomes the latest report of its file name
+                artifactStore.indexArtifact(artifactKey, os.path.basename(dumpFileFullPath),
+                                            reportContext['startDtObj'], reportContext['endDtObj'])
+            else:
+                artifactStore.putArtifact(
+                    artifactKey, dumpFileFullPath, reportContext['startDtObj'], reportContext['endDtObj'])
+        except Exception as err:
+            getAppLogger().error(
+                "error while saving weekly report in artifact store", exc_info=err, extra=logExtra)
+    return {'isSuccess': True, 'renderSecs': time.perf_counter() - renderStartTime,
+            'reportBytes': os.path.getsize(dumpFileFullPath), 'isRenderSkipped': isRenderSkipped}
+
+
+def recordRenderStats(reportContext: IReportCxt, renderStats: IRenderStats) -> None:
+    """log the render stats of a report and add them to the app metrics.
+    This is called in the service process, since metrics of render worker processes are not exported
+    """
+    appMetrics = getAppMetrics()
+    appMetrics.renderSecs.observe(renderStats['renderSecs'])
+    if not(renderStats['isSuccess']):
+        appMetrics.renderFailures.inc()
+        return
+    logExtra = {"startDate": dt.datetime.strftime(reportContext['startDtObj'], '%Y-%m-%d'),
+                "endDate": dt.datetime.strftime(reportContext['endDtObj'], '%Y-%m-%d'),
+                "renderSecs": round(renderStats['renderSecs'], 3),
+                "reportBytes": renderStats['reportBytes']}
+    if renderStats.get('isRenderSkipped', False):
+        appMetrics.renderSkips.inc()
+        getAppLogger().info("weekly report is unchanged, hence taken from artifact store without render", extra=logExtra)
+        return
+    getAppLogger().info("weekly report render and save complete", extra=logExtra)
+
+
+def renderReport(reportContext: IReportCxt, tmplPath: str, dumpFolder: str, saveSnapshot: bool = True,
+                 artifactStore: Optional[ReportArtifactStore] = None) -> bool:
+    """render the report file at the desired dump folder location 
+    based on the template file and report context object and record the render stats
+
+    Args:
+        reportContext (IReportCxt): report context object
+        tmplPath (str): full file path of the template
+        dumpFolder (str): folder path for dumping the generated report
+        saveSnapshot (bool, optional): save the report context snapshot next to the report. Defaults to True.
+        artifactStore (Optional[ReportArtifactStore], optional): store of generated reports, render is skipped for stored reports. Defaults to None.
+
+    Returns:
+        bool: True if process is success, else False
+    """
+    renderStats = renderReportWithStats(reportContext, tmplPath, dumpFolder, saveSnapshot, artifactStore)
+    recordRenderStats(reportContext, renderStats)
+    return renderStats['isSuccess']
+
+
+def countSectionRows(sectionCxt: dict) -> int:
+    """count the table rows in a partial report context, including the rows of nested tables like voltage stats
+    """
+    numRows = 0
+    for val in sectionCxt.values():
+        if isinstance(val, list):
+            numRows += len(val)
+        elif isinstance(val, dict):
+            numRows += countSectionRows(val)
+    return numRows
+
+
+# interval for checking the section timeouts of sections waiting for a fetch worker
+sectionStartPollSecs = 0.1
+
+
+def splitIntoDays(df: Any, dateCol: str, days: List[dt.datetime]) -> List[Any]:
+    """split the rows of a dataframe fetched for a range of days into day slices.
+    Rows go to the calendar day of their date column, so rows with intraday timestamps are also kept
+
+    Args:
+        df (Any): pandas dataframe with rows of all the days
+        dateCol (str): name of the datetime column
+        days (List[dt.datetime]): days in ascending order
+
+    Returns:
+        List[Any]: dataframe of each day
+    """
+    import pandas as pd
+    rowDays = pd.to_datetime(df[dateCol]).dt.normalize()
+    return [df[rowDays == pd.Timestamp(d.date())].reset_index(drop=True) for d in days]
+
+
+def concatDaySlices(daySlices: List[Any]) -> Any:
+    """join the day slices of a daily section into a single dataframe
+
+    Args:
+        daySlices (List[Any]): dataframe of each day
+
+    Returns:
+        Any: pandas dataframe with rows of all the days
+    """
+    import pandas as pd
+    # empty slices may not have the column types of the slices with data, hence they are left out
+    dataSlices = [s for s in daySlices if len(s) > 0]
+    if len(dataSlices) == 0:
+        return daySlices[0]
+    return pd.concat(dataSlices, ignore_index=True)
+
+
+def fetchSingleWeek(fetchWeeks: Callable[[List[Tuple[dt.datetime, dt.datetime]]], List[dict]], startDate: dt.datetime, endDate: dt.datetime) -> dict:
+    """fetch a report section for a single week using its range fetch
+    """
+    return fetchWeeks([(startDate, endDate)])[0]
+
+
 class WeeklyReportGenerator:
-    appDbConStr: str = ''
+    fetchWorkers: int = 1
+
+    def __init__(self, appDbPool: AppDbPool, fetchWorkers: int = 1, sectionCache: Optional[SectionCache] = None, outageCursorOpts: Optional[ICursorOpts] = None,
+                 sectionTimeoutSecs: Optional[float] = None, deadlineSecs: Optional[float] = None, daySliceStore: Optional[DaySliceStore] = None,
+                 artifactStore: Optional[ReportArtifactStore] = None):
+        """constructor method
 
-    def __init__(self, appDbConStr: str):
-        self.appDbConStr = appDbConStr
+        Args:
+            appDbPool (AppDbPool): connection pool of application db shared by all the fetchers
+            fetchWorkers (int, optional): number of report sections to be fetched concurrently. Defaults to 1.
+            sectionCache (Optional[SectionCache], optional): on-disk cache of fetched sections. Defaults to None.
+            outageCursorOpts (Optional[ICursorOpts], optional): cursor array size and prefetch rows of outage events query. Defaults to None.
+            sectionTimeoutSecs (Optional[float], optional): max fetch time of a section, no limit if None. Defaults to None.
+            deadlineSecs (Optional[float], optional): max fetch time of all the sections of a context fetch, no limit if None. Defaults to None.
+            daySliceStore (Optional[DaySliceStore], optional): on-disk store of the day slices of daily sections. Defaults to None.
+            artifactStore (Optional[ReportArtifactStore], optional): store of generated reports, render is skipped for stored reports. Defaults to None.
+        """
+        self.appDbPool = appDbPool
+        self.fetchWorkers = fetchWorkers
+        self.sectionCache = sectionCache
+        self.outageCursorOpts = outageCursorOpts
+        self.sectionTimeoutSecs = sectionTimeoutSecs
+        self.deadlineSecs = deadlineSecs
+        self.daySliceStore = daySliceStore
+        self.artifactStore = artifactStore
         self.appLogger = getAppLogger()
 
-    def getReportContextObj(self, startDate: dt.datetime, endDate: dt.datetime) -> IReportCxt:
+    def getReportContextObj(self, startDate: dt.datetime, endDate: dt.datetime, refreshCache: bool = False, tmplPath: Optional[str] = None,
+                            refreshSections: Optional[List[str]] = None) -> IReportCxt:
         """get the report context object for populating the weekly report template
 
         Args:
             startDate (dt.datetime): start date object
             endDate (dt.datetime): end date object
+            refreshCache (bool, optional): fetch all sections from db even if they are present in section cache. Defaults to False.
+            tmplPath (Optional[str], optional): only the sections used by this template are fetched, all if None. Defaults to None.
+            refreshSections (Optional[List[str]], optional): names of the only sections to be fetched from db,
+            other sections are taken from their last saved copy in section cache. Defaults to None.
+
+        Returns:
+            IReportCxt: report context object
+        """
+        return self.getReportContextObjs([(startDate, endDate)], refreshCache, tmplPath, refreshSections)[0]
+
+    def getInitialReportContext(self, startDate: dt.datetime, endDate: dt.datetime, finWeek: Optional[IFinWeek] = None) -> IReportCxt:
+        """get the report context of a week with empty sections
+
+        Args:
+            startDate (dt.datetime): start date object
+            endDate (dt.datetime): end date object
+            finWeek (Optional[IFinWeek], optional): week number and financial year of the week starting at start date,
+            derived from start date if None. Defaults to None.
 
         Returns:
             IReportCxt: report context object
         """
-        endDate = endDate.replace(hour=23, minute=59, second=59)
         startDateReportString = dt.datetime.strftime(startDate, '%d-%b-%Y')
-        startDateLogString = dt.datetime.strftime(startDate, '%Y-%m-%d')
         endDateReportString = dt.datetime.strftime(endDate, '%d-%b-%Y')
-        endDateLogString = dt.datetime.strftime(endDate, '%Y-%m-%d')
-        weekNum = getWeekNumOfFinYr(startDate)
-        finYr = getFinYearForDt(startDate)
-        finYrStr = '{0}-{1}'.format(finYr, (finYr+1) % 100)
-        logExtra = {"startDate": startDateLogString,
-                    "endDate": endDateLogString}
+        if finWeek is None:
+            weekNum = getWeekNumOfFinYr(startDate)
+            finYrStr = getFinYearLabel(getFinYearForDt(startDate))
+        else:
+            weekNum = finWeek['wkNum']
+            finYrStr = finWeek['finYrStr']
 
         # create context for weekly reoport
         # initialise report context
@@ -71,162 +314,632 @@ class WeeklyReportGenerator:
             'longTimeOtgs': [],
             'freqProfRows': [],
             'weeklyFdi': -1,
+            'vdi400Rows': [],
+            'vdi765Rows': [],
+            'violMsgs': [],
             'wideViols': [],
             'adjViols': [],
-            'voltStats': {
-                'table1': [],
-                'table2': [],
-                'table3': [],
-                'table4': []
-            },
+            'voltStats': {t['name']: [] for t in getVoltStatsLayout()['tables']},
             'ictCons': [],
             'transCons': [],
             'lvNodes': [],
-            'hvNodes': []
+            'hvNodes': [],
+            'unavailableSections': []
         }
+        return reportContext
 
-        # get major generating unit outages
+    def getReportContextObjs(self, weekWindows: List[Tuple[dt.datetime, dt.datetime]], refreshCache: bool = False, tmplPath: Optional[str] = None,
+                             refreshSections: Optional[List[str]] = None) -> List[IReportCxt]:
+        """get the report context objects of many weeks.
+        Each report section is fetched for all the weeks at once and split into the weeks.
+        If refresh sections are specified, only those sections are fetched from db and the other sections
+        are taken from section cache irrespective of their age, sections missing in cache are fetched from db
+
+        Args:
+            weekWindows (List[Tuple[dt.datetime, dt.datetime]]): (start date, end date) of each week in ascending order
+            refreshCache (bool, optional): fetch all sections from db even if they are present in section cache. Defaults to False.
+            tmplPath (Optional[str], optional): only the sections used by this template are fetched, all if None. Defaults to None.
+            refreshSections (Optional[List[str]], optional): names of the only sections to be fetched from db,
+            refreshCache is not used if specified and section cache is required. Defaults to None.
+
+        Returns:
+            List[IReportCxt]: report context object of each week
+
+        Raises:
+            ValueError: if refresh sections are unknown or section cache is not configured
+        """
+        weekWindows = [(startDate, endDate.replace(hour=23, minute=59, second=59))
+                       for startDate, endDate in weekWindows]
+        # week numbers and financial years of all the weeks are derived at once,
+        # windows that do not start on a Monday derive them from their start date
+        finWeeksMap: Dict[dt.date, IFinWeek] = {} if len(weekWindows) == 0 else {
+            w['startDt'].date(): w for w in getFinWeeks(weekWindows[0][0], weekWindows[-1][1])}
+        reportContexts = [self.getInitialReportContext(startDate, endDate, finWeeksMap.get(startDate.date(), None))
+                          for startDate, endDate in weekWindows]
+
+        # fetch the report sections, one after another or on a worker pool
+        reportSections = self.getReportSections()
+        if not(refreshSections is None):
+            unknownSections = set(refreshSections) - set([s['name'] for s in reportSections])
+            if len(unknownSections) > 0:
+                raise ValueError("unknown report sections to refresh: " + ", ".join(sorted(unknownSections)))
+            if self.sectionCache is None:
+                raise ValueError("report sections can be refreshed only if section cache is configured, "
+                                 "since other sections are reused from their last saved copy in section cache")
+
+        def fetchSectionWeeks(section: IReportSection) -> List[dict]:
+            if refreshSections is None:
+                return self.fetchSectionForWeeks(section, weekWindows, refreshCache)
+            return self.fetchSectionForWeeks(section, weekWindows, refreshCache=section['name'] in refreshSections,
+                                             reuseLastSaved=True)
+        if not(tmplPath is None):
+            reportSections = self.planReportSections(reportSections, tmplPath, {
+                "startDate": dt.datetime.strftime(weekWindows[0][0], '%Y-%m-%d'),
+                "endDate": dt.datetime.strftime(weekWindows[-1][1], '%Y-%m-%d')})
+        if len(reportSections) == 0:
+            return reportContexts
+        if not(self.sectionTimeoutSecs is None) or not(self.deadlineSecs is None):
+            sectionResults = self.fetchSectionsWithDeadline(
+                reportSections, weekWindows, fetchSectionWeeks)
+        elif self.fetchWorkers > 1:
+            with ThreadPoolExecutor(max_workers=min(self.fetchWorkers, len(reportSections))) as executor:
+                sectionResults = list(executor.map(fetchSectionWeeks, reportSections))
+        else:
+            sectionResults = [fetchSectionWeeks(s) for s in reportSections]
+
+        # populate report contexts with the fetched sections in the report section order
+        for section, weekSectionCxts in zip(reportSections, sectionResults):
+            if weekSectionCxts is None:
+                # section missed the deadline, hence it is left empty and marked as unavailable
+                for reportContext in reportContexts:
+                    reportContext['unavailableSections'].append(
+                        section.get('title', section['name']))
+                continue
+            for reportContext, sectionCxt in zip(reportContexts, weekSectionCxts):
+                reportContext.update(sectionCxt)
+
+        return reportContexts
+
+    def fetchSectionsWithDeadline(self, reportSections: List[IReportSection], weekWindows: List[Tuple[dt.datetime, dt.datetime]],
+                                  fetchSectionWeeks: Callable[[IReportSection], List[dict]]) -> List[Optional[List[dict]]]:
+        """fetch the report sections on a worker pool, sections that run longer than the section timeout
+        or that are not complete by the generation deadline are abandoned.
+        Abandoned sections that are not yet started are cancelled,
+        running ones are left to finish or to be cancelled by the db call timeout in background
+
+        Args:
+            reportSections (List[IReportSection]): report sections to be fetched
+            weekWindows (List[Tuple[dt.datetime, dt.datetime]]): (start date, end date) of each week in ascending order
+            fetchSectionWeeks (Callable[[IReportSection], List[dict]]): fetches a section for all the weeks
+
+        Returns:
+            List[Optional[List[dict]]]: partial report context of each week for each section, None if the section timed out
+        """
+        logExtra = {"startDate": dt.datetime.strftime(weekWindows[0][0], '%Y-%m-%d'),
+                    "endDate": dt.datetime.strftime(weekWindows[-1][1], '%Y-%m-%d')}
+        generationStartTime = time.monotonic()
+        deadlineTime = None if self.deadlineSecs is None else generationStartTime + self.deadlineSecs
+        sectionStartTimes: Dict[int, float] = {}
+
+        def fetchSectionTimed(sectionInd: int) -> List[dict]:
+            sectionStartTimes[sectionInd] = time.monotonic()
+            return fetchSectionWeeks(reportSections[sectionInd])
+
+        sectionResults: List[Optional[List[dict]]] = [None]*len(reportSections)
+        executor = ThreadPoolExecutor(max_workers=min(
+            max(self.fetchWorkers, 1), len(reportSections)))
+        sectionFuts = {executor.submit(fetchSectionTimed, sectionInd): sectionInd
+                       for sectionInd in range(len(reportSections))}
+        pendingFuts = set(sectionFuts.keys())
         try:
-            reportContext['genOtgs'] = fetchMajorGenUnitOutages(
-                self.appDbConStr, startDate, endDate)
-            self.appLogger.info(
-                "major generating outages context setting complete", extra=logExtra)
-        except Exception as err:
-            self.appLogger.error(
-                "error while fetching major generating outages", exc_info=err, extra=logExtra)
+            while len(pendingFuts) > 0:
+                # abandon the sections that crossed the section timeout or the generation deadline
+                nowTime = time.monotonic()
+                expiryTimes = {}
+                for sectionFut in pendingFuts:
+                    sectionStartTime = sectionStartTimes.get(sectionFuts[sectionFut], None)
+                    sectionExpiryTimes = [t for t in [deadlineTime, None if (sectionStartTime is None) or (self.sectionTimeoutSecs is None)
+                                                      else sectionStartTime + self.sectionTimeoutSecs] if not(t is None)]
+                    if len(sectionExpiryTimes) > 0:
+                        expiryTimes[sectionFut] = min(sectionExpiryTimes)
+                for sectionFut in [f for f, t in expiryTimes.items() if t <= nowTime]:
+                    pendingFuts.remove(sectionFut)
+                    sectionFut.cancel()
+                    section = reportSections[sectionFuts[sectionFut]]
+                    getAppMetrics().sectionFailures.inc(section['name'])
+                    self.appLogger.error("{0} section missed the deadline and is marked as data unavailable".format(
+                        section['name']), extra=dict(logExtra, section=section['name'], elapsedSecs=round(nowTime - generationStartTime, 3)))
+                if len(pendingFuts) == 0:
+                    break
+                # wait till a section completes or the earliest expiry, sections not yet started are checked periodically
+                waitSecs = min([t - nowTime for f, t in expiryTimes.items() if f in pendingFuts] +
+                               [sectionStartPollSecs])
+                doneFuts, pendingFuts = wait(pendingFuts, timeout=max(waitSecs, 0), return_when=FIRST_COMPLETED)
+                for sectionFut in doneFuts:
+                    sectionResults[sectionFuts[sectionFut]] = sectionFut.result()
+        finally:
+            # cancel the sections that are not yet started and do not wait for the abandoned sections
+            for sectionFut in sectionFuts.keys():
+                sectionFut.cancel()
+            executor.shutdown(wait=False)
+        return sectionResults
 
-        # get transmission element outages
+    def planReportSections(self, reportSections: List[IReportSection], tmplPath: str, logExtra: dict) -> List[IReportSection]:
+        """get the report sections whose context keys are referenced by the template.
+        Sections without context keys are always fetched. All sections are fetched if the template variables cannot be read
+
+        Args:
+            reportSections (List[IReportSection]): all the report sections
+            tmplPath (str): full file path of the template
+            logExtra (dict): extra info for logging
+
+        Returns:
+            List[IReportSection]: report sections to be fetched for the template
+        """
         try:
-            reportContext['transOtgs'] = fetchTransElOutages(
-                self.appDbConStr, startDate, endDate)
-            self.appLogger.info(
-                "transmission outages context setting complete", extra=logExtra)
+            from src.app.templateCache import getTemplateVariables
+            tmplVars = getTemplateVariables(tmplPath)
         except Exception as err:
             self.appLogger.error(
-                "error while fetching transmission outages", exc_info=err, extra=logExtra)
+                "error while reading template variables, hence fetching all report sections", exc_info=err, extra=logExtra)
+            return reportSections
+        plannedSections = [s for s in reportSections if not('cxtKeys' in s)
+                           or any([k in tmplVars for k in s['cxtKeys']])]
+        plannedSectionNames = [s['name'] for s in plannedSections]
+        skippedSectionNames = [s['name'] for s in reportSections if not(s['name'] in plannedSectionNames)]
+        if len(skippedSectionNames) > 0:
+            self.appLogger.info("report sections not used by the template are skipped: " + ", ".join(skippedSectionNames),
+                                extra=dict(logExtra, skippedSections=skippedSectionNames))
+        return plannedSections
 
-        # get long time unrevived transmission element outages
+    def getCachedSection(self, section: IReportSection, startDate: dt.datetime, endDate: dt.datetime, logExtra: dict, reuseLastSaved: bool = False) -> Optional[dict]:
+        """get a section of an old window from section cache, sections of recent windows are also served if reuseLastSaved is True
+
+        Returns:
+            Optional[dict]: partial report context populated by the section, None if not available in cache
+        """
+        if (self.sectionCache is not None) and (reuseLastSaved or self.sectionCache.isServable(endDate)):
+            sectionCxt = self.sectionCache.get(section['name'], startDate, endDate)
+            if sectionCxt is not None:
+                getAppMetrics().sectionCacheHits.inc(section['name'])
+                self.appLogger.info(
+                    section['successMsg'] + " from section cache", extra=logExtra)
+                return sectionCxt
+        return None
+
+    def putCachedSection(self, section: IReportSection, startDate: dt.datetime, endDate: dt.datetime, sectionCxt: dict, sectionPayload: bytes, logExtra: dict) -> None:
+        """save a fetched section in section cache, the section is saved as its payload pickled for fetch stats
+        """
+        # fetchers return empty data on db errors, hence empty sections are not cached
+        if (self.sectionCache is not None) and any([len(v) > 0 for v in sectionCxt.values() if isinstance(v, (list, dict))]):
+            try:
+                self.sectionCache.putPickled(section['name'], startDate, endDate, sectionPayload)
+            except Exception as err:
+                self.appLogger.error(
+                    "error while saving {0} section in section cache".format(section['name']), exc_info=err, extra=logExtra)
+
+    def recordSectionFetch(self, section: IReportSection, sectionCxts: List[dict], sectionPayloads: List[bytes], fetchSecs: float, logExtra: dict) -> dict:
+        """add the duration, row count and payload size of a section fetch to the app metrics
+
+        Args:
+            section (IReportSection): fetched report section
+            sectionCxts (List[dict]): fetched partial report context of each week
+            sectionPayloads (List[bytes]): pickled partial report context of each week
+            fetchSecs (float): fetch duration in seconds
+            logExtra (dict): extra info for logging
+
+        Returns:
+            dict: extra info for logging along with the fetch stats
+        """
+        numRows = sum([countSectionRows(c) for c in sectionCxts])
+        payloadBytes = sum([len(p) for p in sectionPayloads])
+        appMetrics = getAppMetrics()
+        appMetrics.sectionFetchSecs.observe(fetchSecs, section['name'])
+        appMetrics.sectionRows.inc(section['name'], amount=numRows)
+        appMetrics.sectionBytes.inc(section['name'], amount=payloadBytes)
+        return dict(logExtra, section=section['name'], fetchSecs=round(fetchSecs, 3),
+                    numRows=numRows, payloadBytes=payloadBytes)
+
+    def recordSectionFailure(self, section: IReportSection, fetchSecs: float, logExtra: dict) -> dict:
+        """add a failed section fetch to the app metrics
+
+        Returns:
+            dict: extra info for logging along with the fetch duration
+        """
+        getAppMetrics().sectionFailures.inc(section['name'])
+        return dict(logExtra, section=section['name'], fetchSecs=round(fetchSecs, 3))
+
+    def fetchSection(self, section: IReportSection, startDate: dt.datetime, endDate: dt.datetime, logExtra: dict, refreshCache: bool = False) -> dict:
+        """fetch a report section, errors are logged and isolated to the section.
+        Sections of old windows are served from section cache if available
+
+        Args:
+            section (IReportSection): report section to be fetched
+            startDate (dt.datetime): start date object
+            endDate (dt.datetime): end date object
+            logExtra (dict): extra info for logging
+            refreshCache (bool, optional): fetch from db even if section is present in cache. Defaults to False.
+
+        Returns:
+            dict: partial report context populated by the section, empty if section fetch fails
+        """
+        if not(refreshCache):
+            sectionCxt = self.getCachedSection(section, startDate, endDate, logExtra)
+            if sectionCxt is not None:
+                return sectionCxt
+        fetchStartTime = time.perf_counter()
         try:
-            reportContext['longTimeOtgs'] = fetchlongTimeUnrevivedForcedOutages(
-                self.appDbConStr, startDate, endDate)
-            self.appLogger.info(
-                "long time unrevived outages context setting complete", extra=logExtra)
+            sectionCxt = section['fetch'](startDate, endDate)
         except Exception as err:
-            self.appLogger.error(
-                "error while fetching long time unrevived outages", exc_info=err, extra=logExtra)
+            self.appLogger.error(section['errorMsg'], exc_info=err, extra=self.recordSectionFailure(
+                section, time.perf_counter() - fetchStartTime, logExtra))
+            return {}
+        fetchSecs = time.perf_counter() - fetchStartTime
+        # pickled once for both the fetch stats and the section cache
+        sectionPayload = pickle.dumps(sectionCxt, protocol=pickle.HIGHEST_PROTOCOL)
+        self.appLogger.info(section['successMsg'], extra=self.recordSectionFetch(
+            section, [sectionCxt], [sectionPayload], fetchSecs, logExtra))
+        self.putCachedSection(section, startDate, endDate, sectionCxt, sectionPayload, logExtra)
+        return sectionCxt
 
-        # get freq profile data
+    def fetchSectionForWeeks(self, section: IReportSection, weekWindows: List[Tuple[dt.datetime, dt.datetime]], refreshCache: bool = False,
+                             reuseLastSaved: bool = False) -> List[dict]:
+        """fetch a report section for many weeks, errors are logged and isolated to the section.
+        Weeks that are not served from section cache are fetched in a single range fetch if the section supports it
+
+        Args:
+            section (IReportSection): report section to be fetched
+            weekWindows (List[Tuple[dt.datetime, dt.datetime]]): (start date, end date) of each week in ascending order
+            refreshCache (bool, optional): fetch from db even if section is present in cache. Defaults to False.
+            reuseLastSaved (bool, optional): serve the section from cache even for recent weeks. Defaults to False.
+
+        Returns:
+            List[dict]: partial report context populated by the section for each week, empty if section fetch fails
+        """
+        weekLogExtras = [{"startDate": dt.datetime.strftime(startDate, '%Y-%m-%d'),
+                          "endDate": dt.datetime.strftime(endDate, '%Y-%m-%d')}
+                         for startDate, endDate in weekWindows]
+        sectionCxts: List[Optional[dict]] = [None]*len(weekWindows)
+        if not(refreshCache):
+            sectionCxts = [self.getCachedSection(section, startDate, endDate, logExtra, reuseLastSaved)
+                           for (startDate, endDate), logExtra in zip(weekWindows, weekLogExtras)]
+        missingWeekInds = [i for i, c in enumerate(sectionCxts) if c is None]
+        if len(missingWeekInds) == 0:
+            return sectionCxts
+        if reuseLastSaved and not(refreshCache):
+            # last saved copy is evicted or was never saved
+            self.appLogger.warning("{0} section is fetched again from db, since it has no saved copy in section cache".format(section['name']),
+                                   extra={"startDate": weekLogExtras[missingWeekInds[0]]['startDate'],
+                                          "endDate": weekLogExtras[missingWeekInds[-1]]['endDate'],
+                                          "section": section['name'], "numMissingWeeks": len(missingWeekInds)})
+
+        if not('fetchWeeks' in section):
+            for i in missingWeekInds:
+                sectionCxts[i] = self.fetchSection(
+                    section, weekWindows[i][0], weekWindows[i][1], weekLogExtras[i], refreshCache=True)
+            return sectionCxts
+
+        missingWeekWindows = [weekWindows[i] for i in missingWeekInds]
+        rangeLogExtra = {"startDate": weekLogExtras[missingWeekInds[0]]['startDate'],
+                         "endDate": weekLogExtras[missingWeekInds[-1]]['endDate']}
+        fetchStartTime = time.perf_counter()
         try:
-            freqProfFetcher = FrequencyProfileFetcher(self.appDbConStr)
-            freqProfile = freqProfFetcher.fetchDerivedFrequency(
-                startDate, endDate)
-            reportContext['freqProfRows'] = freqProfile['freqProfRows']
-            reportContext['weeklyFdi'] = "{:0.2f}".format(
-                freqProfile['weeklyFdi'])
-            self.appLogger.info(
-                "frequency profile and weekly FDI context setting complete", extra=logExtra)
+            if ('fetchDaySlices' in section) and not(self.daySliceStore is None):
+                fetchedCxts = self.fetchSectionFromDaySlices(
+                    section, missingWeekWindows, refreshCache, rangeLogExtra)
+            else:
+                fetchedCxts = section['fetchWeeks'](missingWeekWindows)
+            fetchSecs = time.perf_counter() - fetchStartTime
+            # pickled once for both the fetch stats and the section cache
+            fetchedPayloads = [pickle.dumps(c, protocol=pickle.HIGHEST_PROTOCOL) for c in fetchedCxts]
+            self.appLogger.info(section['successMsg'], extra=self.recordSectionFetch(
+                section, fetchedCxts, fetchedPayloads, fetchSecs, rangeLogExtra))
         except Exception as err:
-            self.appLogger.error(
-                "error while fetching frequency profile", exc_info=err, extra=logExtra)
+            self.appLogger.error(section['errorMsg'], exc_info=err, extra=self.recordSectionFailure(
+                section, time.perf_counter() - fetchStartTime, rangeLogExtra))
+            return [{} if c is None else c for c in sectionCxts]
+        for i, sectionCxt, sectionPayload in zip(missingWeekInds, fetchedCxts, fetchedPayloads):
+            sectionCxts[i] = sectionCxt
+            self.putCachedSection(
+                section, weekWindows[i][0], weekWindows[i][1], sectionCxt, sectionPayload, weekLogExtras[i])
+        return sectionCxts
+
+    def getDaySlices(self, section: IReportSection, days: List[dt.datetime], refreshCache: bool, logExtra: dict) -> List[Any]:
+        """get the rows of a daily section for each day from day slice store.
+        Days missing in store are fetched in a single catch up query and the slices of complete days are stored
+
+        Args:
+            section (IReportSection): daily report section
+            days (List[dt.datetime]): days in ascending order
+            refreshCache (bool): fetch all the days from db even if they are present in store
+            logExtra (dict): extra info for logging
+
+        Returns:
+            List[Any]: rows of each day
+        """
+        daySlices: List[Optional[Any]] = [None]*len(days)
+        if not(refreshCache):
+            daySlices = [self.daySliceStore.get(section['name'], d) for d in days]
+        missingDayInds = [i for i, s in enumerate(daySlices) if s is None]
+        if len(missingDayInds) > 0:
+            fetchDayInds = list(range(missingDayInds[0], missingDayInds[-1] + 1))
+            fetchedSlices = section['fetchDaySlices']([days[i] for i in fetchDayInds])
+            for dayInd, daySlice in zip(fetchDayInds, fetchedSlices):
+                if not(daySlices[dayInd] is None):
+                    continue
+                daySlices[dayInd] = daySlice
+                # derived tables are not yet populated for days with empty slices, hence they are fetched again next time
+                if self.daySliceStore.isStorable(days[dayInd]) and len(daySlice) > 0:
+                    try:
+                        self.daySliceStore.put(section['name'], days[dayInd], daySlice)
+                    except Exception as err:
+                        self.appLogger.error("error while saving {0} day slice".format(
+                            section['name']), exc_info=err, extra=logExtra)
+        self.appLogger.info("{0} day slices: {1} reused, {2} fetched".format(section['name'], len(days) - len(missingDayInds), len(missingDayInds)),
+                            extra=dict(logExtra, section=section['name'], numReusedDays=len(days) - len(missingDayInds),
+                                       numFetchedDays=len(missingDayInds)))
+        return daySlices
+
+    def fetchSectionFromDaySlices(self, section: IReportSection, weekWindows: List[Tuple[dt.datetime, dt.datetime]], refreshCache: bool, logExtra: dict) -> List[dict]:
+        """build a daily section for many weeks from the stored day slices and a catch up fetch of the missing days
+
+        Args:
+            section (IReportSection): daily report section
+            weekWindows (List[Tuple[dt.datetime, dt.datetime]]): (start date, end date) of each week in ascending order
+            refreshCache (bool): fetch all the days from db even if they are present in store
+            logExtra (dict): extra info for logging
+
+        Returns:
+            List[dict]: partial report context populated by the section for each week
+        """
+        days = [dt.datetime.combine(startDate.date() + dt.timedelta(days=dayOffset), dt.time())
+                for startDate, endDate in weekWindows for dayOffset in range((endDate.date() - startDate.date()).days + 1)]
+        daySlices = self.getDaySlices(section, days, refreshCache, logExtra)
+        return section['daySlicesToWeeks'](daySlices, weekWindows)
+
+    def accumulateDaySlices(self, uptoDay: dt.datetime) -> Dict[str, int]:
+        """fetch and store the missing day slices of the daily sections for the week of the given day, till the given day.
+        This is to be run every day, so that the week end generation fetches only a few days of daily sections
+
+        Args:
+            uptoDay (dt.datetime): last day to be accumulated
+
+        Returns:
+            Dict[str, int]: number of days with data for each daily section
+
+        Raises:
+            ValueError: if day slice store is not configured
+        """
+        if self.daySliceStore is None:
+            raise ValueError("day slice store is not configured")
+        weekStartDt = getMondayBeforeDt(dt.datetime.combine(uptoDay.date(), dt.time()))
+        days = [weekStartDt + dt.timedelta(days=dayOffset)
+                for dayOffset in range((uptoDay.date() - weekStartDt.date()).days + 1)]
+        logExtra = {"startDate": dt.datetime.strftime(days[0], '%Y-%m-%d'),
+                    "endDate": dt.datetime.strftime(days[-1], '%Y-%m-%d')}
+        numDataDays: Dict[str, int] = {}
+        for section in self.getReportSections():
+            if not('fetchDaySlices' in section):
+                continue
+            fetchStartTime = time.perf_counter()
+            try:
+                daySlices = self.getDaySlices(section, days, False, logExtra)
+            except Exception as err:
+                self.appLogger.error(section['errorMsg'], exc_info=err, extra=self.recordSectionFailure(
+                    section, time.perf_counter() - fetchStartTime, logExtra))
+                numDataDays[section['name']] = 0
+                continue
+            numDataDays[section['name']] = len([s for s in daySlices if len(s) > 0])
+        return numDataDays
+
+    def getReportSectionNames(self) -> List[str]:
+        """get the names of the report sections, that can be used for refreshing only a few sections
+
+        Returns:
+            List[str]: report section names in the report context order
+        """
+        return [s['name'] for s in self.getReportSections()]
+
+    def getReportSections(self) -> List[IReportSection]:
+        """get the list of independent report sections in the report context order
+
+        Returns:
+            List[IReportSection]: list of report sections
+        """
+        # outage sections share a single outage events scan per time window
+        outageEventsFetcher = OutageEventsFetcher(self.appDbPool, self.outageCursorOpts)
+        reportSections: List[IReportSection] = [
+            {'name': 'genOtgs', 'cxtKeys': ['genOtgs'], 'fetchWeeks': partial(self.fetchGenOtgsSections, outageEventsFetcher),
+             'title': 'Major generating unit outages',
+             'successMsg': "major generating outages context setting complete",
+             'errorMsg': "error while fetching major generating outages"},
+            {'name': 'transOtgs', 'cxtKeys': ['transOtgs'], 'fetchWeeks': partial(self.fetchTransOtgsSections, outageEventsFetcher),
+             'title': 'Transmission element outages',
+             'successMsg': "transmission outages context setting complete",
+             'errorMsg': "error while fetching transmission outages"},
+            {'name': 'longTimeOtgs', 'cxtKeys': ['longTimeOtgs'], 'fetchWeeks': partial(self.fetchLongTimeOtgsSections, outageEventsFetcher),
+             'title': 'Long time unrevived forced outages',
+             'successMsg': "long time unrevived outages context setting complete",
+             'errorMsg': "error while fetching long time unrevived outages"},
+            {'name': 'freqProfile', 'cxtKeys': ['freqProfRows', 'weeklyFdi'], 'fetchWeeks': self.fetchFreqProfileSections,
+             'title': 'Frequency profile',
+             'fetchDaySlices': self.fetchFreqProfileDaySlices, 'daySlicesToWeeks': self.buildFreqProfileSections,
+             'successMsg': "frequency profile and weekly FDI context setting complete",
+             'errorMsg': "error while fetching frequency profile"},
+            {'name': 'vdi', 'cxtKeys': ['vdi400Rows', 'vdi765Rows'], 'fetchWeeks': self.fetchVdiSections,
+             'title': 'Voltage deviation index',
+             'successMsg': "VDI context setting complete",
+             'errorMsg': "error while fetching VDI"},
+            {'name': 'voltStats', 'cxtKeys': ['voltStats'], 'fetchWeeks': self.fetchVoltStatsSections,
+             'title': 'Stationwise voltage stats',
+             'fetchDaySlices': self.fetchVoltStatsDaySlices, 'daySlicesToWeeks': self.buildVoltStatsSections,
+             'successMsg': "stationwise voltage stats context setting complete",
+             'errorMsg': "error while fetching stationwise voltage stats"},
+            {'name': 'violMsgs', 'cxtKeys': ['violMsgs'], 'fetchWeeks': self.fetchViolMsgsSections,
+             'title': 'IEGC violation messages',
+             'fetchDaySlices': self.fetchViolMsgsDaySlices, 'daySlicesToWeeks': self.buildViolMsgsSections,
+             'successMsg': "iegc violation messages context setting complete",
+             'errorMsg': "error while fetching iegc violation messages"},
+            {'name': 'anglViols', 'cxtKeys': ['wideViols', 'adjViols'], 'fetchWeeks': self.fetchAnglViolsSections,
+             'title': 'Angle violations',
+             'fetchDaySlices': self.fetchAnglViolsDaySlices, 'daySlicesToWeeks': self.buildAnglViolsSections,
+             'successMsg': "pair angle separations data context setting complete",
+             'errorMsg': "error while fetching pair angle separations data"},
+            {'name': 'ictCons', 'cxtKeys': ['ictCons'], 'fetchWeeks': self.fetchIctConsSections,
+             'title': 'ICT constraints',
+             'successMsg': "ict constraints data context setting complete",
+             'errorMsg': "error while fetching ict constraints data"},
+            {'name': 'transCons', 'cxtKeys': ['transCons'], 'fetchWeeks': self.fetchTransConsSections,
+             'title': 'Transmission constraints',
+             'successMsg': "transmission constraints data context setting complete",
+             'errorMsg': "error while fetching transmission constraints data"},
+            {'name': 'hvNodes', 'cxtKeys': ['hvNodes'], 'fetchWeeks': self.fetchHvNodesSections,
+             'title': 'High voltage nodes',
+             'successMsg': "HV Nodes data context setting complete",
+             'errorMsg': "error while fetching HV Nodes data"},
+            {'name': 'lvNodes', 'cxtKeys': ['lvNodes'], 'fetchWeeks': self.fetchLvNodesSections,
+             'title': 'Low voltage nodes',
+             'successMsg': "LV Nodes data context setting complete",
+             'errorMsg': "error while fetching LV Nodes data"}
+        ]
+        # single window fetch of each section is its range fetch with one week
+        for section in reportSections:
+            section['fetch'] = partial(fetchSingleWeek, section['fetchWeeks'])
+        return reportSections
+
+    def fetchGenOtgsSections(self, outageEventsFetcher: OutageEventsFetcher, weekWindows: List[Tuple[dt.datetime, dt.datetime]]) -> List[dict]:
+        # get major generating unit outages
+        return [{'genOtgs': otgs} for otgs in outageEventsFetcher.fetchMajorGenUnitOutagesForWeeks(weekWindows)]
+
+    def fetchTransOtgsSections(self, outageEventsFetcher: OutageEventsFetcher, weekWindows: List[Tuple[dt.datetime, dt.datetime]]) -> List[dict]:
+        # get transmission element outages
+        return [{'transOtgs': otgs} for otgs in outageEventsFetcher.fetchTransElOutagesForWeeks(weekWindows)]
+
+    def fetchLongTimeOtgsSections(self, outageEventsFetcher: OutageEventsFetcher, weekWindows: List[Tuple[dt.datetime, dt.datetime]]) -> List[dict]:
+        # get long time unrevived transmission element outages
+        return [{'longTimeOtgs': otgs} for otgs in outageEventsFetcher.fetchLongTimeUnrevivedForcedOutagesForWeeks(weekWindows)]
+
+    def fetchFreqProfileSections(self, weekWindows: List[Tuple[dt.datetime, dt.datetime]]) -> List[dict]:
+        # get freq profile data
+        from src.fetchers.freqProfileFetcher import FrequencyProfileFetcher
+        freqProfFetcher = FrequencyProfileFetcher(self.appDbPool)
+        freqProfiles = freqProfFetcher.fetchDerivedFrequencyForWeeks(weekWindows)
+        return self.toFreqProfileSections(freqProfiles)
+
+    def toFreqProfileSections(self, freqProfiles: List[IFreqProfile]) -> List[dict]:
+        return [{'freqProfRows': freqProfile['freqProfRows'],
+                 'weeklyFdi': "{:0.2f}".format(freqProfile['weeklyFdi'])} for freqProfile in freqProfiles]
 
+    def fetchFreqProfileDaySlices(self, days: List[dt.datetime]) -> List[Any]:
+        from src.fetchers.freqProfileFetcher import FrequencyProfileFetcher
+        freqProfFetcher = FrequencyProfileFetcher(self.appDbPool)
+        return splitIntoDays(freqProfFetcher.fetchDerivedFrequencyDf(days[0], days[-1]), 'DATE_KEY', days)
+
+    def buildFreqProfileSections(self, daySlices: List[Any], weekWindows: List[Tuple[dt.datetime, dt.datetime]]) -> List[dict]:
+        from src.fetchers.freqProfileFetcher import FrequencyProfileFetcher
+        freqProfFetcher = FrequencyProfileFetcher(self.appDbPool)
+        return self.toFreqProfileSections(freqProfFetcher.toFreqProfilesForWeeks(concatDaySlices(daySlices), weekWindows))
+
+    def fetchVdiSections(self, weekWindows: List[Tuple[dt.datetime, dt.datetime]]) -> List[dict]:
         # get stationwise vdi data
-        try:
-            vdiFetcher = VdiFetcher(self.appDbConStr)
-            vdiData: IStationwiseVdi = vdiFetcher.fetchWeeklyVDI(startDate)
-            reportContext['vdi400Rows'] = vdiData['vdi400Rows']
-            reportContext['vdi765Rows'] = vdiData['vdi765Rows']
-            self.appLogger.info(
-                "VDI context setting complete", extra=logExtra)
-        except Exception as err:
-            self.appLogger.error(
-                "error while fetching VDI", exc_info=err, extra=logExtra)
+        from src.fetchers.vdiFetcher import VdiFetcher
+        vdiFetcher = VdiFetcher(self.appDbPool)
+        vdiDataList: List[IStationwiseVdi] = vdiFetcher.fetchWeeklyVDIForWeeks(
+            [startDate for startDate, _ in weekWindows])
+        return [{'vdi400Rows': vdiData['vdi400Rows'],
+                 'vdi765Rows': vdiData['vdi765Rows']} for vdiData in vdiDataList]
 
+    def fetchVoltStatsSections(self, weekWindows: List[Tuple[dt.datetime, dt.datetime]]) -> List[dict]:
         # get stationwise voltage stats
-        try:
-            voltStatsFetcher = VoltStatsFetcher(self.appDbConStr)
-            voltStats: dict = voltStatsFetcher.fetchDerivedVoltage(
-                startDate, endDate)
-            reportContext['voltStats'] = voltStats
-            self.appLogger.info(
-                "stationwise voltage stats context setting complete", extra=logExtra)
-        except Exception as err:
-            self.appLogger.error(
-                "error while fetching stationwise voltage stats", exc_info=err, extra=logExtra)
+        from src.fetchers.voltStatsFetcher import VoltStatsFetcher
+        voltStatsFetcher = VoltStatsFetcher(self.appDbPool)
+        voltStatsList: List[VoltageStatsDict] = voltStatsFetcher.fetchDerivedVoltageForWeeks(
+            weekWindows)
+        return [{'voltStats': voltStats} for voltStats in voltStatsList]
+
+    def fetchVoltStatsDaySlices(self, days: List[dt.datetime]) -> List[Any]:
+        from src.fetchers.voltStatsFetcher import VoltStatsFetcher
+        voltStatsFetcher = VoltStatsFetcher(self.appDbPool)
+        return splitIntoDays(voltStatsFetcher.fetchDerivedVoltageDf(days[0], days[-1]), 'DATE_KEY', days)
 
+    def buildVoltStatsSections(self, daySlices: List[Any], weekWindows: List[Tuple[dt.datetime, dt.datetime]]) -> List[dict]:
+        from src.fetchers.voltStatsFetcher import VoltStatsFetcher
+        voltStatsFetcher = VoltStatsFetcher(self.appDbPool)
+        return [{'voltStats': voltStats} for voltStats in voltStatsFetcher.toVoltStatsForWeeks(concatDaySlices(daySlices), weekWindows)]
+
+    def fetchViolMsgsSections(self, weekWindows: List[Tuple[dt.datetime, dt.datetime]]) -> List[dict]:
         # get iegc violation messages
-        try:
-            violMsgsFetcher = IegcViolMsgsFetcher(self.appDbConStr)
-            violMsgs: List[IIegcViolMsg] = violMsgsFetcher.fetchIegcViolMsgs(
-                startDate, endDate)
-            reportContext['violMsgs'] = violMsgs
-            self.appLogger.info(
-                "iegc violation messages context setting complete", extra=logExtra)
-        except Exception as err:
-            self.appLogger.error(
-                "error while fetching iegc violation messages", exc_info=err, extra=logExtra)
+        from src.fetchers.iegcViolMsgsFetcher import IegcViolMsgsFetcher
+        violMsgsFetcher = IegcViolMsgsFetcher(self.appDbPool)
+        violMsgsList: List[List[IIegcViolMsg]] = violMsgsFetcher.fetchIegcViolMsgsForWeeks(
+            weekWindows)
+        return [{'violMsgs': violMsgs} for violMsgs in violMsgsList]
 
+    def fetchViolMsgsDaySlices(self, days: List[dt.datetime]) -> List[Any]:
+        from src.fetchers.iegcViolMsgsFetcher import IegcViolMsgsFetcher
+        violMsgsFetcher = IegcViolMsgsFetcher(self.appDbPool)
+        return splitIntoDays(violMsgsFetcher.fetchIegcViolMsgsDf(days[0], days[-1]), 'DATE_TIME', days)
+
+    def buildViolMsgsSections(self, daySlices: List[Any], weekWindows: List[Tuple[dt.datetime, dt.datetime]]) -> List[dict]:
+        from src.fetchers.iegcViolMsgsFetcher import IegcViolMsgsFetcher
+        violMsgsFetcher = IegcViolMsgsFetcher(self.appDbPool)
+        return [{'violMsgs': violMsgs} for violMsgs in violMsgsFetcher.toIegcViolMsgsForWeeks(concatDaySlices(daySlices), weekWindows)]
+
+    def fetchAnglViolsSections(self, weekWindows: List[Tuple[dt.datetime, dt.datetime]]) -> List[dict]:
         # get pairs angle violations
-        try:
-            anglViolsFetcher = AnglViolationsFetcher(self.appDbConStr)
-            pairAnglViolations: IAngleViolSummary = anglViolsFetcher.fetchPairsAnglViolations(
-                startDate, endDate)
-            reportContext['wideViols'] = pairAnglViolations['wideAnglViols']
-            reportContext['adjViols'] = pairAnglViolations['adjAnglViols']
-            self.appLogger.info(
-                "pair angle separations data context setting complete", extra=logExtra)
-        except Exception as err:
-            self.appLogger.error(
-                "error while fetching pair angle separations data", exc_info=err, extra=logExtra)
+        from src.fetchers.angleViolFetcher import AnglViolationsFetcher
+        anglViolsFetcher = AnglViolationsFetcher(self.appDbPool)
+        pairAnglViolationsList: List[IAngleViolSummary] = anglViolsFetcher.fetchPairsAnglViolationsForWeeks(
+            weekWindows)
+        return self.toAnglViolsSections(pairAnglViolationsList)
+
+    def toAnglViolsSections(self, pairAnglViolationsList: List[IAngleViolSummary]) -> List[dict]:
+        return [{'wideViols': pairAnglViolations['wideAnglViols'],
+                 'adjViols': pairAnglViolations['adjAnglViols']} for pairAnglViolations in pairAnglViolationsList]
+
+    def fetchAnglViolsDaySlices(self, days: List[dt.datetime]) -> List[Any]:
+        from src.fetchers.angleViolFetcher import AnglViolationsFetcher
+        anglViolsFetcher = AnglViolationsFetcher(self.appDbPool)
+        return splitIntoDays(anglViolsFetcher.fetchPairsAnglViolationsDf(days[0], days[-1]), 'DATA_DATE', days)
+
+    def buildAnglViolsSections(self, daySlices: List[Any], weekWindows: List[Tuple[dt.datetime, dt.datetime]]) -> List[dict]:
+        from src.fetchers.angleViolFetcher import AnglViolationsFetcher
+        anglViolsFetcher = AnglViolationsFetcher(self.appDbPool)
+        return self.toAnglViolsSections(anglViolsFetcher.toAnglViolSummsForWeeks(concatDaySlices(daySlices), weekWindows))
+
+    # constraints and nodes info sections are the latest snapshots, hence they are fetched once for all the weeks
 
+    def fetchIctConsSections(self, weekWindows: List[Tuple[dt.datetime, dt.datetime]]) -> List[dict]:
         # get ict constraints
-        try:
-            ictConsFetcher = IctConstraintsFetcher(self.appDbConStr)
-            ictConsList: List[IIctConstraint] = ictConsFetcher.fetchIctConstraints(
-                startDate, endDate)
-            reportContext['ictCons'] = ictConsList
-            self.appLogger.info(
-                "ict constraints data context setting complete", extra=logExtra)
-        except Exception as err:
-            self.appLogger.error(
-                "error while fetching ict constraints data", exc_info=err, extra=logExtra)
+        from src.fetchers.ictConstraintsFetcher import IctConstraintsFetcher
+        ictConsFetcher = IctConstraintsFetcher(self.appDbPool)
+        ictConsList: List[IIctConstraint] = ictConsFetcher.fetchIctConstraints(
+            weekWindows[0][0], weekWindows[-1][1])
+        return [{'ictCons': ictConsList} for _ in weekWindows]
 
+    def fetchTransConsSections(self, weekWindows: List[Tuple[dt.datetime, dt.datetime]]) -> List[dict]:
         # get transmission constraints
-        try:
-            transConsFetcher = TransConstraintsFetcher(self.appDbConStr)
-            transConsList: List[ITransConstraint] = transConsFetcher.fetchTransConstraints(
-                startDate, endDate)
-            reportContext['transCons'] = transConsList
-            self.appLogger.info(
-                "transmission constraints data context setting complete", extra=logExtra)
-        except Exception as err:
-            self.appLogger.error(
-                "error while fetching transmission constraints data", exc_info=err, extra=logExtra)
+        from src.fetchers.transmissionConstraintsFetcher import TransConstraintsFetcher
+        transConsFetcher = TransConstraintsFetcher(self.appDbPool)
+        transConsList: List[ITransConstraint] = transConsFetcher.fetchTransConstraints(
+            weekWindows[0][0], weekWindows[-1][1])
+        return [{'transCons': transConsList} for _ in weekWindows]
 
+    def fetchHvNodesSections(self, weekWindows: List[Tuple[dt.datetime, dt.datetime]]) -> List[dict]:
         # get HV Nodes Info
-        try:
-            hvNodesFetcher = HvNodesInfoFetcher(self.appDbConStr)
-            hvNodesInfoList: List[IHvNodesInfo] = hvNodesFetcher.fetchHvNodesInfo(
-                startDate, endDate)
-            reportContext['hvNodes'] = hvNodesInfoList
-            self.appLogger.info(
-                "HV Nodes data context setting complete", extra=logExtra)
-        except Exception as err:
-            self.appLogger.error(
-                "error while fetching HV Nodes data", exc_info=err, extra=logExtra)
+        from src.fetchers.hvNodesInfoFetcher import HvNodesInfoFetcher
+        hvNodesFetcher = HvNodesInfoFetcher(self.appDbPool)
+        hvNodesInfoList: List[IHvNodesInfo] = hvNodesFetcher.fetchHvNodesInfo(
+            weekWindows[0][0], weekWindows[-1][1])
+        return [{'hvNodes': hvNodesInfoList} for _ in weekWindows]
 
+    def fetchLvNodesSections(self, weekWindows: List[Tuple[dt.datetime, dt.datetime]]) -> List[dict]:
         # get LV Nodes Info
-        try:
-            lvNodesFetcher = LvNodesInfoFetcher(self.appDbConStr)
-            lvNodesInfoList: List[ILvNodesInfo] = lvNodesFetcher.fetchLvNodesInfo(
-                startDate, endDate)
-            reportContext['lvNodes'] = lvNodesInfoList
-            self.appLogger.info(
-                "LV Nodes data context setting complete", extra=logExtra)
-        except Exception as err:
-            self.appLogger.error(
-                "error while fetching LV Nodes data", exc_info=err, extra=logExtra)
-
-        return reportContext
+        from src.fetchers.lvNodesInfoFetcher import LvNodesInfoFetcher
+        lvNodesFetcher = LvNodesInfoFetcher(self.appDbPool)
+        lvNodesInfoList: List[ILvNodesInfo] = lvNodesFetcher.fetchLvNodesInfo(
+            weekWindows[0][0], weekWindows[-1][1])
+        return [{'lvNodes': lvNodesInfoList} for _ in weekWindows]
 
     def generateReportWithContext(self, reportContext: IReportCxt, tmplPath: str, dumpFolder: str) -> bool:
         """generate the report file at the desired dump folder location 
@@ -240,28 +953,10 @@ class WeeklyReportGenerator:
         Returns:
             bool: True if process is success, else False
         """
-        startDateLogString = dt.datetime.strftime(reportContext['startDtObj'], '%Y-%m-%d')
-        endDateLogString = dt.datetime.strftime(reportContext['endDtObj'], '%Y-%m-%d')
-        logExtra = {"startDate": startDateLogString,
-                    "endDate": endDateLogString}
-        try:
-            doc = DocxTemplate(tmplPath)
-            # # signature Image
-            # signatureImgPath = 'assets/signature.png'
-            # signImg = InlineImage(doc, signatureImgPath)
-            # reportContext['signature'] = signImg
-            doc.render(reportContext)
-            dumpFileName = 'Weekly_no_{0}_{1}_to_{2}.docx'.format(reportContext['wkNum'], dt.datetime.strftime(
-                reportContext['startDtObj'], '%d-%m-%Y'), dt.datetime.strftime(reportContext['endDtObj'], '%d-%m-%Y'))
-            dumpFileFullPath = os.path.join(dumpFolder, dumpFileName)
-            doc.save(dumpFileFullPath)
-        except Exception as err:
-            self.appLogger.error(
-                "error while saving weekly report from context", exc_info=err, extra=logExtra)
-            return False
-        return True
+        return renderReport(reportContext, tmplPath, dumpFolder, artifactStore=self.artifactStore)
 
-    def generateWeeklyReport(self, startDt: dt.datetime, endDt: dt.datetime, tmplPath: str, dumpFolder: str) -> bool:
+    def generateWeeklyReport(self, startDt: dt.datetime, endDt: dt.datetime, tmplPath: str, dumpFolder: str, refreshCache: bool = False,
+                             refreshSections: Optional[List[str]] = None) -> bool:
         """generates and dumps weekly report for given dates at a desired location based on a template file
 
         Args:
@@ -269,13 +964,22 @@ class WeeklyReportGenerator:
             endDt (dt.datetime): end date
             tmplPath (str): full file path of the template file
             dumpFolder (str): folder path where the generated reports are to be dumped
+            refreshCache (bool, optional): fetch all sections from db even if they are present in section cache. Defaults to False.
+            refreshSections (Optional[List[str]], optional): names of the only sections to be fetched from db,
+            other sections are taken from their last saved copy in section cache. Defaults to None.
 
         Returns:
             bool: True if process is success, else False
         """
-        reportCtxt = self.getReportContextObj(startDt, endDt)
-        isSuccess = self.generateReportWithContext(
-            reportCtxt, tmplPath, dumpFolder)
+        appMetrics = getAppMetrics()
+        appMetrics.generationsInFlight.inc()
+        try:
+            reportCtxt = self.getReportContextObj(
+                startDt, endDt, refreshCache, tmplPath, refreshSections)
+            isSuccess = self.generateReportWithContext(
+                reportCtxt, tmplPath, dumpFolder)
+        finally:
+            appMetrics.generationsInFlight.dec()
         # convert report to pdf
         # convert(dumpFileFullPath, dumpFileFullPath.replace('.docx', '.pdf'))
         return isSuccess
@@ -1,8 +1,6 @@
 import logging
-from logstash_async.handler import AsynchronousLogstashHandler
-from logstash_async.formatter import LogstashFormatter
 from logging import Logger
-import pandas as pd
+from src.config.appConfig import getConfigVal
 
 appLogger: Logger = logging.getLogger()
 
@@ -19,11 +17,6 @@ class AppLogger:
 
     @staticmethod
     def initLogger(appConfig: dict):
-        # formatting for log stash
-        logstashFormatter = LogstashFormatter(
-            message_type='python-logstash',
-            extra=dict(application='mis_weekly_report_gen_service'))
-
         # set app logger name and minimum logging level
         appLogger = logging.getLogger('python-logstash-logger')
         appLogger.setLevel(logging.INFO)
@@ -34,9 +27,16 @@ class AppLogger:
         appLogger.addHandler(streamHandler)
 
         # configure logstash logging
-        host = appConfig["logstashHost"]
-        port = appConfig["logstashPort"]
-        if not(pd.isna(host)) and not(pd.isna(port)):
+        host = getConfigVal(appConfig, "logstashHost")
+        port = getConfigVal(appConfig, "logstashPort")
+        if not(host is None) and not(port is None):
+            # logstash libraries are loaded only if logstash is configured
+            from logstash_async.handler import AsynchronousLogstashHandler
+            from logstash_async.formatter import LogstashFormatter
+            # formatting for log stash
+            logstashFormatter = LogstashFormatter(
+                message_type='python-logstash',
+                extra=dict(application='mis_weekly_report_gen_service'))
             logstashHandler = AsynchronousLogstashHandler(
                 host, port, database_path='logstash.db')
             logstashHandler.setFormatter(logstashFormatter)
@@ -1,14 +1,75 @@
-import pandas as pd
+import os
+import json
+import math
+import threading
+from typing import Dict, Tuple
 from src.typeDefs.appConfig import IAppConfig
 
+# parsed config of each config file along with the file modified time at parsing
+configCache: Dict[str, Tuple[float, IAppConfig]] = {}
+configCacheLock = threading.Lock()
+
+
+def loadConfigFile(configFilename: str) -> IAppConfig:
+    """parse the application config file as per its extension.
+    json and toml config files are parsed without importing pandas
+
+    Args:
+        configFilename (str): path of config.xlsx, config.json or config.toml file
 
-def getConfig(configFilename='config.xlsx') -> IAppConfig:
-    """[summary]
-    Get the application config from config.xlsx file
     Returns:
         IAppConfig: The application configuration as a dictionary
     """
-
+    configExt = os.path.splitext(configFilename)[1].lower()
+    if configExt == '.json':
+        with open(configFilename) as f:
+            return json.load(f)
+    if configExt == '.toml':
+        try:
+            import tomllib
+            with open(configFilename, 'rb') as f:
+                return tomllib.load(f)
+        except ImportError:
+            import toml
+            return toml.load(configFilename)
+    import pandas as pd
     df = pd.read_excel(configFilename, header=None, index_col=0)
     configDict = df[1].to_dict()
     return configDict
+
+
+def getConfig(configFilename='config.xlsx') -> IAppConfig:
+    """[summary]
+    Get the application config from config.xlsx file or a json or toml config file.
+    The parsed config is cached and the file is parsed again only if it is modified
+    Returns:
+        IAppConfig: The application configuration as a dictionary
+    """
+    configPath = os.path.abspath(configFilename)
+    configMtime = os.path.getmtime(configPath)
+    with configCacheLock:
+        cachedConfig = configCache.get(configPath, None)
+        if (cachedConfig is None) or not(cachedConfig[0] == configMtime):
+            cachedConfig = (configMtime, loadConfigFile(configPath))
+            configCache[configPath] = cachedConfig
+    # callers get a copy, so that changes by a caller do not leak into the cache
+    return dict(cachedConfig[1])
+
+
+def getConfigVal(appConfig: IAppConfig, key: str, defaultVal=None):
+    """get an optional config value,
+    default value is returned if the key is absent or left blank in the config file
+
+    Args:
+        appConfig (IAppConfig): application config
+        key (str): config key
+        defaultVal ([type], optional): value to be returned if config value is not present. Defaults to None.
+
+    Returns:
+        [type]: config value
+    """
+    val = appConfig.get(key, None)
+    # blank cells of config.xlsx are parsed as nan
+    if val is None or (isinstance(val, float) and math.isnan(val)):
+        return defaultVal
+    return val
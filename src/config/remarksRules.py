@@ -0,0 +1,36 @@
+import re
+import json
+from functools import lru_cache
+from src.typeDefs.remarksRules import IRemarksRules, IRemarksRule
+
+defaultRemarksRulesFilename = 'assets/remarks_rules.json'
+
+
+@lru_cache(maxsize=None)
+def getRemarksRules(rulesFilename: str = defaultRemarksRulesFilename) -> IRemarksRules:
+    """load the outage remarks cleaning rules and compile them into a tag to rule map.
+    Tags are matched case insensitively and the start word regexes are compiled only once per process
+
+    Args:
+        rulesFilename (str, optional): path of the rules json file. Defaults to 'assets/remarks_rules.json'.
+
+    Returns:
+        IRemarksRules: compiled remarks cleaning rules
+    """
+    with open(rulesFilename) as f:
+        rulesSpec = json.load(f)
+
+    tagRules = {}
+    for ruleSpec in rulesSpec['rules']:
+        rule: IRemarksRule = {
+            'undesiredRemarks': frozenset([r.strip().lower() for r in ruleSpec['undesiredRemarks']]),
+            'undesiredStartRegex': re.compile(ruleSpec['undesiredStartRegex'], re.IGNORECASE)
+        }
+        for tag in ruleSpec['tags']:
+            tagRules[tag.strip().lower()] = rule
+
+    rules: IRemarksRules = {
+        'ignoredTags': frozenset([t.strip().lower() for t in rulesSpec.get('ignoredTags', [])]),
+        'tagRules': tagRules
+    }
+    return rules
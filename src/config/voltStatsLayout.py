@@ -0,0 +1,56 @@
+import json
+from functools import lru_cache
+from src.typeDefs.voltStatsLayout import IVoltStatsLayout, IVoltTableLayout
+
+
+def getStnLookupKey(nodeVoltage, nodeName: str) -> str:
+    """get the key for looking up a station of derived voltage data in the layout
+
+    Args:
+        nodeVoltage ([type]): node voltage like 400 or 765
+        nodeName (str): node name, matched case insensitively
+
+    Returns:
+        str: station lookup key
+    """
+    return '{0}|{1}'.format(int(nodeVoltage), str(nodeName).strip().lower())
+
+
+@lru_cache(maxsize=None)
+def getVoltStatsLayout(layoutFilename: str = 'assets/volt_stats_layout.json') -> IVoltStatsLayout:
+    """load the station layout of the daily voltage tables and compile it into a station column index map.
+    Each station of the layout gets one column in the stations array of a day,
+    the layout file is parsed only once per process
+
+    Args:
+        layoutFilename (str, optional): path of the layout json file. Defaults to 'assets/volt_stats_layout.json'.
+
+    Returns:
+        IVoltStatsLayout: compiled daily voltage tables layout
+    """
+    with open(layoutFilename) as f:
+        layoutSpec = json.load(f)
+
+    stnColIndsMap = {}
+    tables = []
+    for tableSpec in layoutSpec['tables']:
+        tableLayout: IVoltTableLayout = {
+            'name': tableSpec['name'],
+            'stnKeys': [],
+            'stnColInds': []
+        }
+        for stnSpec in tableSpec['stations']:
+            lookupKey = getStnLookupKey(stnSpec['voltage'], stnSpec['node'])
+            if lookupKey not in stnColIndsMap:
+                stnColIndsMap[lookupKey] = len(stnColIndsMap)
+            tableLayout['stnKeys'].append(stnSpec['key'])
+            tableLayout['stnColInds'].append(stnColIndsMap[lookupKey])
+        tables.append(tableLayout)
+
+    layout: IVoltStatsLayout = {
+        'missingValue': layoutSpec.get('missingValue', '-'),
+        'tables': tables,
+        'stnColIndsMap': stnColIndsMap,
+        'numStns': len(stnColIndsMap)
+    }
+    return layout
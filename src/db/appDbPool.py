@@ -0,0 +1,151 @@
+import threading
+import time
+from typing import Tuple
+from src.typeDefs.appConfig import IAppConfig
+from src.typeDefs.dbPoolStats import IDbPoolStats
+from src.config.appConfig import getConfigVal
+from src.db.sqliteDataSource import SqliteDataSource
+
+
+def parseConStr(conStr: str) -> Tuple[str, str, str]:
+    """split an oracle connection string of the form user/password@dsn
+
+    Args:
+        conStr (str): connection string
+
+    Returns:
+        Tuple[str, str, str]: user, password, dsn
+    """
+    credentials, dsn = conStr.rsplit('@', 1)
+    user, password = credentials.split('/', 1)
+    return user, password, dsn
+
+
+def initDbSession(connection, requestedTag: str) -> None:
+    """session callback that is called once for every new session created in the pool
+
+    Args:
+        connection ([type]): db connection of the new session
+        requestedTag (str): session tag requested while acquiring
+    """
+    cursor = connection.cursor()
+    cursor.execute("ALTER SESSION SET NLS_DATE_FORMAT = 'YYYY-MM-DD' ")
+    cursor.close()
+
+
+class AppDbPool:
+    """pool of application db sessions to be shared by all the fetchers of the process
+    """
+    __instance = None
+
+    def __init__(self, conStr: str, minSessions: int = 1, maxSessions: int = 4,
+                 sessionTimeoutSecs: int = 0, waitTimeoutMs: int = 30000, callTimeoutMs: int = 0):
+        """constructor method
+
+        Args:
+            conStr (str): connection string of application db in the form user/password@dsn
+            minSessions (int, optional): minimum number of sessions in pool. Defaults to 1.
+            maxSessions (int, optional): maximum number of sessions in pool. Defaults to 4.
+            sessionTimeoutSecs (int, optional): idle sessions are closed after this duration, 0 means never. Defaults to 0.
+            waitTimeoutMs (int, optional): max wait time for acquiring a session when all sessions are busy. Defaults to 30000.
+            callTimeoutMs (int, optional): db round trips taking longer than this are cancelled by the oracle client, 0 means no limit. Defaults to 0.
+        """
+        # oracle client is loaded only when the oracle app db is used,
+        # it is not needed when running on the local sqlite data source
+        try:
+            import cx_Oracle
+        except ImportError:
+            raise Exception("cx_Oracle is not installed, it is needed for the oracle app db")
+        self.dbErrorType = cx_Oracle.DatabaseError
+        self.callTimeoutMs = callTimeoutMs
+        user, password, dsn = parseConStr(conStr)
+        self.pool = cx_Oracle.SessionPool(user=user, password=password, dsn=dsn,
+                                          min=minSessions, max=maxSessions, increment=1,
+                                          threaded=True, getmode=cx_Oracle.SPOOL_ATTRVAL_TIMEDWAIT,
+                                          wait_timeout=waitTimeoutMs, timeout=sessionTimeoutSecs,
+                                          sessionCallback=initDbSession)
+        self.statsLock = threading.Lock()
+        self.numAcquires = 0
+        self.numAcquireTimeouts = 0
+        self.totalAcquireWaitSecs = 0.0
+        self.maxAcquireWaitSecs = 0.0
+
+    def acquire(self):
+        """acquire a db connection from the pool, session NLS settings are already applied
+
+        Returns:
+            [type]: db connection, to be released back with the release method
+        """
+        waitStartTime = time.time()
+        try:
+            connection = self.pool.acquire()
+        except self.dbErrorType:
+            with self.statsLock:
+                self.numAcquireTimeouts += 1
+            raise
+        # queries of sections abandoned at the generation deadline are cancelled in db also
+        connection.callTimeout = self.callTimeoutMs
+        waitSecs = time.time() - waitStartTime
+        with self.statsLock:
+            self.numAcquires += 1
+            self.totalAcquireWaitSecs += waitSecs
+            self.maxAcquireWaitSecs = max(self.maxAcquireWaitSecs, waitSecs)
+        return connection
+
+    def release(self, connection) -> None:
+        """release a db connection back to the pool
+
+        Args:
+            connection ([type]): db connection acquired from the pool
+        """
+        self.pool.release(connection)
+
+    def getStats(self) -> IDbPoolStats:
+        """get the pool size and session acquire wait statistics
+
+        Returns:
+            IDbPoolStats: pool statistics
+        """
+        with self.statsLock:
+            avgWaitSecs = 0 if self.numAcquires == 0 else self.totalAcquireWaitSecs / self.numAcquires
+            return {
+                'minSessions': self.pool.min,
+                'maxSessions': self.pool.max,
+                'openedSessions': self.pool.opened,
+                'busySessions': self.pool.busy,
+                'sessionTimeoutSecs': self.pool.timeout,
+                'waitTimeoutMs': self.pool.wait_timeout,
+                'numAcquires': self.numAcquires,
+                'numAcquireTimeouts': self.numAcquireTimeouts,
+                'maxAcquireWaitSecs': self.maxAcquireWaitSecs,
+                'avgAcquireWaitSecs': avgWaitSecs
+            }
+
+    @staticmethod
+    def getInstance():
+        """ Static access method. """
+        if AppDbPool.__instance == None:
+            raise Exception("app db pool is not yet initialized")
+        return AppDbPool.__instance
+
+    @staticmethod
+    def initPool(appConfig: IAppConfig):
+        if AppDbPool.__instance == None and getConfigVal(appConfig, 'appDbType', 'oracle') == 'sqlite':
+            # local sqlite stand-in of application db for offline testing and benchmarking
+            AppDbPool.__instance = SqliteDataSource(appConfig['sqliteDbPath'])
+        elif AppDbPool.__instance == None:
+            AppDbPool.__instance = AppDbPool(appConfig['appDbConStr'],
+                                             minSessions=int(getConfigVal(appConfig, 'dbPoolMinSessions', 1)),
+                                             maxSessions=int(getConfigVal(appConfig, 'dbPoolMaxSessions', 4)),
+                                             sessionTimeoutSecs=int(getConfigVal(appConfig, 'dbPoolSessionTimeoutSecs', 0)),
+                                             waitTimeoutMs=int(getConfigVal(appConfig, 'dbPoolWaitTimeoutMs', 30000)),
+                                             callTimeoutMs=int(getConfigVal(appConfig, 'dbCallTimeoutMs', 0)))
+
+
+def initAppDbPool(appConfig: IAppConfig) -> AppDbPool:
+    AppDbPool.initPool(appConfig)
+    return AppDbPool.getInstance()
+
+
+def getAppDbPool() -> AppDbPool:
+    return AppDbPool.getInstance()
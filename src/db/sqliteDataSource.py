@@ -0,0 +1,114 @@
+import sqlite3
+import threading
+import time
+import datetime as dt
+from src.typeDefs.dbPoolStats import IDbPoolStats
+
+# store datetimes as sortable text and read back the declared date columns as datetimes
+sqlite3.register_adapter(dt.datetime, lambda d: d.strftime('%Y-%m-%d %H:%M:%S'))
+sqlite3.register_adapter(dt.date, lambda d: d.strftime('%Y-%m-%d 00:00:00'))
+sqlite3.register_converter('TIMESTAMP', lambda b: dt.datetime.fromisoformat(b.decode()))
+
+
+def toDateStr(dateVal, dateFormat: str = None) -> str:
+    """sql function like oracle to_date with NLS_DATE_FORMAT 'YYYY-MM-DD', 
+    that truncates a date value to the start of the day
+
+    Args:
+        dateVal ([type]): date value as text
+        dateFormat (str, optional): format of the date text, not used since values are always stored as ISO text. Defaults to None.
+
+    Returns:
+        str: date text like 2020-08-10 00:00:00
+    """
+    if dateVal is None:
+        return None
+    return str(dateVal)[0:10] + ' 00:00:00'
+
+
+class UpperCaseCursor(sqlite3.Cursor):
+    """cursor that reports column names in upper case like oracle
+    """
+    @property
+    def description(self):
+        desc = super().description
+        if desc is None:
+            return None
+        return tuple((c[0].upper(),) + tuple(c[1:]) for c in desc)
+
+
+class WarehouseConnection(sqlite3.Connection):
+    def cursor(self, factory=UpperCaseCursor):
+        return super().cursor(factory)
+
+
+class SqliteDataSource:
+    """local sqlite stand-in for the application db pool with the same acquire and release interface.
+    The db file is attached as mis_warehouse schema also, so that the fetcher queries run unchanged
+    """
+    # class of the opened db connections
+    connectionFactory = WarehouseConnection
+
+    def __init__(self, dbPath: str):
+        """constructor method
+
+        Args:
+            dbPath (str): path of the sqlite db file
+        """
+        self.dbPath = dbPath
+        self.statsLock = threading.Lock()
+        self.numAcquires = 0
+        self.numBusy = 0
+        self.totalAcquireWaitSecs = 0.0
+        self.maxAcquireWaitSecs = 0.0
+
+    def acquire(self):
+        """open a db connection
+
+        Returns:
+            [type]: db connection, to be released back with the release method
+        """
+        waitStartTime = time.time()
+        connection = sqlite3.connect(self.dbPath, detect_types=sqlite3.PARSE_DECLTYPES,
+                                     factory=self.connectionFactory, check_same_thread=False)
+        connection.create_function('to_date', 1, toDateStr)
+        connection.create_function('to_date', 2, toDateStr)
+        connection.execute("ATTACH DATABASE ? AS mis_warehouse", (self.dbPath,))
+        waitSecs = time.time() - waitStartTime
+        with self.statsLock:
+            self.numAcquires += 1
+            self.numBusy += 1
+            self.totalAcquireWaitSecs += waitSecs
+            self.maxAcquireWaitSecs = max(self.maxAcquireWaitSecs, waitSecs)
+        return connection
+
+    def release(self, connection) -> None:
+        """close a db connection
+
+        Args:
+            connection ([type]): db connection acquired from this data source
+        """
+        connection.close()
+        with self.statsLock:
+            self.numBusy -= 1
+
+    def getStats(self) -> IDbPoolStats:
+        """get the connection statistics in the format of db pool statistics
+
+        Returns:
+            IDbPoolStats: connection statistics
+        """
+        with self.statsLock:
+            avgWaitSecs = 0 if self.numAcquires == 0 else self.totalAcquireWaitSecs / self.numAcquires
+            return {
+                'minSessions': 0,
+                'maxSessions': 0,
+                'openedSessions': self.numBusy,
+                'busySessions': self.numBusy,
+                'sessionTimeoutSecs': 0,
+                'waitTimeoutMs': 0,
+                'numAcquires': self.numAcquires,
+                'numAcquireTimeouts': 0,
+                'maxAcquireWaitSecs': self.maxAcquireWaitSecs,
+                'avgAcquireWaitSecs': avgWaitSecs
+            }
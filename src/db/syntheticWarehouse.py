@@ -0,0 +1,217 @@
+'''
+Generates a local sqlite stand-in of the mis_warehouse tables read by the fetchers,
+filled with seeded synthetic data at a multiple of production volume.
+usage: python -m src.db.syntheticWarehouse --db_path mis_warehouse.db --scale 10
+'''
+import argparse
+import os
+import sqlite3
+import datetime as dt
+import numpy as np
+from typing import List
+from src.db.sqliteDataSource import SqliteDataSource
+from src.config.voltStatsLayout import getVoltStatsLayout
+
+# schema of the mis_warehouse tables read by the fetchers, date columns are declared as TIMESTAMP
+warehouseTablesSql: List[str] = [
+    '''create table outage_events (ID integer primary key, ELEMENT_NAME text, OWNERS text, CAPACITY real,
+    OUTAGE_DATETIME TIMESTAMP, REVIVED_DATETIME TIMESTAMP, OUTAGE_REMARKS text, REASON text,
+    SHUTDOWN_TAG text, ENTITY_NAME text, SHUTDOWN_TYPENAME text)''',
+    '''create table derived_frequency (ID integer primary key, DATE_KEY TIMESTAMP, MAXIMUM real, MINIMUM real,
+    AVERAGE real, LESS_THAN_BAND real, BETWEEN_BAND real, GREATER_THAN_BAND real, OUT_OF_BAND real,
+    OUT_OF_BAND_INHRS real, FDI real)''',
+    '''create table voltage_mapping_table (ID integer primary key, NODE_NAME text, NODE_VOLTAGE integer,
+    IS_INCLUDED_IN_DAILY_VOLTAGE text, IS_INCLUDED_IN_WEEKLY_VDI text)''',
+    '''create table derived_voltage (ID integer primary key, MAPPING_ID integer, DATE_KEY TIMESTAMP,
+    NODE_NAME text, MAXIMUM real, MINIMUM real)''',
+    '''create table derived_vdi (ID integer primary key, MAPPING_ID integer, WEEK_START_DATE TIMESTAMP,
+    NODE_NAME text, NODE_VOLTAGE integer, MAXIMUM real, MINIMUM real, LESS_THAN_BAND real, BETWEEN_BAND real,
+    GREATER_THAN_BAND real, LESS_THAN_BAND_INHRS real, GREATER_THAN_BAND_INHRS real, OUT_OF_BAND_INHRS real, VDI real)''',
+    '''create table daily_angles_data (ID integer primary key, DATA_DATE TIMESTAMP, ANGLE_PAIR text,
+    ANGULAR_LIMIT real, VIOL_PERC real, MAX_VIOL real, MIN_VIOL real, DATA_TYPE text)''',
+    '''create table IEGC_VIOLATION_MESSAGE_DATA (ID integer primary key, MESSAGE text, DATE_TIME TIMESTAMP,
+    ENTITY text, SCHEDULE real, DRAWAL real, DEVIATION real)''',
+    '''create table ict_constraint_data (ID integer primary key, START_DATE TIMESTAMP, ICT text,
+    SEASON_ANTECEDENT text, DESCRIPTION_CONSTRAINTS text)''',
+    '''create table transmission_constraint_data (ID integer primary key, START_DATE TIMESTAMP, CORRIDOR text,
+    SEASON_ANTECEDENT text, DESCRIPTION_CONSTRAINTS text)''',
+    '''create table nodes_high_voltage_data (ID integer primary key, START_DATE TIMESTAMP, NODES text,
+    SEASON_ANTECEDENT text, DESCRIPTION_CONSTRAINTS text)''',
+    '''create table nodes_low_voltage_data (ID integer primary key, START_DATE TIMESTAMP, NODES text,
+    SEASON_ANTECEDENT text, DESCRIPTION_CONSTRAINTS text)''',
+    'create index idx_outage_events_out_dt on outage_events (OUTAGE_DATETIME)',
+    'create index idx_outage_events_rev_dt on outage_events (REVIVED_DATETIME)',
+    'create index idx_derived_frequency_dt on derived_frequency (DATE_KEY)',
+    'create index idx_derived_voltage_dt on derived_voltage (DATE_KEY)',
+    'create index idx_derived_vdi_dt on derived_vdi (WEEK_START_DATE)',
+    'create index idx_daily_angles_data_dt on daily_angles_data (DATA_DATE)',
+    'create index idx_iegc_msgs_dt on IEGC_VIOLATION_MESSAGE_DATA (DATE_TIME)'
+]
+
+# production volume of the entities per day or per snapshot, multiplied by scale
+numOutagesPerDay = 40
+numVoltNodes = 60
+numAnglePairs = 25
+numIegcMsgsPerDay = 8
+numConstraintsPerSnapshot = 15
+
+owners = ['NTPC', 'PGCIL', 'MSETCL', 'GETCO', 'MPPTCL', 'CSPTCL', 'ADANI', 'TORRENT', None]
+outageTags = ['Outage', 'RSD', 'Voltage Regulation', 'Manually opened due to high voltage',
+              'Annual Maintenance', 'Tripped', None]
+outageReasons = ['RSD', 'VR', 'MOHV', 'Boiler tube leakage', 'Coal shortage', 'Distance protection operated',
+                 'Annual maintenance', 'High voltage', None]
+outageRemarks = ['rsd.', 'vr. to control voltage', 'MOHV', 'Due to low demand', 'Hand tripped', '', None]
+seasons = ['Summer', 'Monsoon', 'Winter', 'Peak demand', 'Low demand']
+
+
+def createWarehouseSchema(connection) -> None:
+    """create the mis_warehouse tables read by the fetchers
+
+    Args:
+        connection ([type]): sqlite db connection
+    """
+    for tableSql in warehouseTablesSql:
+        connection.execute(tableSql)
+
+
+def generateSyntheticWarehouse(dbPath: str, startDate: dt.datetime, endDate: dt.datetime, scale: int = 1, seed: int = 0) -> SqliteDataSource:
+    """create a sqlite db with synthetic mis_warehouse data between start and end dates.
+    Same seed and scale always generate the same data
+
+    Args:
+        dbPath (str): path of the sqlite db file to be created, existing file is replaced
+        startDate (dt.datetime): start date of data
+        endDate (dt.datetime): end date of data
+        scale (int, optional): multiple of production data volume, like 1, 10 or 100. Defaults to 1.
+        seed (int, optional): seed of random data. Defaults to 0.
+
+    Returns:
+        SqliteDataSource: data source of the created db
+    """
+    if os.path.exists(dbPath):
+        os.remove(dbPath)
+    rnd = np.random.RandomState(seed)
+    days = [startDate + dt.timedelta(days=d) for d in range((endDate - startDate).days + 1)]
+    numDays = len(days)
+
+    con = sqlite3.connect(dbPath)
+    createWarehouseSchema(con)
+
+    # frequency, one row per day
+    maxF = 50.05 + rnd.rand(numDays)*0.2
+    minF = 49.95 - rnd.rand(numDays)*0.2
+    lessBand = rnd.rand(numDays)*5
+    greatBand = rnd.rand(numDays)*15
+    outBand = lessBand + greatBand
+    outHrs = outBand*24/100
+    con.executemany('insert into derived_frequency values (?,?,?,?,?,?,?,?,?,?,?)',
+                    [(i+1, days[i], maxF[i], minF[i], 50 + rnd.randn()*0.01, lessBand[i], 100 - outBand[i],
+                      greatBand[i], outBand[i], outHrs[i], outHrs[i]/24) for i in range(numDays)])
+
+    # voltage nodes, stations of daily voltage tables layout are always present
+    layoutStns = [k.split('|') for k in getVoltStatsLayout()['stnColIndsMap'].keys()]
+    voltNodes = [(n.title(), int(v)) for v, n in layoutStns]
+    voltNodes += [('Node{0}'.format(i), [400, 765][i % 2])
+                  for i in range(max(numVoltNodes*scale - len(voltNodes), 0))]
+    con.executemany('insert into voltage_mapping_table values (?,?,?,?,?)',
+                    [(i+1, n, v, 'T' if i < len(layoutStns) else 'F', 'T' if i % 3 > 0 or i < len(layoutStns) else 'F')
+                     for i, (n, v) in enumerate(voltNodes)])
+    voltRows = []
+    for dayInd, day in enumerate(days):
+        nomVolts = np.array([v for _, v in voltNodes], dtype=float)
+        maxVolts = nomVolts*(1.02 + rnd.rand(len(voltNodes))*0.04)
+        minVolts = nomVolts*(0.96 + rnd.rand(len(voltNodes))*0.03)
+        for nodeInd, (nodeName, _) in enumerate(voltNodes):
+            # data of a few nodes is missing for some days
+            if rnd.rand() < 0.02:
+                continue
+            voltRows.append((len(voltRows)+1, nodeInd+1, day, nodeName,
+                             maxVolts[nodeInd], minVolts[nodeInd]))
+    con.executemany('insert into derived_voltage values (?,?,?,?,?,?)', voltRows)
+
+    # weekly vdi of each node for the weeks starting on mondays
+    vdiRows = []
+    for day in [d for d in days if d.weekday() == 0]:
+        for nodeInd, (nodeName, nodeVolt) in enumerate(voltNodes):
+            lessBand, greatBand = rnd.rand()*5, rnd.rand()*20
+            vdiRows.append((len(vdiRows)+1, nodeInd+1, day, nodeName, nodeVolt, nodeVolt*(1.02 + rnd.rand()*0.04),
+                            nodeVolt*(0.96 + rnd.rand()*0.03), lessBand, 100-lessBand-greatBand, greatBand,
+                            lessBand*168/100, greatBand*168/100, (lessBand+greatBand)*168/100, (lessBand+greatBand)/100))
+    con.executemany('insert into derived_vdi values (?,?,?,?,?,?,?,?,?,?,?,?,?,?)', vdiRows)
+
+    # daily wide and adjacent angle violations of station pairs
+    anglePairs = ['{0}-{1}'.format(voltNodes[i % len(voltNodes)][0], voltNodes[(i*7+3) % len(voltNodes)][0])
+                  for i in range(numAnglePairs*scale)]
+    angleRows = []
+    for day in days:
+        for pair in anglePairs:
+            for anglType in ['wide', 'adj']:
+                angleRows.append((len(angleRows)+1, day, pair,
+                                  None if rnd.rand() < 0.05 else float(rnd.randint(20, 40)),
+                                  None if rnd.rand() < 0.3 else rnd.rand()*10, rnd.rand()*50, rnd.rand()*5, anglType))
+    con.executemany('insert into daily_angles_data values (?,?,?,?,?,?,?,?)', angleRows)
+
+    # iegc violation messages
+    msgRows = []
+    for day in days:
+        for _ in range(rnd.poisson(numIegcMsgsPerDay*scale)):
+            schedule = rnd.rand()*3000
+            drawal = schedule + rnd.randn()*300
+            msgRows.append((len(msgRows)+1, 'WR-{0}'.format(len(msgRows)+1), day,
+                            owners[rnd.randint(0, len(owners)-1)] if rnd.rand() > 0.02 else 'nan',
+                            schedule, drawal, drawal-schedule))
+    con.executemany('insert into IEGC_VIOLATION_MESSAGE_DATA values (?,?,?,?,?,?,?)', msgRows)
+
+    # outage events, including long running forced outages that started before the data start date
+    entities = [('GENERATING_UNIT', [210, 250, 500, 660, 800, 50]), ('AC_TRANSMISSION_LINE_CIRCUIT', [220, 400, 765]),
+                ('ICT', [315, 500, 1500]), ('BUS', [400]), ('HVDC_POLE', [500])]
+    otgRows = []
+    numOtgs = numOutagesPerDay*scale*numDays
+    otgHrs = rnd.lognormal(3, 1.5, numOtgs)
+    for otgInd in range(numOtgs):
+        entityName, capacities = entities[rnd.randint(0, len(entities))]
+        outageDt = (startDate - dt.timedelta(days=400)) + dt.timedelta(
+            seconds=int(rnd.rand()*((endDate - startDate).days + 400)*86400))
+        shutdownType = ['FORCED', 'PLANNED'][rnd.randint(0, 2)]
+        revivalDt = outageDt + dt.timedelta(hours=float(otgHrs[otgInd]))
+        if revivalDt > endDate or (shutdownType == 'FORCED' and rnd.rand() < 0.01):
+            revivalDt = None
+        otgRows.append((otgInd+1, '{0}_{1}'.format(entityName, rnd.randint(0, 500*scale)),
+                        owners[rnd.randint(0, len(owners))], float(capacities[rnd.randint(0, len(capacities))]),
+                        outageDt, revivalDt, outageRemarks[rnd.randint(0, len(outageRemarks))],
+                        outageReasons[rnd.randint(0, len(outageReasons))], outageTags[rnd.randint(0, len(outageTags))],
+                        entityName, shutdownType))
+    con.executemany('insert into outage_events values (?,?,?,?,?,?,?,?,?,?,?)', otgRows)
+
+    # monthly snapshots of constraints and nodes info
+    snapshotDays = [d for d in days if d.day == 1] or [days[0]]
+    for tableName in ['ict_constraint_data', 'transmission_constraint_data', 'nodes_high_voltage_data', 'nodes_low_voltage_data']:
+        snapshotRows = []
+        for snapshotDay in snapshotDays:
+            for _ in range(numConstraintsPerSnapshot*scale):
+                snapshotRows.append((len(snapshotRows)+1, snapshotDay,
+                                     '{0} - {1}'.format(voltNodes[rnd.randint(0, len(voltNodes))][0],
+                                                        voltNodes[rnd.randint(0, len(voltNodes))][0]),
+                                     seasons[rnd.randint(0, len(seasons))],
+                                     'N-1 contingency of {0} leads to overloading'.format(anglePairs[rnd.randint(0, len(anglePairs))])))
+        con.executemany('insert into {0} values (?,?,?,?,?)'.format(tableName), snapshotRows)
+    con.commit()
+    con.close()
+    return SqliteDataSource(dbPath)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--db_path', help="path of the sqlite db file to be created",
+                        default='mis_warehouse.db')
+    parser.add_argument('--start_date', help="Enter Start date in yyyy-mm-dd format",
+                        default='2020-04-01')
+    parser.add_argument('--end_date', help="Enter last date in yyyy-mm-dd format",
+                        default='2021-03-31')
+    parser.add_argument('--scale', help="multiple of production data volume like 1, 10 or 100",
+                        type=int, default=1)
+    parser.add_argument('--seed', help="seed of random data", type=int, default=0)
+    args = parser.parse_args()
+    generateSyntheticWarehouse(args.db_path, dt.datetime.strptime(args.start_date, '%Y-%m-%d'),
+                               dt.datetime.strptime(args.end_date, '%Y-%m-%d'), args.scale, args.seed)
+    print('synthetic mis_warehouse db created at {0}'.format(args.db_path))
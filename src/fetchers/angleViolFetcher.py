@@ -1,9 +1,10 @@
-import cx_Oracle
 import pandas as pd
 import datetime as dt
 from typing import List, Tuple
+from src.db.appDbPool import AppDbPool
 from src.typeDefs.angleViolSummary import IAngleViolSummary
 from src.typeDefs.angleViolation import IAngleViolation
+from src.utils.dfUtils import buildRowsFromColumns, toRound2, partitionByWeeks
 from src.appLogger import getAppLogger
 
 
@@ -11,13 +12,13 @@ class AnglViolationsFetcher():
     """This class fetches Wide angle and adjescent angle violations summary for weekly report
     """
 
-    def __init__(self, con_string: str):
+    def __init__(self, dbPool: AppDbPool):
         """constructor method
         Args:
-            con_string ([str]): connection string
+            dbPool (AppDbPool): pool of application db connections
         """
 
-        self.connString = con_string
+        self.dbPool = dbPool
         self.appLogger = getAppLogger()
 
     def fetchPairsAnglViolations(self, startDate: dt.datetime, endDate: dt.datetime) -> IAngleViolSummary:
@@ -29,80 +30,95 @@ class AnglViolationsFetcher():
         Returns:
             IAngleViolSummary: wide and adjescent angle violations summary for station pairs of the given time window
         """
+        return self.fetchPairsAnglViolationsForWeeks([(startDate, endDate)])[0]
+
+    def toAnglViolsSummary(self, df: pd.core.frame.DataFrame) -> List[IAngleViolation]:
+        """summarize daily angle violations of station pairs as
+        max angular limit, average violation percentage, max of max violation and min of min violation
+        ordered by angle pair
+        Args:
+            df (pd.core.frame.DataFrame): daily angle violations data
+        Returns:
+            List[IAngleViolation]: angle violations summary of each station pair
+        """
+        summDf = df.groupby('ANGLE_PAIR', sort=True).agg(
+            ANG_LIM=('ANG_LIM', 'max'), VIOL_PERC=('VIOL_PERC', 'mean'),
+            MAX_VIOL=('MAX_VIOL', 'max'), MIN_VIOL=('MIN_VIOL', 'min')).reset_index()
+        return buildRowsFromColumns(summDf, {
+            'pairName': ('ANGLE_PAIR', None),
+            'angularLim': ('ANG_LIM', toRound2),
+            'violPerc': ('VIOL_PERC', toRound2),
+            'maxDeg': ('MAX_VIOL', toRound2),
+            'minDeg': ('MIN_VIOL', toRound2)
+        })
+
+    def fetchPairsAnglViolationsForWeeks(self, weekWindows: List[Tuple[dt.datetime, dt.datetime]]) -> List[IAngleViolSummary]:
+        """fetch daily angle violations of many weeks in a single query and
+        summarize them for each week in the format of IAngleViolSummary
+        Args:
+            weekWindows (List[Tuple[dt.datetime, dt.datetime]]): (start date, end date) of each week in ascending order
+        Returns:
+            List[IAngleViolSummary]: wide and adjescent angle violations summary for station pairs of each week
+        """
+        try:
+            df = self.fetchPairsAnglViolationsDf(weekWindows[0][0], weekWindows[-1][1])
+        except Exception:
+            return [{'wideAnglViols': [], 'adjAnglViols': []} for _ in weekWindows]
+        return self.toAnglViolSummsForWeeks(df, weekWindows)
+
+    def toAnglViolSummsForWeeks(self, df: pd.core.frame.DataFrame, weekWindows: List[Tuple[dt.datetime, dt.datetime]]) -> List[IAngleViolSummary]:
+        """summarize the daily angle violations for each week
+        Args:
+            df (pd.core.frame.DataFrame): daily angle violations of all the weeks
+            weekWindows (List[Tuple[dt.datetime, dt.datetime]]): (start date, end date) of each week in ascending order
+        Returns:
+            List[IAngleViolSummary]: wide and adjescent angle violations summary for station pairs of each week
+        """
+        weekViolSumms: List[IAngleViolSummary] = []
+        for weekDf in partitionByWeeks(df, 'DATA_DATE', weekWindows):
+            violSumm: IAngleViolSummary = {
+                'wideAnglViols': self.toAnglViolsSummary(weekDf[weekDf['DATA_TYPE'] == 'wide']),
+                'adjAnglViols': self.toAnglViolsSummary(weekDf[weekDf['DATA_TYPE'] == 'adj'])
+            }
+            weekViolSumms.append(violSumm)
+        return weekViolSumms
+
+    def fetchPairsAnglViolationsDf(self, startDate: dt.datetime, endDate: dt.datetime) -> pd.core.frame.DataFrame:
+        """fetch the daily wide and adjescent angle violations of the days between start and end dates
+        Args:
+            startDate (dt.datetime): start date
+            endDate (dt.datetime): end date
+        Returns:
+            pd.core.frame.DataFrame: daily angle violations of station pairs
+        """
         startDateLogString = dt.datetime.strftime(startDate, '%Y-%m-%d')
         endDateLogString = dt.datetime.strftime(endDate, '%Y-%m-%d')
         logExtra = {"startDate": startDateLogString,
                     "endDate": endDateLogString}
+        connection = self.dbPool.acquire()
         try:
-            connection = cx_Oracle.connect(self.connString)
-            cursor = connection.cursor()
-
             sql_fetch = """ 
-                        SELECT angle_pair, MAX(angular_limit) as ang_lim,
-                            AVG(viol_perc) as viol_perc, MAX(max_viol) as max_viol,
-                            MIN(min_viol) as min_viol
-                        FROM (
-                                SELECT id, data_date, angle_pair,
-                                    coalesce(angular_limit, 0) AS angular_limit,
-                                    coalesce(viol_perc, 0) AS viol_perc,
-                                    max_viol,
-                                    min_viol,
-                                    data_type
-                                FROM mis_warehouse.daily_angles_data
-                                WHERE 
-                                data_type = :anglType and 
-                                data_date between to_date(:start_date) and to_date(:end_date)
-                            ) angl_data
-                        GROUP BY angle_pair 
-                        ORDER BY angle_pair
+                        SELECT data_date, angle_pair,
+                            coalesce(angular_limit, 0) AS ang_lim,
+                            coalesce(viol_perc, 0) AS viol_perc,
+                            max_viol,
+                            min_viol,
+                            data_type
+                        FROM mis_warehouse.daily_angles_data
+                        WHERE 
+                        data_type in ('wide', 'adj') and 
+                        data_date between to_date(:start_date) and to_date(:end_date)
                         """
-            cursor.execute("ALTER SESSION SET NLS_DATE_FORMAT = 'YYYY-MM-DD' ")
-            wideAnglDf = pd.read_sql(sql_fetch, params={
-                'start_date': startDate, 'end_date': endDate, 'anglType': 'wide'}, con=connection)
-            adjAnglDf = pd.read_sql(sql_fetch, params={
-                'start_date': startDate, 'end_date': endDate, 'anglType': 'adj'}, con=connection)
+            df = pd.read_sql(sql_fetch, params={
+                'start_date': startDate, 'end_date': endDate}, con=connection)
         except Exception as err:
             # print('Error while fetching pair angle violation data from db')
             # print(e)
             self.appLogger.error(
                 'error while executing angle pairs sepration data fetch sql', exc_info=err, extra=logExtra)
-            res: IAngleViolSummary = {
-                'wideAnglViols': [],
-                'adjAnglViols': []
-            }
-            return res
+            raise
         finally:
-            # closing database cursor and connection
-            if cursor is not None:
-                cursor.close()
-            connection.close()
-            print('closed db connection after pair angle violation data fetching')
-
-        wideAnglViols: List[IAngleViolation] = []
-        for i in wideAnglDf.index:
-            pairViol: IAngleViolation = {
-                'pairName': wideAnglDf['ANGLE_PAIR'][i],
-                'angularLim': round(wideAnglDf['ANG_LIM'][i], 2),
-                'violPerc': round(wideAnglDf['VIOL_PERC'][i], 2),
-                'maxDeg': round(wideAnglDf['MAX_VIOL'][i], 2),
-                'minDeg': round(wideAnglDf['MIN_VIOL'][i], 2),
-            }
-            wideAnglViols.append(pairViol)
-
-        adjAngViols: List[IAngleViolation] = []
-        for i in adjAnglDf.index:
-            pairViol = {
-                'pairName': adjAnglDf['ANGLE_PAIR'][i],
-                'angularLim': round(adjAnglDf['ANG_LIM'][i], 2),
-                'violPerc': round(adjAnglDf['VIOL_PERC'][i], 2),
-                'maxDeg': round(adjAnglDf['MAX_VIOL'][i], 2),
-                'minDeg': round(adjAnglDf['MIN_VIOL'][i], 2),
-            }
-            adjAngViols.append(pairViol)
-
-        violSumm: IAngleViolSummary = {
-            'wideAnglViols': wideAnglViols,
-            'adjAnglViols': adjAngViols
-        }
-
-        return violSumm
+            # releasing database connection back to the pool
+            self.dbPool.release(connection)
+            print('released db connection after pair angle violation data fetching')
+        return df
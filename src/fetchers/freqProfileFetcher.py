@@ -1,9 +1,10 @@
-import cx_Oracle
 import pandas as pd
 import datetime as dt
 from typing import List, Tuple
+from src.db.appDbPool import AppDbPool
 from src.typeDefs.dayFreqProfile import IDayFreqProfile
 from src.typeDefs.freqProfileData import IFreqProfile
+from src.utils.dfUtils import buildRowsFromColumns, toFixed2Strs, partitionByWeeks
 from src.appLogger import getAppLogger
 
 
@@ -11,12 +12,12 @@ class FrequencyProfileFetcher():
     """This class fetches derived frequency for frequency profile section in weekly report
     """
 
-    def __init__(self, con_string: str):
+    def __init__(self, dbPool: AppDbPool):
         """constructor method
         Args:
-            con_string ([str]): connection string
+            dbPool (AppDbPool): pool of application db connections
         """
-        self.connString = con_string
+        self.dbPool = dbPool
         self.appLogger = getAppLogger()
 
     def toContextDict(self, df: pd.core.frame.DataFrame) -> IFreqProfile:
@@ -39,22 +40,19 @@ class FrequencyProfileFetcher():
         del df['ID']
         df['DATE_KEY'] = df['DATE_KEY'].dt.day
 
-        derFreqRows = []
         weeklyFDI = (df['OUT_OF_BAND_INHRS'].sum())/168
-        for ind in df.index:
-            tempDict = {
-                'date_day': df['DATE_KEY'][ind],
-                'max_freq': "{:0.2f}".format(df['MAXIMUM'][ind]),
-                'min_freq': "{:0.2f}".format(df['MINIMUM'][ind]),
-                'avg_freq': "{:0.2f}".format(df['AVERAGE'][ind]),
-                'less_than_band': "{:0.2f}".format(df['LESS_THAN_BAND'][ind]),
-                'bw_band': "{:0.2f}".format(df['BETWEEN_BAND'][ind]),
-                'great_than_band': "{:0.2f}".format(df['GREATER_THAN_BAND'][ind]),
-                'out_of_band': "{:0.2f}".format(df['OUT_OF_BAND'][ind]),
-                'out_hrs': "{:0.2f}".format(df['OUT_OF_BAND_INHRS'][ind]),
-                'fdi': "{:0.2f}".format(df['FDI'][ind])
-            }
-            derFreqRows.append(tempDict)
+        derFreqRows: List[IDayFreqProfile] = buildRowsFromColumns(df, {
+            'date_day': ('DATE_KEY', None),
+            'max_freq': ('MAXIMUM', toFixed2Strs),
+            'min_freq': ('MINIMUM', toFixed2Strs),
+            'avg_freq': ('AVERAGE', toFixed2Strs),
+            'less_than_band': ('LESS_THAN_BAND', toFixed2Strs),
+            'bw_band': ('BETWEEN_BAND', toFixed2Strs),
+            'great_than_band': ('GREATER_THAN_BAND', toFixed2Strs),
+            'out_of_band': ('OUT_OF_BAND', toFixed2Strs),
+            'out_hrs': ('OUT_OF_BAND_INHRS', toFixed2Strs),
+            'fdi': ('FDI', toFixed2Strs)
+        })
         derFrequencyDict['freqProfRows'] = derFreqRows
         derFrequencyDict['weeklyFdi'] = weeklyFDI
 
@@ -68,40 +66,58 @@ class FrequencyProfileFetcher():
         Returns:
             IFreqProfile: frequency profile data
         """
+        return self.fetchDerivedFrequencyForWeeks([(startDate, endDate)])[0]
+
+    def fetchDerivedFrequencyForWeeks(self, weekWindows: List[Tuple[dt.datetime, dt.datetime]]) -> List[IFreqProfile]:
+        """fetch derived frequency of many weeks from mis_warehouse db in a single query
+        Args:
+            weekWindows (List[Tuple[dt.datetime, dt.datetime]]): (start date, end date) of each week in ascending order
+        Returns:
+            List[IFreqProfile]: frequency profile data of each week
+        """
+        df = self.fetchDerivedFrequencyDf(weekWindows[0][0], weekWindows[-1][1])
+        return self.toFreqProfilesForWeeks(df, weekWindows)
+
+    def toFreqProfilesForWeeks(self, df: pd.core.frame.DataFrame, weekWindows: List[Tuple[dt.datetime, dt.datetime]]) -> List[IFreqProfile]:
+        """build the frequency profile of each week from the daily derived frequency rows
+        Args:
+            df (pd.core.frame.DataFrame): derived frequency rows of all the weeks
+            weekWindows (List[Tuple[dt.datetime, dt.datetime]]): (start date, end date) of each week in ascending order
+        Returns:
+            List[IFreqProfile]: frequency profile data of each week
+        """
+        return [self.toContextDict(weekDf) for weekDf in partitionByWeeks(df, 'DATE_KEY', weekWindows)]
+
+    def fetchDerivedFrequencyDf(self, startDate: dt.datetime, endDate: dt.datetime) -> pd.core.frame.DataFrame:
+        """fetch the daily derived frequency rows of the days between start and end dates
+        Args:
+            startDate (dt.datetime): start date
+            endDate (dt.datetime): end date
+        Returns:
+            pd.core.frame.DataFrame: derived frequency rows ordered by date
+        """
         startDateLogString = dt.datetime.strftime(startDate, '%Y-%m-%d')
         endDateLogString = dt.datetime.strftime(endDate, '%Y-%m-%d')
         logExtra = {"startDate": startDateLogString,
                     "endDate": endDateLogString}
+        connection = self.dbPool.acquire()
         try:
-            connection = cx_Oracle.connect(self.connString)
+            fetch_sql = '''select *
+                        from mis_warehouse.derived_frequency
+                        where date_key between to_date(:start_date) and to_date(:end_date) 
+                        order by date_key'''
+
+            df = pd.read_sql(fetch_sql, params={
+                             'start_date': startDate, 'end_date': endDate}, con=connection)
+
         except Exception as err:
-            # print('error while creating a connection', err)
+            # print('error while fetching derived freq data for weekly report', err)
             self.appLogger.error(
-                'error creating db connection for derived frequency creation', exc_info=err, extra=logExtra)
+                'error while derived frequency sql db fetch', exc_info=err, extra=logExtra)
+            raise
         else:
-            # print(connection.version)
-            try:
-                cur = connection.cursor()
-                fetch_sql = '''select *
-                            from mis_warehouse.derived_frequency
-                            where date_key between to_date(:start_date) and to_date(:end_date) 
-                            order by date_key'''
-
-                cur.execute(
-                    "ALTER SESSION SET NLS_DATE_FORMAT = 'YYYY-MM-DD ' ")
-                df = pd.read_sql(fetch_sql, params={
-                                 'start_date': startDate, 'end_date': endDate}, con=connection)
-
-            except Exception as err:
-                # print('error while fetching derived freq data for weekly report', err)
-                self.appLogger.error(
-                    'error while derived frequency sql db fetch', exc_info=err, extra=logExtra)
-            else:
-                connection.commit()
-                print('derived freq data fetch complete')
+            print('derived freq data fetch complete')
         finally:
-            cur.close()
-            connection.close()
-            print("db connection closed after freq profile data fetch for weekly report")
-        derivedFrequencyDict = self.toContextDict(df)
-        return derivedFrequencyDict
+            self.dbPool.release(connection)
+            print("db connection released after freq profile data fetch for weekly report")
+        return df
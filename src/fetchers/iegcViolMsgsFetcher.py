@@ -1,8 +1,9 @@
-import cx_Oracle
 import pandas as pd
 import datetime as dt
 from typing import List, Tuple
+from src.db.appDbPool import AppDbPool
 from src.typeDefs.iegcViolMsg import IIegcViolMsg
+from src.utils.dfUtils import buildRowsFromColumns, getDateStrsFormatter, toRoundedInts, partitionByWeeks
 from src.appLogger import getAppLogger
 
 
@@ -10,13 +11,13 @@ class IegcViolMsgsFetcher():
     """This class fetches iegc violation messages for weekly report
     """
 
-    def __init__(self, con_string: str):
+    def __init__(self, dbPool: AppDbPool):
         """constructor method
         Args:
-            con_string ([str]): connection string
+            dbPool (AppDbPool): pool of application db connections
         """
 
-        self.connString = con_string
+        self.dbPool = dbPool
         self.appLogger = getAppLogger()
 
     def fetchIegcViolMsgs(self, startDate: dt.datetime, endDate: dt.datetime) -> List[IIegcViolMsg]:
@@ -27,42 +28,66 @@ class IegcViolMsgsFetcher():
         Returns:
             List[IIegcViolMsg]: List of IEGC violation messages for weekly report
         """
+        return self.fetchIegcViolMsgsForWeeks([(startDate, endDate)])[0]
+
+    def fetchIegcViolMsgsForWeeks(self, weekWindows: List[Tuple[dt.datetime, dt.datetime]]) -> List[List[IIegcViolMsg]]:
+        """fetch iegc violation messages of many weeks from mis_warehouse db in a single query
+        Args:
+            weekWindows (List[Tuple[dt.datetime, dt.datetime]]): (start date, end date) of each week in ascending order
+        Returns:
+            List[List[IIegcViolMsg]]: List of IEGC violation messages of each week
+        """
+        df = self.fetchIegcViolMsgsDf(weekWindows[0][0], weekWindows[-1][1])
+        return self.toIegcViolMsgsForWeeks(df, weekWindows)
+
+    def fetchIegcViolMsgsDf(self, startDate: dt.datetime, endDate: dt.datetime) -> pd.core.frame.DataFrame:
+        """fetch the iegc violation message rows of the days between start and end dates
+        Args:
+            startDate (dt.datetime): start date
+            endDate (dt.datetime): end date
+        Returns:
+            pd.core.frame.DataFrame: iegc violation message rows ordered by time and message
+        """
         startDateLogString = dt.datetime.strftime(startDate, '%Y-%m-%d')
         endDateLogString = dt.datetime.strftime(endDate, '%Y-%m-%d')
         logExtra = {"startDate": startDateLogString,
                     "endDate": endDateLogString}
+        connection = self.dbPool.acquire()
         try:
-            connection = cx_Oracle.connect(self.connString)
-            cursor = connection.cursor()
-
             sql_fetch = """ SELECT * FROM mis_warehouse.IEGC_VIOLATION_MESSAGE_DATA 
                         where (date_time BETWEEN TO_DATE(:col1, 'YYYY-MM-DD') and TO_DATE(:col2, 'YYYY-MM-DD'))
                         and not(entity='nan') 
                         order by date_time, message
                         """
-            cursor.execute("ALTER SESSION SET NLS_DATE_FORMAT = 'YYYY-MM-DD' ")
             df = pd.read_sql(sql_fetch, params={
                              'col1': startDate, 'col2': endDate}, con=connection)
         except Exception as err:
             # print('Error while fetching data from db')
             self.appLogger.error(
                 'error while executing iegc violation messages db fetch sql', exc_info=err, extra=logExtra)
+            raise
         finally:
-            # closing database cursor and connection
-            if cursor is not None:
-                cursor.close()
-            connection.close()
-            print('closed db connection after iegc violation messages fetching')
+            # releasing database connection back to the pool
+            self.dbPool.release(connection)
+            print('released db connection after iegc violation messages fetching')
+        return df
 
-        violMsgList: List[IIegcViolMsg] = []
-        for i in df.index:
-            violMsg: IIegcViolMsg = {
-                'msgId': df['MESSAGE'][i],
-                'date': dt.datetime.strftime(df['DATE_TIME'][i], "%d-%m-%Y"),
-                'entity': df['ENTITY'][i],
-                'schedule': int(round(df['SCHEDULE'][i])),
-                'drawal': int(round(df['DRAWAL'][i])),
-                'deviation': int(round(df['DEVIATION'][i]))
-            }
-            violMsgList.append(violMsg)
-        return violMsgList
+    def toIegcViolMsgsForWeeks(self, df: pd.core.frame.DataFrame, weekWindows: List[Tuple[dt.datetime, dt.datetime]]) -> List[List[IIegcViolMsg]]:
+        """build the iegc violation messages of each week from the message rows
+        Args:
+            df (pd.core.frame.DataFrame): iegc violation message rows of all the weeks
+            weekWindows (List[Tuple[dt.datetime, dt.datetime]]): (start date, end date) of each week in ascending order
+        Returns:
+            List[List[IIegcViolMsg]]: List of IEGC violation messages of each week
+        """
+        violMsgRowSpec = {
+            'msgId': ('MESSAGE', None),
+            'date': ('DATE_TIME', getDateStrsFormatter("%d-%m-%Y")),
+            'entity': ('ENTITY', None),
+            'schedule': ('SCHEDULE', toRoundedInts),
+            'drawal': ('DRAWAL', toRoundedInts),
+            'deviation': ('DEVIATION', toRoundedInts)
+        }
+        weekViolMsgs: List[List[IIegcViolMsg]] = [buildRowsFromColumns(weekDf, violMsgRowSpec)
+                                                  for weekDf in partitionByWeeks(df, 'DATE_TIME', weekWindows)]
+        return weekViolMsgs
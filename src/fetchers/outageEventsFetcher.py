@@ -0,0 +1,400 @@
+import datetime as dt
+import threading
+from typing import List, Dict, Iterable, Iterator, Optional, Tuple
+from src.db.appDbPool import AppDbPool
+from src.typeDefs.outage import IOutage
+from src.typeDefs.outageEvent import IOutageEvent
+from src.typeDefs.cursorOpts import ICursorOpts
+from src.utils.stringUtils import cleanOutageReasons
+
+# minimum outage duration of long time unrevived forced outages
+longTimeOtgMinDuration = dt.timedelta(days=180)
+
+# minimum outage duration of major generating unit outages
+majorGenOtgMinDuration = dt.timedelta(hours=72)
+
+# outages of each week for each outage section, keyed by report context key of the section
+IOutageSections = Dict[str, List[List[IOutage]]]
+
+# outage events are fetched in batches of this many rows per db round trip
+defaultOutageCursorOpts: ICursorOpts = {'arraySize': 1000, 'prefetchRows': 1000}
+
+
+def toOutageEvent(row: tuple, colInds: Dict[str, int], reasonStr: str) -> IOutageEvent:
+    """normalize an outage_events db row once for all the outage sections
+
+    Args:
+        row (tuple): db row
+        colInds (Dict[str, int]): index of each column in the row
+        reasonStr (str): report reason derived from outage tag, reason and remarks of the row
+
+    Returns:
+        IOutageEvent: normalized outage event
+    """
+    outageDt = row[colInds['OUTAGE_DATETIME']]
+    revivalDt = row[colInds['REVIVED_DATETIME']]
+    revivalDateStr: str = 'Still out'
+    revivalTimeStr: str = 'Still out'
+    if not(revivalDt == None):
+        revivalDateStr = dt.datetime.strftime(revivalDt, "%d-%m-%Y")
+        revivalTimeStr = dt.datetime.strftime(revivalDt, "%H:%M")
+    outageEvent: IOutageEvent = {
+        'elName': row[colInds['ELEMENT_NAME']],
+        'owners': row[colInds['OWNERS']],
+        'capacity': row[colInds['CAPACITY']],
+        'entityName': row[colInds['ENTITY_NAME']],
+        'shutdownTypeName': row[colInds['SHUTDOWN_TYPENAME']],
+        'outageDt': outageDt,
+        'revivalDt': revivalDt,
+        'outageDate': dt.datetime.strftime(outageDt, "%d-%m-%Y"),
+        'outageTime': dt.datetime.strftime(outageDt, "%H:%M"),
+        'revivalDate': revivalDateStr,
+        'revivalTime': revivalTimeStr,
+        'reason': reasonStr
+    }
+    return outageEvent
+
+
+def iterOutageEvents(dbPool: AppDbPool, startDt: dt.datetime, endDt: dt.datetime, longTimeOtgsMinRevivalDt: dt.datetime = None, cursorOpts: Optional[ICursorOpts] = None) -> Iterator[IOutageEvent]:
+    """stream the outage events needed by generating unit, transmission element
+    and long time unrevived outages sections in a single scan of outage_events, where
+    outage time between start and end time or
+    revived time between start and end time or
+    outage spans the start and end time or
+    forced outage of duration greater than 6 months that is not revived till the long time outages min revival time.
+    Rows are consumed from the cursor in batches of cursor array size and normalized as they are consumed,
+    hence only one batch of db rows is held in memory at a time.
+    The db connection is held till the events are consumed fully or the generator is closed
+
+    Args:
+        dbPool (AppDbPool): connection pool of reports database
+        startDt (dt.datetime): start date of report time scope
+        endDt (dt.datetime): end date of report time scope
+        longTimeOtgsMinRevivalDt (dt.datetime, optional): long time outages revived before this time are not fetched. Defaults to endDt.
+        cursorOpts (Optional[ICursorOpts], optional): cursor array size and prefetch rows. Defaults to defaultOutageCursorOpts.
+
+    Yields:
+        IOutageEvent: normalized outage event
+    """
+    if longTimeOtgsMinRevivalDt is None:
+        longTimeOtgsMinRevivalDt = endDt
+    if cursorOpts is None:
+        cursorOpts = defaultOutageCursorOpts
+
+    # sql query to fetch the outages
+    outagesFetchSql = '''select oe.ELEMENT_NAME, 
+    oe.OWNERS, oe.CAPACITY,
+    oe.OUTAGE_DATETIME, oe.REVIVED_DATETIME,
+    oe.OUTAGE_REMARKS, oe.REASON, oe.SHUTDOWN_TAG,
+    oe.ENTITY_NAME, oe.SHUTDOWN_TYPENAME
+    from mis_warehouse.outage_events oe 
+    where 
+    (
+        (oe.OUTAGE_DATETIME between :start_dt and :end_dt) 
+        or (oe.REVIVED_DATETIME between :start_dt and :end_dt)
+        or (oe.OUTAGE_DATETIME <= :start_dt and oe.REVIVED_DATETIME >= :end_dt)
+        or (oe.OUTAGE_DATETIME <= :start_dt and oe.REVIVED_DATETIME IS NULL)
+    ) 
+    or
+    (
+        (oe.SHUTDOWN_TYPENAME = 'FORCED') and 
+        (oe.OUTAGE_DATETIME < :long_otg_max_out_dt) and
+        ((oe.REVIVED_DATETIME IS NULL) or (oe.REVIVED_DATETIME > :long_otg_min_rev_dt))
+    )
+    '''
+
+    # get a connection to app database from the pool
+    con = dbPool.acquire()
+    try:
+        # get cursor, set the rows per round trip and execute fetch sql
+        cur = con.cursor()
+        cur.arraysize = cursorOpts['arraySize']
+        cur.prefetchrows = cursorOpts['prefetchRows']
+        cur.execute(outagesFetchSql, {
+            'start_dt': startDt, 'end_dt': endDt,
+            'long_otg_max_out_dt': endDt - longTimeOtgMinDuration,
+            'long_otg_min_rev_dt': longTimeOtgsMinRevivalDt})
+        colInds = {row[0]: colInd for colInd, row in enumerate(cur.description)}
+
+        # fetch and normalize the rows batch by batch
+        while True:
+            dbRows = cur.fetchmany()
+            if len(dbRows) == 0:
+                break
+            # clean the remarks of the whole batch at once
+            reasonStrs = cleanOutageReasons([r[colInds['SHUTDOWN_TAG']] for r in dbRows],
+                                            [r[colInds['REASON']] for r in dbRows],
+                                            [r[colInds['OUTAGE_REMARKS']] for r in dbRows])
+            for row, reasonStr in zip(dbRows, reasonStrs):
+                yield toOutageEvent(row, colInds, reasonStr)
+        cur.close()
+    finally:
+        # release the connection back to the pool
+        dbPool.release(con)
+
+
+def fetchOutageEvents(dbPool: AppDbPool, startDt: dt.datetime, endDt: dt.datetime, longTimeOtgsMinRevivalDt: dt.datetime = None, cursorOpts: Optional[ICursorOpts] = None) -> List[IOutageEvent]:
+    """fetch the outage events needed by generating unit, transmission element
+    and long time unrevived outages sections in a single scan of outage_events
+
+    Args:
+        dbPool (AppDbPool): connection pool of reports database
+        startDt (dt.datetime): start date of report time scope
+        endDt (dt.datetime): end date of report time scope
+        longTimeOtgsMinRevivalDt (dt.datetime, optional): long time outages revived before this time are not fetched. Defaults to endDt.
+        cursorOpts (Optional[ICursorOpts], optional): cursor array size and prefetch rows. Defaults to defaultOutageCursorOpts.
+
+    Returns:
+        List[IOutageEvent]: list of normalized outage events
+    """
+    return list(iterOutageEvents(dbPool, startDt, endDt, longTimeOtgsMinRevivalDt, cursorOpts))
+
+
+def toOutage(outageEvent: IOutageEvent, capacity: str) -> IOutage:
+    """create an outage record of report from a normalized outage event
+
+    Args:
+        outageEvent (IOutageEvent): outage event
+        capacity (str): capacity string to be shown in report
+
+    Returns:
+        IOutage: outage record
+    """
+    outageObj: IOutage = {
+        'elName': outageEvent['elName'],
+        'owners': outageEvent['owners'],
+        'capacity': capacity,
+        'outageDate': outageEvent['outageDate'],
+        'outageTime': outageEvent['outageTime'],
+        'revivalDate': outageEvent['revivalDate'],
+        'revivalTime': outageEvent['revivalTime'],
+        'reason': outageEvent['reason']
+    }
+    return outageObj
+
+
+def isOutageInWindow(outageEvent: IOutageEvent, startDt: dt.datetime, endDt: dt.datetime) -> bool:
+    """check if an outage was out at any time in the given time window
+
+    Args:
+        outageEvent (IOutageEvent): outage event
+        startDt (dt.datetime): start time of window
+        endDt (dt.datetime): end time of window
+
+    Returns:
+        bool: True if outage overlaps the window
+    """
+    outageDt = outageEvent['outageDt']
+    revivalDt = outageEvent['revivalDt']
+    if startDt <= outageDt <= endDt:
+        return True
+    if revivalDt == None:
+        return outageDt <= startDt
+    return (startDt <= revivalDt <= endDt) or (outageDt <= startDt and revivalDt >= endDt)
+
+
+def getMajorGenUnitOutageCap(otgEvent: IOutageEvent, startDt: dt.datetime, endDt: dt.datetime) -> Optional[str]:
+    """check if an outage event is a major generating unit outage of a time window, where
+    installed capapcity >= 100 MW
+    outage time >= 72 hrs
+
+    Args:
+        otgEvent (IOutageEvent): outage event
+        startDt (dt.datetime): start date of report time scope
+        endDt (dt.datetime): end date of report time scope
+
+    Returns:
+        Optional[str]: rounded capacity to be shown in report, None if not a major generating unit outage of the window
+    """
+    if not(otgEvent['entityName'] == 'GENERATING_UNIT') or not(isOutageInWindow(otgEvent, startDt, endDt)):
+        return None
+    # skip if capacity < 100
+    try:
+        capVal = float(str(otgEvent['capacity']))
+        if capVal < 100:
+            return None
+        cap = str(round(capVal))
+    except:
+        return None
+    # skip if total outage time < 72 hours
+    if not(otgEvent['revivalDt'] == None) and \
+            (otgEvent['revivalDt'] - otgEvent['outageDt']) < majorGenOtgMinDuration:
+        return None
+    return cap
+
+
+def isTransElOutage(otgEvent: IOutageEvent, startDt: dt.datetime, endDt: dt.datetime) -> bool:
+    """check if an outage event is a transmission element outage of a time window
+    """
+    return not(otgEvent['entityName'] in [None, 'GENERATING_UNIT']) and isOutageInWindow(otgEvent, startDt, endDt)
+
+
+def isLongTimeUnrevivedForcedOutage(otgEvent: IOutageEvent, endDt: dt.datetime) -> bool:
+    """check if an outage event is a forced outage that is still out at end time and outage duration greater than 6 months
+    """
+    return otgEvent['shutdownTypeName'] == 'FORCED' \
+        and (otgEvent['outageDt'] < endDt - longTimeOtgMinDuration) \
+        and (otgEvent['revivalDt'] == None or otgEvent['revivalDt'] > endDt)
+
+
+def toMajorGenUnitOutages(genOtgEvents: List[Tuple[IOutageEvent, str]]) -> List[IOutage]:
+    """create outage records of major generating unit outages
+    ordered by owners and then by latest outage time first
+    """
+    # order by owners asc (nulls last) and outage time desc
+    genOtgEvents = sorted(genOtgEvents, key=lambda e: e[0]['outageDt'], reverse=True)
+    genOtgEvents.sort(key=lambda e: (e[0]['owners'] == None, e[0]['owners'] or ''))
+    return [toOutage(otgEvent, cap) for otgEvent, cap in genOtgEvents]
+
+
+def toTransElOutages(transOtgEvents: List[IOutageEvent]) -> List[IOutage]:
+    """create outage records of transmission element outages ordered by latest outage time first
+    """
+    transOtgEvents = sorted(transOtgEvents, key=lambda e: e['outageDt'], reverse=True)
+    return [toOutage(e, str(e['capacity'])) for e in transOtgEvents]
+
+
+def toLongTimeUnrevivedForcedOutages(longOtgEvents: List[IOutageEvent]) -> List[IOutage]:
+    """create outage records of long time unrevived forced outages ordered by oldest outage time first
+    """
+    longOtgEvents = sorted(longOtgEvents, key=lambda e: e['outageDt'])
+    return [toOutage(e, str(e['capacity'])) for e in longOtgEvents]
+
+
+def filterMajorGenUnitOutages(outageEvents: Iterable[IOutageEvent], startDt: dt.datetime, endDt: dt.datetime) -> List[IOutage]:
+    """derive major generating unit outages of a time window from outage events, where
+    installed capapcity >= 100 MW
+    outage time >= 72 hrs
+    ordered by owners and then by latest outage time first
+
+    Args:
+        outageEvents (Iterable[IOutageEvent]): outage events, consumed in a single pass
+        startDt (dt.datetime): start date of report time scope
+        endDt (dt.datetime): end date of report time scope
+
+    Returns:
+        List[IOutage]: list of outage objects
+    """
+    genOtgEvents: List[Tuple[IOutageEvent, str]] = []
+    for otgEvent in outageEvents:
+        cap = getMajorGenUnitOutageCap(otgEvent, startDt, endDt)
+        if not(cap is None):
+            genOtgEvents.append((otgEvent, cap))
+    return toMajorGenUnitOutages(genOtgEvents)
+
+
+def filterTransElOutages(outageEvents: Iterable[IOutageEvent], startDt: dt.datetime, endDt: dt.datetime) -> List[IOutage]:
+    """derive transmission element outages of a time window from outage events
+    ordered by latest outage time first
+
+    Args:
+        outageEvents (Iterable[IOutageEvent]): outage events, consumed in a single pass
+        startDt (dt.datetime): start date of report time scope
+        endDt (dt.datetime): end date of report time scope
+
+    Returns:
+        List[IOutage]: list of outage objects
+    """
+    return toTransElOutages([e for e in outageEvents if isTransElOutage(e, startDt, endDt)])
+
+
+def filterLongTimeUnrevivedForcedOutages(outageEvents: Iterable[IOutageEvent], endDt: dt.datetime) -> List[IOutage]:
+    """derive forced outages that are still out at end time and outage duration greater than 6 months
+    ordered by oldest outage time first
+
+    Args:
+        outageEvents (Iterable[IOutageEvent]): outage events, consumed in a single pass
+        endDt (dt.datetime): end date of report time scope
+
+    Returns:
+        List[IOutage]: list of outage objects
+    """
+    return toLongTimeUnrevivedForcedOutages([e for e in outageEvents if isLongTimeUnrevivedForcedOutage(e, endDt)])
+
+
+def partitionOutageEvents(outageEvents: Iterable[IOutageEvent], weekWindows: List[Tuple[dt.datetime, dt.datetime]]) -> IOutageSections:
+    """derive all the outage sections of each week from outage events in a single pass.
+    Each event is added to the accumulators of the weeks and sections it belongs to as it is consumed,
+    hence only the events needed by the sections are held in memory along with the db rows batch being streamed
+
+    Args:
+        outageEvents (Iterable[IOutageEvent]): outage events, consumed in a single pass
+        weekWindows (List[Tuple[dt.datetime, dt.datetime]]): (start date, end date) of each week in ascending order
+
+    Returns:
+        IOutageSections: outages of each week for genOtgs, transOtgs and longTimeOtgs sections
+    """
+    genOtgEvents: List[List[Tuple[IOutageEvent, str]]] = [[] for _ in weekWindows]
+    transOtgEvents: List[List[IOutageEvent]] = [[] for _ in weekWindows]
+    longOtgEvents: List[List[IOutageEvent]] = [[] for _ in weekWindows]
+    for otgEvent in outageEvents:
+        for weekInd, (startDt, endDt) in enumerate(weekWindows):
+            cap = getMajorGenUnitOutageCap(otgEvent, startDt, endDt)
+            if not(cap is None):
+                genOtgEvents[weekInd].append((otgEvent, cap))
+            if isTransElOutage(otgEvent, startDt, endDt):
+                transOtgEvents[weekInd].append(otgEvent)
+            if isLongTimeUnrevivedForcedOutage(otgEvent, endDt):
+                longOtgEvents[weekInd].append(otgEvent)
+    return {
+        'genOtgs': [toMajorGenUnitOutages(e) for e in genOtgEvents],
+        'transOtgs': [toTransElOutages(e) for e in transOtgEvents],
+        'longTimeOtgs': [toLongTimeUnrevivedForcedOutages(e) for e in longOtgEvents]
+    }
+
+
+class OutageEventsFetcher():
+    """streams outage events once per set of weeks and derives all the outage sections of the weeks from them.
+    Concurrent requests for the same weeks wait for a single db scan
+    """
+
+    def __init__(self, dbPool: AppDbPool, cursorOpts: Optional[ICursorOpts] = None):
+        """constructor method
+        Args:
+            dbPool (AppDbPool): pool of application db connections
+            cursorOpts (Optional[ICursorOpts], optional): cursor array size and prefetch rows of outage events query. Defaults to defaultOutageCursorOpts.
+        """
+        self.dbPool = dbPool
+        self.cursorOpts = cursorOpts
+        self.outageSections: Dict[Tuple[Tuple[dt.datetime, dt.datetime], ...], IOutageSections] = {}
+        self.windowLocks: Dict[Tuple[Tuple[dt.datetime, dt.datetime], ...], threading.Lock] = {}
+        self.windowLocksLock = threading.Lock()
+
+    def fetchOutageSectionsForWeeks(self, weekWindows: List[Tuple[dt.datetime, dt.datetime]]) -> IOutageSections:
+        """get all the outage sections of the given weeks, db is scanned only for the first request of the weeks.
+        Outages that overlap more than one week are fetched once and added to each of those weeks
+
+        Args:
+            weekWindows (List[Tuple[dt.datetime, dt.datetime]]): (start date, end date) of each week in ascending order
+
+        Returns:
+            IOutageSections: outages of each week for genOtgs, transOtgs and longTimeOtgs sections
+        """
+        windowsKey = tuple(weekWindows)
+        with self.windowLocksLock:
+            windowLock = self.windowLocks.setdefault(windowsKey, threading.Lock())
+        with windowLock:
+            if windowsKey not in self.outageSections:
+                # long time outages revived after the end of first week are needed by atleast the first week
+                outageEvents = iterOutageEvents(
+                    self.dbPool, weekWindows[0][0], weekWindows[-1][1], weekWindows[0][1], self.cursorOpts)
+                self.outageSections[windowsKey] = partitionOutageEvents(outageEvents, weekWindows)
+            return self.outageSections[windowsKey]
+
+    def fetchMajorGenUnitOutages(self, startDt: dt.datetime, endDt: dt.datetime) -> List[IOutage]:
+        return self.fetchMajorGenUnitOutagesForWeeks([(startDt, endDt)])[0]
+
+    def fetchTransElOutages(self, startDt: dt.datetime, endDt: dt.datetime) -> List[IOutage]:
+        return self.fetchTransElOutagesForWeeks([(startDt, endDt)])[0]
+
+    def fetchLongTimeUnrevivedForcedOutages(self, startDt: dt.datetime, endDt: dt.datetime) -> List[IOutage]:
+        return self.fetchLongTimeUnrevivedForcedOutagesForWeeks([(startDt, endDt)])[0]
+
+    def fetchMajorGenUnitOutagesForWeeks(self, weekWindows: List[Tuple[dt.datetime, dt.datetime]]) -> List[List[IOutage]]:
+        return self.fetchOutageSectionsForWeeks(weekWindows)['genOtgs']
+
+    def fetchTransElOutagesForWeeks(self, weekWindows: List[Tuple[dt.datetime, dt.datetime]]) -> List[List[IOutage]]:
+        return self.fetchOutageSectionsForWeeks(weekWindows)['transOtgs']
+
+    def fetchLongTimeUnrevivedForcedOutagesForWeeks(self, weekWindows: List[Tuple[dt.datetime, dt.datetime]]) -> List[List[IOutage]]:
+        return self.fetchOutageSectionsForWeeks(weekWindows)['longTimeOtgs']
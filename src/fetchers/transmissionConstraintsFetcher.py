@@ -1,21 +1,22 @@
-import cx_Oracle
 import pandas as pd
 import datetime as dt
 from typing import List, Tuple
+from src.db.appDbPool import AppDbPool
 from src.typeDefs.transConstraint import ITransConstraint
+from src.utils.dfUtils import buildRowsFromColumns
 
 
 class TransConstraintsFetcher():
     """This class fetches Transmission Constraints for weekly report
     """
 
-    def __init__(self, con_string: str):
+    def __init__(self, dbPool: AppDbPool):
         """constructor method
         Args:
-            con_string ([str]): connection string
+            dbPool (AppDbPool): pool of application db connections
         """
 
-        self.connString = con_string
+        self.dbPool = dbPool
 
     def fetchTransConstraints(self, startDate: dt.datetime, endDate: dt.datetime) -> List[ITransConstraint]:
         """fetch Transmission Constraints for weekly report from warehouse db 
@@ -26,33 +27,25 @@ class TransConstraintsFetcher():
             List[ITransConstraint]: List of Transmission Constraints for weekly report
         """
 
+        connection = self.dbPool.acquire()
         try:
-            connection = cx_Oracle.connect(self.connString)
-            cursor = connection.cursor()
-
             sql_fetch = """
                         select * from transmission_constraint_data
                         where 
                         start_date IN 
                         (select max(start_date) from transmission_constraint_data)
                         """
-            cursor.execute("ALTER SESSION SET NLS_DATE_FORMAT = 'YYYY-MM-DD' ")
             df = pd.read_sql(sql_fetch, con=connection)
         except:
             print('Error while fetching data from db')
         finally:
-            # closing database cursor and connection
-            if cursor is not None:
-                cursor.close()
-            connection.close()
-            print('closed db connection after transmission constraints fetching')
-
-        transConstraints: List[ITransConstraint] = []
-        for i in df.index:
-            transCons: ITransConstraint = {
-                'corridor': df['CORRIDOR'][i],
-                'season': df['SEASON_ANTECEDENT'][i],
-                'description': df['DESCRIPTION_CONSTRAINTS'][i]
-            }
-            transConstraints.append(transCons)
+            # releasing database connection back to the pool
+            self.dbPool.release(connection)
+            print('released db connection after transmission constraints fetching')
+
+        transConstraints: List[ITransConstraint] = buildRowsFromColumns(df, {
+            'corridor': ('CORRIDOR', None),
+            'season': ('SEASON_ANTECEDENT', None),
+            'description': ('DESCRIPTION_CONSTRAINTS', None)
+        })
         return transConstraints
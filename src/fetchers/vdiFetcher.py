@@ -1,10 +1,10 @@
-import cx_Oracle
 import pandas as pd
 import datetime as dt
 from typing import List, Tuple
+from src.db.appDbPool import AppDbPool
 from src.typeDefs.stationwiseVdiData import IStationwiseVdi
 from src.typeDefs.stationVdiProfile import IStationVdiProfile
-from src.utils.stringUtils import convertHrsToSpanStr
+from src.utils.dfUtils import buildRowsFromColumns, toFixed2Strs, toHrsSpanStrs, partitionByWeeks
 from src.appLogger import getAppLogger
 
 
@@ -12,13 +12,13 @@ class VdiFetcher():
     """fetches VDI data for populating weekly mis report
     """
 
-    def __init__(self, appDbConnStr: str):
+    def __init__(self, dbPool: AppDbPool):
         """constructor method
         Args:
-            con_string ([type]): connection string of application db that contains VDI derived data
+            dbPool (AppDbPool): pool of connections to application db that contains VDI derived data
         """
 
-        self.connString = appDbConnStr
+        self.dbPool = dbPool
         self.appLogger = getAppLogger()
 
     def toDerivedVDIDict(self, df: pd.core.frame.DataFrame) -> IStationwiseVdi:
@@ -39,38 +39,24 @@ class VdiFetcher():
             'vdi765Rows': []
         }
 
+        vdiRowSpec = {
+            'station': ('NODE_NAME', None),
+            'maxVol': ('MAXIMUM', None),
+            'minVol': ('MINIMUM', None),
+            'lessThanBand': ('LESS_THAN_BAND', toFixed2Strs),
+            'bwBand': ('BETWEEN_BAND', toFixed2Strs),
+            'greatThanBand': ('GREATER_THAN_BAND', toFixed2Strs),
+            'lessBandHrs': ('LESS_THAN_BAND_INHRS', toHrsSpanStrs),
+            'greatBandHrs': ('GREATER_THAN_BAND_INHRS', toHrsSpanStrs),
+            'outOfBandHrs': ('OUT_OF_BAND_INHRS', toHrsSpanStrs),
+            'vdi': ('VDI', toFixed2Strs)
+        }
         group = df.groupby("NODE_VOLTAGE")
         for nameOfGroup, groupDf in group:
             if nameOfGroup == 400:
-                for ind in groupDf.index:
-                    tempDict = {
-                        'station': groupDf['NODE_NAME'][ind],
-                        'maxVol': groupDf['MAXIMUM'][ind],
-                        'minVol': groupDf['MINIMUM'][ind],
-                        'lessThanBand': "{:0.2f}".format(groupDf['LESS_THAN_BAND'][ind]),
-                        'bwBand': "{:0.2f}".format(groupDf['BETWEEN_BAND'][ind]),
-                        'greatThanBand': "{:0.2f}".format(groupDf['GREATER_THAN_BAND'][ind]),
-                        'lessBandHrs': convertHrsToSpanStr(groupDf['LESS_THAN_BAND_INHRS'][ind]),
-                        'greatBandHrs': convertHrsToSpanStr(groupDf['GREATER_THAN_BAND_INHRS'][ind]),
-                        'outOfBandHrs': convertHrsToSpanStr(groupDf['OUT_OF_BAND_INHRS'][ind]),
-                        'vdi': "{:0.2f}".format(groupDf['VDI'][ind])
-                    }
-                    VDIRows400Kv.append(tempDict)
+                VDIRows400Kv = buildRowsFromColumns(groupDf, vdiRowSpec)
             elif nameOfGroup == 765:
-                for ind in groupDf.index:
-                    tempDict = {
-                        'station': groupDf['NODE_NAME'][ind],
-                        'maxVol': groupDf['MAXIMUM'][ind],
-                        'minVol': groupDf['MINIMUM'][ind],
-                        'lessThanBand': "{:0.2f}".format(groupDf['LESS_THAN_BAND'][ind]),
-                        'bwBand': "{:0.2f}".format(groupDf['BETWEEN_BAND'][ind]),
-                        'greatThanBand': "{:0.2f}".format(groupDf['GREATER_THAN_BAND'][ind]),
-                        'lessBandHrs': convertHrsToSpanStr(groupDf['LESS_THAN_BAND_INHRS'][ind]),
-                        'greatBandHrs': convertHrsToSpanStr(groupDf['GREATER_THAN_BAND_INHRS'][ind]),
-                        'outOfBandHrs': convertHrsToSpanStr(groupDf['OUT_OF_BAND_INHRS'][ind]),
-                        'vdi': "{:0.2f}".format(groupDf['VDI'][ind])
-                    }
-                    VDIRows765Kv.append(tempDict)
+                VDIRows765Kv = buildRowsFromColumns(groupDf, vdiRowSpec)
         derivedVDIDict['vdi400Rows'] = VDIRows400Kv
         derivedVDIDict['vdi765Rows'] = VDIRows765Kv
         return derivedVDIDict
@@ -82,40 +68,41 @@ class VdiFetcher():
         Returns:
             IStationwiseVdi: week VDI summary data for each 765 and 400 kv station 
         """
+        return self.fetchWeeklyVDIForWeeks([startDate])[0]
+
+    def fetchWeeklyVDIForWeeks(self, weekStartDates: List[dt.datetime]) -> List[IStationwiseVdi]:
+        """fetch derived VDI of many weeks from mis_warehouse db in a single query
+        Args:
+            weekStartDates (List[dt.datetime]): start date of each week in ascending order
+        Returns:
+            List[IStationwiseVdi]: week VDI summary data for each 765 and 400 kv station of each week
+        """
+        startDate = weekStartDates[0]
+        endDate = weekStartDates[-1]
         startDateLogString = dt.datetime.strftime(startDate, '%Y-%m-%d')
         logExtra = {"startDate": startDateLogString}
+        connection = self.dbPool.acquire()
         try:
-            connection = cx_Oracle.connect(self.connString)
+            fetch_sql = '''select vdi.* from 
+                        mis_warehouse.derived_vdi vdi, mis_warehouse.voltage_mapping_table mt
+                        where vdi.mapping_id = mt.id and mt.is_included_in_weekly_vdi = 'T' and 
+                        week_start_date between to_date(:start_date) and to_date(:end_date)'''
+
+            df = pd.read_sql(fetch_sql, params={
+                             'start_date': startDate, 'end_date': endDate}, con=connection)
+
         except Exception as err:
-            # print('error while creating a connection', err)
+            # print('error while fetching weekly VDI data', err)
             self.appLogger.error(
-                'error creating db connection for VDI creation', exc_info=err, extra=logExtra)
+                'error while VDI sql db fetch', exc_info=err, extra=logExtra)
+            return [{'vdi400Rows': [], 'vdi765Rows': []} for _ in weekStartDates]
         else:
-            # print(connection.version)
-            try:
-                cur = connection.cursor()
-                fetch_sql = '''select vdi.* from 
-                            mis_warehouse.derived_vdi vdi, mis_warehouse.voltage_mapping_table mt
-                            where vdi.mapping_id = mt.id and mt.is_included_in_weekly_vdi = 'T' and week_start_date = to_date(:start_date)'''
-
-                cur.execute(
-                    "ALTER SESSION SET NLS_DATE_FORMAT = 'YYYY-MM-DD' ")
-                df = pd.read_sql(fetch_sql, params={
-                                 'start_date': startDate}, con=connection)
-
-            except Exception as err:
-                # print('error while fetching weekly VDI data', err)
-                self.appLogger.error(
-                    'error while VDI sql db fetch', exc_info=err, extra=logExtra)
-                return {'vdi400Rows': [], 'vdi765Rows': []}
-            else:
-                print('VDI data fetch complete')
-                connection.commit()
+            print('VDI data fetch complete')
         finally:
-            cur.close()
-            connection.close()
-            print("db connection closed after weekly vdi fetch")
+            self.dbPool.release(connection)
+            print("db connection released after weekly vdi fetch")
         df['MAXIMUM'] = df['MAXIMUM'].round().astype(int)
         df['MINIMUM'] = df['MINIMUM'].round().astype(int)
-        derivedVDIDict = self.toDerivedVDIDict(df)
-        return derivedVDIDict
+        weekDfs = partitionByWeeks(df, 'WEEK_START_DATE', [
+                                   (d, d) for d in weekStartDates])
+        return [self.toDerivedVDIDict(weekDf) for weekDf in weekDfs]
@@ -1,7 +1,10 @@
-import cx_Oracle
+import numpy as np
 import pandas as pd
 import datetime as dt
-from typing import List, Tuple, TypedDict
+from typing import List, Tuple, TypedDict, Dict
+from src.db.appDbPool import AppDbPool
+from src.config.voltStatsLayout import getVoltStatsLayout
+from src.utils.dfUtils import partitionByWeeks
 from src.appLogger import getAppLogger
 
 
@@ -9,120 +12,154 @@ class VoltStatsFetcher():
     """repo class to fetch derived voltage from mis_warehouse db.
     """
 
-    def __init__(self, con_string):
+    def __init__(self, dbPool: AppDbPool, layoutFilename: str = 'assets/volt_stats_layout.json'):
         """constructor method
         Args:
-            con_string ([type]): connection string
+            dbPool (AppDbPool): pool of application db connections
+            layoutFilename (str, optional): station layout file of the daily voltage tables
         """
-        self.connString = con_string
-        self.voltTable1 = []
-        self.voltTable2 = []
-        self.voltTable3 = []
-        self.voltTable4 = []
-        self.derivedVoltageDict = {'table1': self.voltTable1, 'table2': self.voltTable2,
-                                   'table3': self.voltTable3, 'table4': self.voltTable4}
+        self.dbPool = dbPool
+        self.layoutFilename = layoutFilename
         self.appLogger = getAppLogger()
 
-    def appendTables(self, df: pd.core.frame.DataFrame) -> None:
-        """ append rows for each table for each day
-        voltTable1 =[]
-        voltTable2 =[]
-        voltTable3 =[]
-        voltTable4 =[]
+    def toVoltStatsDict(self, df: pd.core.frame.DataFrame) -> Dict[str, List[dict]]:
+        """ build the rows of all the daily voltage tables for all the days in one pass
+        as per the station layout of the tables.
+        Stations without data for a day are filled with the missing value of the layout.
+        Rows are matched to the layout stations by node voltage and node name. If no row matches,
+        stations are placed by their position in the rows of a day sorted by node voltage and node name
         Args:
-            df (pd.core.frame.DataFrame): pandas dataframe that contains derived voltage data for each day for all nodes.
+            df (pd.core.frame.DataFrame): pandas dataframe that contains derived voltage data for all the days for all nodes.
+        Returns:
+            Dict[str, List[dict]]: rows of each daily voltage table, one row per day
         """
-        date = df['DATE_KEY'][0].day
-
-        dfTable1 = df.iloc[0:9]
-
-        dfTable2 = df.iloc[9:18]
-        dfTable2.reset_index(drop=True, inplace=True)
-
-        dfTable3 = df.iloc[18:27]
-        dfTable3.reset_index(drop=True, inplace=True)
-
-        dfTable4 = df.iloc[27:]
-        dfTable4.reset_index(drop=True, inplace=True)
-
-        tempDictTable1 = {'date': date, 'amreliMax': dfTable1['MAXIMUM'][0], 'amreliMin': dfTable1['MINIMUM'][0], 'asojMax': dfTable1['MAXIMUM'][1], 'asojMin': dfTable1['MINIMUM'][1], 'bhilaiMax': dfTable1['MAXIMUM'][2], 'bhilaiMin': dfTable1['MINIMUM'][2], 'bhopalMax': dfTable1['MAXIMUM'][3], 'bhopalMin': dfTable1['MINIMUM'][3], 'boisarMax': dfTable1[
-            'MAXIMUM'][4], 'boisarMin': dfTable1['MINIMUM'][4], 'damohMax': dfTable1['MAXIMUM'][5], 'damohMin': dfTable1['MINIMUM'][5], 'dehgamMax': dfTable1['MAXIMUM'][6], 'dehgamMin': dfTable1['MINIMUM'][6], 'dhuleMax': dfTable1['MAXIMUM'][7], 'dhuleMin': dfTable1['MINIMUM'][7], 'gwaliorMax': dfTable1['MAXIMUM'][8], 'gwaliorMin': dfTable1['MINIMUM'][8]}
-        self.voltTable1.append(tempDictTable1)
-
-        tempDictTable2 = {'date': date, 'indoreMax': dfTable2['MAXIMUM'][0], 'indoreMin': dfTable2['MINIMUM'][0], 'itarsiMax': dfTable2['MAXIMUM'][1], 'itarsiMin': dfTable2['MINIMUM'][1], 'jetpurMax': dfTable2['MAXIMUM'][2], 'jetpurMin': dfTable2['MINIMUM'][2], 'kalwaMax': dfTable2['MAXIMUM'][3], 'kalwaMin': dfTable2['MINIMUM'][3], 'karadMax': dfTable2[
-            'MAXIMUM'][4], 'karadMin': dfTable2['MINIMUM'][4], 'kasorMax': dfTable2['MAXIMUM'][5], 'kasorMin': dfTable2['MINIMUM'][5], 'khandwaMax': dfTable2['MAXIMUM'][6], 'khandwaMin': dfTable2['MINIMUM'][6], 'nagdaMax': dfTable2['MAXIMUM'][7], 'nagdaMin': dfTable2['MINIMUM'][7], 'parliMax': dfTable2['MAXIMUM'][8], 'parliMin': dfTable2['MINIMUM'][8]}
-        self.voltTable2.append(tempDictTable2)
-
-        tempDictTable3 = {'date': date, 'raigarhMax': dfTable3['MAXIMUM'][0], 'raigarhMin': dfTable3['MINIMUM'][0], 'raipurMax': dfTable3['MAXIMUM'][1], 'raipurMin': dfTable3['MINIMUM'][1], 'vapiMax': dfTable3['MAXIMUM'][2], 'vapiMin': dfTable3['MINIMUM'][2], 'wardhaMax': dfTable3['MAXIMUM'][3], 'wardhaMin': dfTable3['MINIMUM'][3], 'binaMax': dfTable3[
-            'MAXIMUM'][4], 'binaMin': dfTable3['MINIMUM'][4], 'durgMax': dfTable3['MAXIMUM'][5], 'durgMin': dfTable3['MINIMUM'][5], 'gwaliorMax': dfTable3['MAXIMUM'][6], 'gwaliorMin': dfTable3['MINIMUM'][6], 'indoreMax': dfTable3['MAXIMUM'][7], 'indoreMin': dfTable3['MINIMUM'][7], 'kotraMax': dfTable3['MAXIMUM'][8], 'kotraMin': dfTable3['MINIMUM'][8]}
-        self.voltTable3.append(tempDictTable3)
-
-        tempDictTable4 = {'date': date, 'sasanMax': dfTable4['MAXIMUM'][0], 'sasanMin': dfTable4['MINIMUM'][0], 'satnaMax': dfTable4['MAXIMUM'][1], 'satnaMin': dfTable4['MINIMUM'][1], 'seoniMax': dfTable4['MAXIMUM'][2], 'seoniMin': dfTable4['MINIMUM'][2], 'sipatMax': dfTable4['MAXIMUM']
-                          [3], 'sipatMin': dfTable4['MINIMUM'][3], 'tamnarMax': dfTable4['MAXIMUM'][4], 'tamnarMin': dfTable4['MINIMUM'][4], 'vadodaraMax': dfTable4['MAXIMUM'][5], 'vadodaraMin': dfTable4['MINIMUM'][5], 'wardhaMax': dfTable4['MAXIMUM'][6], 'wardhaMin': dfTable4['MINIMUM'][6]}
-        self.voltTable4.append(tempDictTable4)
-
-    def fetchDerivedVoltage(self, startDate: dt.datetime, endDate: dt.datetime):
+        layout = getVoltStatsLayout(self.layoutFilename)
+        voltStatsDict = {t['name']: [] for t in layout['tables']}
+        if df.shape[0] == 0:
+            return voltStatsDict
+
+        # day row index and layout station column index of each derived voltage row
+        df = df.reset_index(drop=True)
+        dayVals, dayInds = np.unique(df['DATE_KEY'].to_numpy(), return_inverse=True)
+        dates = pd.DatetimeIndex(dayVals).day.tolist()
+        stnLookupKeys = df['NODE_VOLTAGE'].astype(int).astype(str) + '|' + \
+            df['NODE_NAME'].astype(str).str.strip().str.lower()
+        stnColInds = stnLookupKeys.map(layout['stnColIndsMap'])
+        if stnColInds.isna().all():
+            # node names of the layout do not match the warehouse node names
+            self.appLogger.warning('no derived voltage station matches the daily voltage layout, hence stations are placed by their sorted position: {0}'.format(
+                sorted(stnLookupKeys.unique().tolist())))
+            stnColInds = df.sort_values(['DATE_KEY', 'NODE_VOLTAGE', 'NODE_NAME']).groupby('DATE_KEY').cumcount().sort_index()
+            stnColInds = stnColInds.where(stnColInds < layout['numStns'])
+        else:
+            self.logUnmatchedStns(stnLookupKeys, stnColInds, layout['stnColIndsMap'])
+        isLayoutStn = stnColInds.notna().to_numpy()
+        stnColInds = stnColInds.fillna(-1).astype(int).to_numpy()
+
+        # scatter the rounded values into day x station arrays prefilled with missing value
+        stnArrs = {}
+        for col in ['MAXIMUM', 'MINIMUM']:
+            stnArr = np.full((len(dates), layout['numStns']),
+                             layout['missingValue'], dtype=object)
+            vals = df[col].round()
+            isValid = isLayoutStn & vals.notna().to_numpy()
+            stnArr[dayInds[isValid], stnColInds[isValid]] = vals[isValid].astype(
+                int).to_numpy().astype(object)
+            stnArrs[col] = stnArr
+
+        # reshape the station columns of each table into template table rows
+        for table in layout['tables']:
+            tableArr = np.empty((len(dates), 2*len(table['stnColInds'])), dtype=object)
+            tableArr[:, 0::2] = stnArrs['MAXIMUM'][:, table['stnColInds']]
+            tableArr[:, 1::2] = stnArrs['MINIMUM'][:, table['stnColInds']]
+            rowKeys = ['date'] + [k + suffix for k in table['stnKeys']
+                                  for suffix in ['Max', 'Min']]
+            voltStatsDict[table['name']] = [dict(zip(rowKeys, [d] + rowVals))
+                                            for d, rowVals in zip(dates, tableArr.tolist())]
+        return voltStatsDict
+
+    def logUnmatchedStns(self, stnLookupKeys: pd.Series, stnColInds: pd.Series, stnColIndsMap: Dict[str, int]) -> None:
+        """log the derived voltage stations that are not in the layout and the layout stations without data
+        """
+        unmatchedStns = sorted(stnLookupKeys[stnColInds.isna()].unique().tolist())
+        if len(unmatchedStns) > 0:
+            self.appLogger.warning(
+                'derived voltage stations not in daily voltage layout: {0}'.format(unmatchedStns))
+        missingStns = sorted(set(stnColIndsMap.keys()) - set(stnLookupKeys.unique().tolist()))
+        if len(missingStns) > 0:
+            self.appLogger.warning(
+                'daily voltage layout stations without derived voltage data: {0}'.format(missingStns))
+
+    def fetchDerivedVoltage(self, startDate: dt.datetime, endDate: dt.datetime) -> Dict[str, List[dict]]:
         """fetch derived voltage from mis_warehouse db 
         Args:
             startDate (dt.datetime): start date
             endDate (dt.datetime): end date
         Returns:
-            derivedVoltageDict ={'table1':voltTable1,    
+            Dict[str, List[dict]]: rows of each table of the station layout like
+                                 {'table1':voltTable1,    
                                  'table2':voltTable2,
                                  'table3':voltTable3,
                                  'table4':voltTable4
                                  }
         """
+        return self.fetchDerivedVoltageForWeeks([(startDate, endDate)])[0]
+
+    def fetchDerivedVoltageForWeeks(self, weekWindows: List[Tuple[dt.datetime, dt.datetime]]) -> List[Dict[str, List[dict]]]:
+        """fetch derived voltage of many weeks from mis_warehouse db in a single query
+        Args:
+            weekWindows (List[Tuple[dt.datetime, dt.datetime]]): (start date, end date) of each week in ascending order
+        Returns:
+            List[Dict[str, List[dict]]]: rows of each table of the station layout for each week
+        """
+        try:
+            df = self.fetchDerivedVoltageDf(weekWindows[0][0], weekWindows[-1][1])
+        except Exception:
+            return [{t['name']: [] for t in getVoltStatsLayout(self.layoutFilename)['tables']}
+                    for _ in weekWindows]
+        return self.toVoltStatsForWeeks(df, weekWindows)
+
+    def toVoltStatsForWeeks(self, df: pd.core.frame.DataFrame, weekWindows: List[Tuple[dt.datetime, dt.datetime]]) -> List[Dict[str, List[dict]]]:
+        """build the daily voltage tables of each week from the derived voltage rows
+        Args:
+            df (pd.core.frame.DataFrame): derived voltage rows of all the weeks
+            weekWindows (List[Tuple[dt.datetime, dt.datetime]]): (start date, end date) of each week in ascending order
+        Returns:
+            List[Dict[str, List[dict]]]: rows of each table of the station layout for each week
+        """
+        return [self.toVoltStatsDict(weekDf) for weekDf in partitionByWeeks(df, 'DATE_KEY', weekWindows)]
+
+    def fetchDerivedVoltageDf(self, startDate: dt.datetime, endDate: dt.datetime) -> pd.core.frame.DataFrame:
+        """fetch the derived voltage rows of the days between start and end dates
+        Args:
+            startDate (dt.datetime): start date
+            endDate (dt.datetime): end date
+        Returns:
+            pd.core.frame.DataFrame: derived voltage rows of the stations included in daily voltage
+        """
         startDateLogString = dt.datetime.strftime(startDate, '%Y-%m-%d')
         endDateLogString = dt.datetime.strftime(endDate, '%Y-%m-%d')
         logExtra = {"startDate": startDateLogString,
                     "endDate": endDateLogString}
-        # generating dates between startDate and endDate
-        dates = []
-        delta = endDate - startDate
-        for i in range(delta.days + 1):
-            dates.append(startDate + dt.timedelta(days=i))
+        connection = self.dbPool.acquire()
         try:
-            connection = cx_Oracle.connect(self.connString)
-        except Exception as err:
-            # print('error while creating a connection', err)
-            self.appLogger.error(
-                'error creating db connection for stationwise voltage stats', exc_info=err, extra=logExtra)
-        else:
-            print(connection.version)
-            try:
-                cur = connection.cursor()
-
-                # fetching derived voltage data for each day.
-                for date in dates:
-                    fetch_sql = '''select  vt.date_key, vt.node_name,mt.node_voltage, vt.maximum, vt.minimum from 
-                                derived_voltage vt, voltage_mapping_table mt
-                                where  vt.mapping_id = mt.id and  mt.is_included_in_daily_voltage = 'T' and date_key = to_date(:start_date) '''
-
-                    cur.execute(
-                        "ALTER SESSION SET NLS_DATE_FORMAT = 'YYYY-MM-DD ' ")
-                    df = pd.read_sql(fetch_sql, params={
-                                     'start_date': date}, con=connection)
-
-                    # sorting node_name alphabetically.
-                    df.sort_values(['NODE_VOLTAGE', 'NODE_NAME'], ascending=[
-                                   True, True], inplace=True, ignore_index=True)
+            # fetching derived voltage data for all the days in one query
+            fetch_sql = '''select  vt.date_key, vt.node_name,mt.node_voltage, vt.maximum, vt.minimum from 
+                        derived_voltage vt, voltage_mapping_table mt
+                        where  vt.mapping_id = mt.id and  mt.is_included_in_daily_voltage = 'T' and 
+                        date_key between to_date(:start_date) and to_date(:end_date) '''
 
-                    # passing object to appendTables method.
-                    df['MAXIMUM'] = df['MAXIMUM'].round().astype(int)
-                    df['MINIMUM'] = df['MINIMUM'].round().astype(int)
-                    self.appendTables(df)
+            df = pd.read_sql(fetch_sql, params={
+                             'start_date': startDate, 'end_date': endDate}, con=connection)
 
-            except Exception as err:
-                # print('error while creating a cursor', err)
-                self.appLogger.error(
+        except Exception as err:
+            # print('error while creating a cursor', err)
+            self.appLogger.error(
                 'error while stationwise voltage stats sql db fetch', exc_info=err, extra=logExtra)
-            else:
-                print('retrieval of derived voltage stats data complete')
-                connection.commit()
+            raise
+        else:
+            print('retrieval of derived voltage stats data complete')
         finally:
-            cur.close()
-            connection.close()
-            print("connection closed")
-
-        return self.derivedVoltageDict
+            self.dbPool.release(connection)
+            print("connection released")
+        return df
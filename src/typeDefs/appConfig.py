@@ -8,3 +8,16 @@ class IAppConfig(TypedDict):
     flaskPort: str
     logstashHost: str
     logstashPort: int
+    fetchWorkers: int
+    renderWorkers: int
+    prefetchWeeks: int
+    reportJobWorkers: int
+    reportJobsMaxPending: int
+    reportJobTtlSecs: int
+    fetchBatchWeeks: int
+    appDbType: str
+    sqliteDbPath: str
+    outageFetchArraySize: int
+    outageFetchPrefetchRows: int
+    sectionTimeoutSecs: float
+    generationDeadlineSecs: float
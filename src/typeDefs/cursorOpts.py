@@ -0,0 +1,6 @@
+from typing import TypedDict
+
+
+class ICursorOpts(TypedDict):
+    arraySize: int
+    prefetchRows: int
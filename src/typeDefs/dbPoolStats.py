@@ -0,0 +1,14 @@
+from typing import TypedDict
+
+
+class IDbPoolStats(TypedDict):
+    minSessions: int
+    maxSessions: int
+    openedSessions: int
+    busySessions: int
+    sessionTimeoutSecs: int
+    waitTimeoutMs: int
+    numAcquires: int
+    numAcquireTimeouts: int
+    maxAcquireWaitSecs: float
+    avgAcquireWaitSecs: float
@@ -0,0 +1,10 @@
+from typing import TypedDict
+import datetime as dt
+
+
+class IFinWeek(TypedDict):
+    startDt: dt.datetime
+    endDt: dt.datetime
+    wkNum: int
+    finYr: int
+    finYrStr: str
@@ -0,0 +1,17 @@
+from typing import TypedDict
+import datetime as dt
+
+
+class IOutageEvent(TypedDict):
+    elName: str
+    owners: str
+    capacity: str
+    entityName: str
+    shutdownTypeName: str
+    outageDt: dt.datetime
+    revivalDt: dt.datetime
+    outageDate: str
+    outageTime: str
+    revivalDate: str
+    revivalTime: str
+    reason: str
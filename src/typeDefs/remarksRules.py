@@ -0,0 +1,11 @@
+from typing import TypedDict, Dict, FrozenSet, Pattern
+
+
+class IRemarksRule(TypedDict):
+    undesiredRemarks: FrozenSet[str]
+    undesiredStartRegex: Pattern
+
+
+class IRemarksRules(TypedDict):
+    ignoredTags: FrozenSet[str]
+    tagRules: Dict[str, IRemarksRule]
@@ -0,0 +1,9 @@
+from typing import TypedDict
+
+
+class IRenderStats(TypedDict):
+    isSuccess: bool
+    renderSecs: float
+    reportBytes: int
+    # True if an identical report was taken from artifact store instead of rendering
+    isRenderSkipped: bool
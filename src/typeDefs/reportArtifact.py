@@ -0,0 +1,10 @@
+from typing import TypedDict
+
+
+class IReportArtifact(TypedDict):
+    reportFilename: str
+    artifactKey: str
+    startDate: str
+    endDate: str
+    sizeBytes: int
+    createdAt: str
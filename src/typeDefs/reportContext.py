@@ -1,4 +1,4 @@
-from typing import TypedDict, List
+from typing import TypedDict, List, Dict
 from src.typeDefs.outage import IOutage
 from src.typeDefs.dayFreqProfile import IDayFreqProfile
 from src.typeDefs.stationVdiProfile import IStationVdiProfile
@@ -9,11 +9,8 @@ from src.typeDefs.lvNodesInfo import ILvNodesInfo
 from src.typeDefs.hvNodesInfo import IHvNodesInfo
 import datetime as dt
 
-class VoltageStatsDict(TypedDict):
-    table1: List[dict]
-    table2: List[dict]
-    table3: List[dict]
-    table4: List[dict]
+# rows of each daily voltage table of the station layout, like table1, table2, table3, table4
+VoltageStatsDict = Dict[str, List[dict]]
 
 
 class IReportCxt(TypedDict):
@@ -36,3 +33,5 @@ class IReportCxt(TypedDict):
     transCons: List[ITransConstraint]
     hvNodes: List[IHvNodesInfo]
     lvNodes: List[ILvNodesInfo]
+    # titles of the sections that missed the generation deadline
+    unavailableSections: List[str]
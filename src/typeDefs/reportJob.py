@@ -0,0 +1,20 @@
+from typing import TypedDict, List, Optional
+
+
+class IReportJobWeek(TypedDict):
+    startDate: str
+    endDate: str
+    status: str
+    outputPath: Optional[str]
+
+
+class IReportJob(TypedDict):
+    jobId: str
+    status: str
+    startDate: str
+    endDate: str
+    numWeeks: int
+    numWeeksDone: int
+    weeks: List[IReportJobWeek]
+    createdAt: str
+    finishedAt: Optional[str]
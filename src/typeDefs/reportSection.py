@@ -0,0 +1,22 @@
+from typing import Any, TypedDict, Callable, List, Tuple
+import datetime as dt
+
+
+class IReportSectionBase(TypedDict):
+    name: str
+    fetch: Callable[[dt.datetime, dt.datetime], dict]
+    successMsg: str
+    errorMsg: str
+
+
+class IReportSection(IReportSectionBase, total=False):
+    # fetches the section for many weeks at once, sections without it are fetched week by week
+    fetchWeeks: Callable[[List[Tuple[dt.datetime, dt.datetime]]], List[dict]]
+    # report context keys populated by the section, sections without it are fetched for every template
+    cxtKeys: List[str]
+    # section name shown in report if the section data is unavailable
+    title: str
+    # fetches the rows of a daily section for each of the given days, used with day slice store
+    fetchDaySlices: Callable[[List[dt.datetime]], List[Any]]
+    # builds the daily section for each week from the rows of all the days of the weeks
+    daySlicesToWeeks: Callable[[List[Any], List[Tuple[dt.datetime, dt.datetime]]], List[dict]]
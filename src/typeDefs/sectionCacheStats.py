@@ -0,0 +1,9 @@
+from typing import TypedDict
+
+
+class ISectionCacheStats(TypedDict):
+    hits: int
+    misses: int
+    numEntries: int
+    sizeBytes: int
+    maxSizeBytes: int
@@ -0,0 +1,14 @@
+from typing import TypedDict, List, Dict
+
+
+class IVoltTableLayout(TypedDict):
+    name: str
+    stnKeys: List[str]
+    stnColInds: List[int]
+
+
+class IVoltStatsLayout(TypedDict):
+    missingValue: str
+    tables: List[IVoltTableLayout]
+    stnColIndsMap: Dict[str, int]
+    numStns: int
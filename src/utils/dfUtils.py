@@ -0,0 +1,80 @@
+import pandas as pd
+import datetime as dt
+from typing import List, Dict, Tuple, Callable, Optional
+from src.utils.stringUtils import convertHrsToSpanStr
+
+# formatter converts a dataframe column into a list of context values
+IColFormatter = Callable[[pd.Series], list]
+
+
+def toFixed2Strs(col: pd.Series) -> List[str]:
+    """format numbers of a column as strings with 2 decimal places, like 49.9 to '49.90'
+    """
+    return ["{:0.2f}".format(v) for v in col.tolist()]
+
+
+def toRound2(col: pd.Series) -> List[float]:
+    """round numbers of a column to 2 decimal places
+    """
+    return col.round(2).tolist()
+
+
+def toRoundedInts(col: pd.Series) -> List[int]:
+    """round numbers of a column to nearest integers
+    """
+    return col.round().astype(int).tolist()
+
+
+def toHrsSpanStrs(col: pd.Series) -> List[str]:
+    """convert number of hours of a column to span strings, like 29.6 to '29:36'
+    """
+    return [convertHrsToSpanStr(v) for v in col.tolist()]
+
+
+def getDateStrsFormatter(dateFormat: str) -> IColFormatter:
+    """get a formatter that converts datetimes of a column to strings of the given format
+    """
+    def toDateStrs(col: pd.Series) -> List[str]:
+        return col.dt.strftime(dateFormat).tolist()
+    return toDateStrs
+
+
+def buildRowsFromColumns(df: pd.core.frame.DataFrame, rowSpec: Dict[str, Tuple[str, Optional[IColFormatter]]]) -> List[dict]:
+    """build context rows from a dataframe by formatting whole columns at once
+    and zipping them into row dictionaries
+
+    Args:
+        df (pd.core.frame.DataFrame): pandas dataframe
+        rowSpec (Dict[str, Tuple[str, Optional[IColFormatter]]]): row key -> (column name, column formatter),
+        column values are used as is if formatter is None
+
+    Returns:
+        List[dict]: list of rows, one row per dataframe row
+    """
+    rowKeys = list(rowSpec.keys())
+    colVals = [df[colName].tolist() if colFormatter is None else colFormatter(df[colName])
+               for colName, colFormatter in rowSpec.values()]
+    return [dict(zip(rowKeys, rowVals)) for rowVals in zip(*colVals)]
+
+
+def partitionByWeeks(df: pd.core.frame.DataFrame, dateCol: str, weekWindows: List[Tuple[dt.datetime, dt.datetime]]) -> List[pd.core.frame.DataFrame]:
+    """split the rows of a dataframe fetched for a date range into the given week windows.
+    Rows with date column between start day and end day (both at 00:00) of a week
+    go to that week, like 'date_col between to_date(:start_date) and to_date(:end_date)' in sql.
+    Rows of each week keep their original order
+
+    Args:
+        df (pd.core.frame.DataFrame): dataframe with rows of all the weeks
+        dateCol (str): name of the datetime column
+        weekWindows (List[Tuple[dt.datetime, dt.datetime]]): (start date, end date) of each week
+
+    Returns:
+        List[pd.core.frame.DataFrame]: dataframe of each week
+    """
+    dates = pd.to_datetime(df[dateCol])
+    weekDfs: List[pd.core.frame.DataFrame] = []
+    for startDt, endDt in weekWindows:
+        isInWeek = (dates >= pd.Timestamp(startDt.date())) & (
+            dates <= pd.Timestamp(endDt.date()))
+        weekDfs.append(df[isInWeek].reset_index(drop=True))
+    return weekDfs
@@ -1,5 +1,7 @@
 import re
-from typing import List
+from functools import lru_cache
+from typing import Collection, Iterable, List, Optional, Pattern, Tuple, Union
+from src.config.remarksRules import getRemarksRules, defaultRemarksRulesFilename
 
 
 def addTrailingZeroForTimeComp(nVal: int) -> str:
@@ -32,68 +34,117 @@ def convertHrsToSpanStr(nHrs) -> str:
     return spanStr
 
 
-def removeRedundantRemarks(outageTag, reason, remarks):
+@lru_cache(maxsize=2**16)
+def cleanTagRemark(strippedOutageTag: str, rStr: Optional[str], rulesFilename: str = defaultRemarksRulesFilename) -> Optional[str]:
+    """clean a reason or remark as per the rule of the outage tag.
+    Results are memoized since the same tag and text pairs repeat heavily across outages
+
+    Args:
+        strippedOutageTag (str): stripped and lower cased outage tag
+        rStr (Optional[str]): reason or remark
+        rulesFilename (str, optional): path of the remarks rules json file. Defaults to defaultRemarksRulesFilename.
+
+    Returns:
+        Optional[str]: cleaned reason or remark, None if it is redundant or empty
+    """
+    if rStr == None:
+        return rStr
+    remarksRules = getRemarksRules(rulesFilename)
+    if not(strippedOutageTag in remarksRules['ignoredTags']) and (strippedOutageTag == rStr.strip().lower()):
+        return None
+    tagRule = remarksRules['tagRules'].get(strippedOutageTag, None)
+    if not(tagRule == None):
+        rStr = removeUndesiredRemarksAndStartWords(
+            rStr, tagRule['undesiredRemarks'], tagRule['undesiredStartRegex'])
+    if (not(rStr == None) and rStr.strip() == ""):
+        rStr = None
+    return rStr
+
+
+def removeRedundantRemarks(outageTag, reason, remarks, rulesFilename: str = defaultRemarksRulesFilename):
     """Removes redundant reason or remarks if they are matching with outage tag
+    or the undesired remarks and start words of the outage tag rule
     Args:
         outageTag ([type]): outageTag
         reason ([type]): reason
         remarks ([type]): remarks
+        rulesFilename (str, optional): path of the remarks rules json file. Defaults to defaultRemarksRulesFilename.
     Returns:
         outageTag, reason, remarks: corrected outageTag, reason and remarks
     """
     if outageTag == None:
         return outageTag, reason, remarks
     strippedOutageTag = outageTag.strip().lower()
-    if strippedOutageTag == 'outage':
+    if strippedOutageTag in getRemarksRules(rulesFilename)['ignoredTags']:
         outageTag = None
-    else:
-        if not(reason == None) and (strippedOutageTag == reason.strip().lower()):
-            reason = None
-        if not(remarks == None) and (strippedOutageTag == remarks.strip().lower()):
-            remarks = None
-    if strippedOutageTag in ["manually opened due to high voltage"]:
-        undesiredRemarks = ["mohv"]
-        undesiredStartRegexStr = r'^(mohv\.?|vr\.?)'
-        reason = removeUndesiredRemarksAndStartWords(
-            reason, undesiredRemarks, undesiredStartRegexStr)
-        remarks = removeUndesiredRemarksAndStartWords(
-            remarks, undesiredRemarks, undesiredStartRegexStr)
-    elif strippedOutageTag in ["voltage regulation"]:
-        undesiredRemarks = ["vr"]
-        undesiredStartRegexStr = r'^vr\.?'
-        reason = removeUndesiredRemarksAndStartWords(
-            reason, undesiredRemarks, undesiredStartRegexStr)
-        remarks = removeUndesiredRemarksAndStartWords(
-            remarks, undesiredRemarks, undesiredStartRegexStr)
-    elif strippedOutageTag in ["rsd"]:
-        undesiredRemarks = ["rsd."]
-        undesiredStartRegexStr = r'^rsd\.?'
-        reason = removeUndesiredRemarksAndStartWords(
-            reason, undesiredRemarks, undesiredStartRegexStr)
-        remarks = removeUndesiredRemarksAndStartWords(
-            remarks, undesiredRemarks, undesiredStartRegexStr)
-
-    if (not(reason == None) and reason.strip() == ""):
-        reason = None
-
-    if (not(remarks == None) and remarks.strip() == ""):
-        remarks = None
-
+    reason = cleanTagRemark(strippedOutageTag, reason, rulesFilename)
+    remarks = cleanTagRemark(strippedOutageTag, remarks, rulesFilename)
     return outageTag, reason, remarks
 
 
+def removeRedundantRemarksBatch(outageTags: Iterable, reasons: Iterable, remarks: Iterable, rulesFilename: str = defaultRemarksRulesFilename) -> Tuple[list, list, list]:
+    """Removes redundant reasons and remarks of many outages at once,
+    each distinct (tag, reason, remarks) combination is cleaned only once
+
+    Args:
+        outageTags (Iterable): outage tags column
+        reasons (Iterable): reasons column
+        remarks (Iterable): remarks column
+        rulesFilename (str, optional): path of the remarks rules json file. Defaults to defaultRemarksRulesFilename.
+
+    Returns:
+        Tuple[list, list, list]: corrected outage tags, reasons and remarks columns
+    """
+    cleanedRows = {}
+    tagsCol, reasonsCol, remarksCol = [], [], []
+    for row in zip(outageTags, reasons, remarks):
+        cleanedRow = cleanedRows.get(row, None)
+        if cleanedRow == None:
+            cleanedRow = removeRedundantRemarks(*row, rulesFilename=rulesFilename)
+            cleanedRows[row] = cleanedRow
+        tagsCol.append(cleanedRow[0])
+        reasonsCol.append(cleanedRow[1])
+        remarksCol.append(cleanedRow[2])
+    return tagsCol, reasonsCol, remarksCol
+
+
+def cleanOutageReasons(outageTags: Iterable, reasons: Iterable, remarks: Iterable, rulesFilename: str = defaultRemarksRulesFilename) -> List[str]:
+    """derive the report reason strings of many outages at once from their tag, reason and remarks columns
+
+    Args:
+        outageTags (Iterable): outage tags column
+        reasons (Iterable): reasons column
+        remarks (Iterable): remarks column
+        rulesFilename (str, optional): path of the remarks rules json file. Defaults to defaultRemarksRulesFilename.
+
+    Returns:
+        List[str]: report reason of each outage like "RSD / Low demand"
+    """
+    reasonStrs = {}
+    reasonsCol = []
+    for row in zip(outageTags, reasons, remarks):
+        reasonStr = reasonStrs.get(row, None)
+        if reasonStr == None:
+            reasonStr = combineTagReasonRemarks(
+                *removeRedundantRemarks(*row, rulesFilename=rulesFilename))
+            reasonStrs[row] = reasonStr
+        reasonsCol.append(reasonStr)
+    return reasonsCol
+
+
 def combineTagReasonRemarks(tag, reas, rem):
     reasonStr = ' / '.join([r for r in [tag, reas,
                                         rem] if not(r == None) and not(r.strip() == "")])
     return reasonStr
 
 
-def removeUndesiredRemarksAndStartWords(rStr, undesiredRemarks: List[str], undesiredStartRegexStr: str):
+def removeUndesiredRemarksAndStartWords(rStr, undesiredRemarks: Collection[str], undesiredStartRegex: Union[str, Pattern]):
     if not(rStr == None):
-        replaceRegex = re.compile(undesiredStartRegexStr, re.IGNORECASE)
+        if isinstance(undesiredStartRegex, str):
+            undesiredStartRegex = re.compile(undesiredStartRegex, re.IGNORECASE)
         if (rStr.strip().lower() in undesiredRemarks):
             rStr = None
         else:
             # perform case insensitive replace in reason https://stackoverflow.com/a/14817425/2746323
-            rStr = replaceRegex.sub('', rStr.strip())
+            rStr = undesiredStartRegex.sub('', rStr.strip())
     return rStr
@@ -1,4 +1,6 @@
 import datetime as dt
+from typing import List, Tuple
+from src.typeDefs.finWeek import IFinWeek
 
 
 def getWeekNumOfFinYr(inpDt: dt.datetime) -> int:
@@ -59,11 +61,8 @@ def getMondayBeforeDt(inpDt: dt.datetime) -> dt.datetime:
     Returns:
         dt.datetime: first monday before input date
     """
-    # get first Monday before inpDt
-    inpMonday = inpDt
-    while not dt.datetime.strftime(inpMonday, '%w') == '1':
-        inpMonday = inpMonday - dt.timedelta(days=1)
-    return inpMonday
+    # get first Monday before inpDt, weekday of Monday is 0
+    return inpDt - dt.timedelta(days=inpDt.weekday())
 
 
 def getSundayAfterDt(inpDt: dt.datetime) -> dt.datetime:
@@ -75,7 +74,77 @@ def getSundayAfterDt(inpDt: dt.datetime) -> dt.datetime:
     Returns:
         dt.datetime: first Sunday after input date
     """
-    inpSunday = inpDt
-    while not dt.datetime.strftime(inpSunday, '%w') == '0':
-        inpSunday = inpSunday + dt.timedelta(days=1)
-    return inpSunday
+    # weekday of Sunday is 6
+    return inpDt + dt.timedelta(days=6 - inpDt.weekday())
+
+
+def getFinYearLabel(finYr: int) -> str:
+    """get the financial year label shown in report
+
+    Args:
+        finYr (int): financial year like 2020
+
+    Returns:
+        str: financial year label like 2020-21
+    """
+    return '{0}-{1}'.format(finYr, (finYr+1) % 100)
+
+
+def getFinWeeks(startDt: dt.datetime, endDt: dt.datetime) -> List[IFinWeek]:
+    """ gets the Monday to Sunday weeks that cover the dates between start and end dates
+    along with their financial year week numbers and financial years.
+    Week numbers and financial years of all the weeks are derived at once with vectorized date arithmetic,
+    results are same as getWeekNumOfFinYr and getFinYearForDt of each week start
+
+    Args:
+        startDt (dt.datetime): start date
+        endDt (dt.datetime): end date
+
+    Returns:
+        List[IFinWeek]: Monday, Sunday, week number and financial year of each week
+    """
+    if startDt > endDt:
+        return []
+    # numpy is imported on first use to keep the entry points startup fast
+    import numpy as np
+    firstMonday = getMondayBeforeDt(startDt)
+    numWeeks = 1 + (endDt - firstMonday) // dt.timedelta(days=7)
+
+    # week numbers are counted from the first Monday before 1st Apr of the Monday's year
+    mondays = np.datetime64(firstMonday.date(), 'D') + 7*np.arange(numWeeks)
+    mondayYrs = mondays.astype('datetime64[Y]')
+    aprFirsts = (mondayYrs.astype('datetime64[M]') + 3).astype('datetime64[D]')
+    # 1970-01-01 is a Thursday, hence weekday with Monday as 0 is (days since epoch + 3) % 7
+    finStartMondays = aprFirsts - (aprFirsts.astype(int) + 3) % 7
+    wkNums = 1 + (mondays - finStartMondays).astype(int) // 7
+
+    # financial year is the year of the Sunday, or one less if the Sunday is before April
+    sundays = mondays + 6
+    sundayYrs = sundays.astype('datetime64[Y]')
+    sundayMonths = (sundays.astype('datetime64[M]') - sundayYrs).astype(int) + 1
+    finYrs = sundayYrs.astype(int) + 1970 - (sundayMonths < 4)
+
+    finWeeks: List[IFinWeek] = []
+    for weekInd, (wkNum, finYr) in enumerate(zip(wkNums.tolist(), finYrs.tolist())):
+        weekStartDt = firstMonday + dt.timedelta(days=7*weekInd)
+        finWeeks.append({
+            'startDt': weekStartDt,
+            'endDt': weekStartDt + dt.timedelta(days=6),
+            'wkNum': wkNum,
+            'finYr': finYr,
+            'finYrStr': getFinYearLabel(finYr)
+        })
+    return finWeeks
+
+
+def getWeekWindows(startDt: dt.datetime, endDt: dt.datetime) -> List[Tuple[dt.datetime, dt.datetime]]:
+    """ gets the Monday to Sunday weeks that cover the dates between start and end dates
+
+    Args:
+        startDt (dt.datetime): start date
+        endDt (dt.datetime): end date
+
+    Returns:
+        List[Tuple[dt.datetime, dt.datetime]]: list of (Monday, Sunday) of each week
+    """
+    return [(w['startDt'], w['endDt']) for w in getFinWeeks(startDt, endDt)]
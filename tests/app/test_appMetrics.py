@@ -0,0 +1,26 @@
+import unittest
+from src.app.appMetrics import AppMetrics
+
+
+class TestAppMetrics(unittest.TestCase):
+    def test_promText(self) -> None:
+        """tests the prometheus text exposition of section histograms, failure counters and in-flight gauge
+        """
+        appMetrics = AppMetrics()
+        appMetrics.sectionFetchSecs.observe(0.3, 'genOtgs')
+        appMetrics.sectionFetchSecs.observe(7, 'genOtgs')
+        appMetrics.sectionFailures.inc('vdi')
+        appMetrics.generationsInFlight.inc()
+        appMetrics.generationsInFlight.inc()
+        appMetrics.generationsInFlight.dec()
+        promLines = appMetrics.toPromText().splitlines()
+
+        self.assertTrue('# TYPE mis_report_section_fetch_seconds histogram' in promLines)
+        self.assertTrue('mis_report_section_fetch_seconds_bucket{section="genOtgs",le="0.25"} 0' in promLines)
+        self.assertTrue('mis_report_section_fetch_seconds_bucket{section="genOtgs",le="0.5"} 1' in promLines)
+        self.assertTrue('mis_report_section_fetch_seconds_bucket{section="genOtgs",le="+Inf"} 2' in promLines)
+        self.assertTrue('mis_report_section_fetch_seconds_sum{section="genOtgs"} 7.3' in promLines)
+        self.assertTrue('mis_report_section_fetch_seconds_count{section="genOtgs"} 2' in promLines)
+        self.assertTrue('mis_report_section_failures_total{section="vdi"} 1.0' in promLines)
+        self.assertTrue('mis_report_render_failures_total 0.0' in promLines)
+        self.assertTrue('mis_report_generations_in_flight 1.0' in promLines)
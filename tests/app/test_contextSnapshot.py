@@ -0,0 +1,54 @@
+import os
+import unittest
+import tempfile
+import datetime as dt
+import numpy as np
+import pandas as pd
+from src.app.contextSnapshot import dumpContextSnapshot, loadContextSnapshotBytes, saveContextSnapshot, loadContextSnapshot
+
+
+class TestContextSnapshot(unittest.TestCase):
+    def test_roundTrip(self) -> None:
+        """tests that datetimes, numpy scalars and other values are loaded back exactly with their types
+        """
+        reportCxt = {
+            'startDtObj': dt.datetime(2020, 8, 10),
+            'endDtObj': dt.datetime(2020, 8, 16, 23, 59, 59, 123456),
+            'wkNum': 20,
+            'weeklyFdi': np.float64(0.1) + np.float64(0.2),
+            'freqProfRows': [{'date': dt.date(2020, 8, 10), 'maxFreq': np.float32(50.07),
+                              'numRows': np.int64(2**60), 'isValid': np.bool_(True)}],
+            'genOtgs': [{'outageTime': pd.Timestamp('2020-08-10 10:15:00.000000001'),
+                         'owners': None, 'capacity': float('nan'), 'pair': ('a', 1)}],
+            'voltStats': {400: [np.datetime64('2020-08-10T10:15')]}
+        }
+        snapshotBytes = dumpContextSnapshot(reportCxt)
+        self.assertTrue(snapshotBytes == dumpContextSnapshot(reportCxt))
+        loadedCxt = loadContextSnapshotBytes(snapshotBytes)
+        self.assertTrue(loadedCxt['endDtObj'] == reportCxt['endDtObj'])
+        self.assertTrue(loadedCxt['weeklyFdi'] == reportCxt['weeklyFdi'])
+        self.assertTrue(type(loadedCxt['weeklyFdi']) == np.float64)
+        freqRow = loadedCxt['freqProfRows'][0]
+        self.assertTrue(freqRow['date'] == dt.date(2020, 8, 10))
+        self.assertTrue(freqRow['maxFreq'] == np.float32(50.07) and type(freqRow['maxFreq']) == np.float32)
+        self.assertTrue(freqRow['numRows'] == 2**60 and type(freqRow['numRows']) == np.int64)
+        self.assertTrue(type(freqRow['isValid']) == np.bool_ and freqRow['isValid'])
+        otg = loadedCxt['genOtgs'][0]
+        self.assertTrue(otg['outageTime'] == reportCxt['genOtgs'][0]['outageTime'])
+        self.assertTrue(otg['owners'] is None and np.isnan(otg['capacity']))
+        self.assertTrue(otg['pair'] == ('a', 1))
+        self.assertTrue(loadedCxt['voltStats'][400][0] == np.datetime64('2020-08-10T10:15'))
+
+    def test_snapshotFile(self) -> None:
+        """tests that snapshot file is saved and loaded, and snapshots of other versions are rejected
+        """
+        reportCxt = {'startDtObj': dt.datetime(2020, 8, 10), 'wkNum': 20}
+        with tempfile.TemporaryDirectory() as tmpFolder:
+            snapshotPath = os.path.join(tmpFolder, 'week.ctx.json.gz')
+            saveContextSnapshot(reportCxt, snapshotPath)
+            self.assertTrue(loadContextSnapshot(snapshotPath) == reportCxt)
+
+        import gzip
+        otherVersionBytes = gzip.compress(b'{"version":0,"context":{}}')
+        with self.assertRaises(ValueError):
+            loadContextSnapshotBytes(otherVersionBytes)
@@ -0,0 +1,74 @@
+import os
+import unittest
+import tempfile
+import datetime as dt
+from docx import Document
+from src.app.reportArtifactStore import ReportArtifactStore
+from src.app.weeklyReportGenerator import WeeklyReportGenerator, renderReportWithStats
+
+
+class TestReportArtifactStore(unittest.TestCase):
+    def test_skipUnchanged(self) -> None:
+        """tests that render is skipped for an identical report and done again if context or template changes
+        """
+        tmplPath = 'assets/weekly_report_template.docx'
+        reportCxt = WeeklyReportGenerator(None).getInitialReportContext(
+            dt.datetime(2020, 8, 10), dt.datetime(2020, 8, 16, 23, 59, 59))
+        with tempfile.TemporaryDirectory() as tmpFolder:
+            artifactStore = ReportArtifactStore(os.path.join(tmpFolder, 'artifacts'), maxSizeBytes=10**8)
+            dumpFolder = os.path.join(tmpFolder, 'dumps')
+            os.makedirs(dumpFolder)
+            renderStats = renderReportWithStats(reportCxt, tmplPath, dumpFolder, artifactStore=artifactStore)
+            self.assertTrue(renderStats['isSuccess'] and not(renderStats['isRenderSkipped']))
+
+            reportFilename = 'Weekly_no_20_10-08-2020_to_16-08-2020.docx'
+            os.remove(os.path.join(dumpFolder, reportFilename))
+            renderStats = renderReportWithStats(reportCxt, tmplPath, dumpFolder, artifactStore=artifactStore)
+            self.assertTrue(renderStats['isSuccess'] and renderStats['isRenderSkipped'])
+            self.assertTrue(os.path.isfile(os.path.join(dumpFolder, reportFilename)))
+            artifactInfo = artifactStore.getReportArtifact(reportFilename)
+            self.assertTrue(artifactInfo['artifactKey'] == artifactStore.getArtifactKey(reportCxt, tmplPath))
+            self.assertTrue([a['reportFilename'] for a in artifactStore.listReportArtifacts()] == [reportFilename])
+
+            # changed context is rendered again and indexed as the latest report of the week
+            changedCxt = dict(reportCxt, hvNodes=[{'name': 'node'}])
+            renderStats = renderReportWithStats(changedCxt, tmplPath, dumpFolder, artifactStore=artifactStore)
+            self.assertTrue(not(renderStats['isRenderSkipped']))
+            self.assertTrue(artifactStore.getReportArtifact(reportFilename)['artifactKey'] ==
+                            artifactStore.getArtifactKey(changedCxt, tmplPath))
+
+            # restoring the earlier context indexes it again as the latest report of the week
+            renderStats = renderReportWithStats(reportCxt, tmplPath, dumpFolder, artifactStore=artifactStore)
+            self.assertTrue(renderStats['isRenderSkipped'])
+            self.assertTrue(artifactStore.getReportArtifact(reportFilename)['artifactKey'] ==
+                            artifactStore.getArtifactKey(reportCxt, tmplPath))
+
+            # changed template is rendered again
+            otherTmplPath = os.path.join(tmpFolder, 'summary_template.docx')
+            doc = Document()
+            doc.add_paragraph('Week {{ wkNum }}')
+            doc.save(otherTmplPath)
+            renderStats = renderReportWithStats(reportCxt, otherTmplPath, dumpFolder, artifactStore=artifactStore)
+            self.assertTrue(not(renderStats['isRenderSkipped']))
+            self.assertTrue(artifactStore.getReportArtifact('../' + reportFilename) is None)
+
+    def test_eviction(self) -> None:
+        """tests that least recently used reports are evicted once size limit is crossed
+        """
+        with tempfile.TemporaryDirectory() as tmpFolder:
+            artifactStore = ReportArtifactStore(os.path.join(tmpFolder, 'artifacts'), maxSizeBytes=1500)
+            startDt = dt.datetime(2020, 8, 10)
+            reportPaths = []
+            for weekInd in range(3):
+                reportPath = os.path.join(tmpFolder, 'week_{0}.docx'.format(weekInd))
+                with open(reportPath, 'wb') as f:
+                    f.write(b'x'*600)
+                reportPaths.append(reportPath)
+            artifactStore.putArtifact('key0', reportPaths[0], startDt, startDt)
+            artifactStore.putArtifact('key1', reportPaths[1], startDt, startDt)
+            # second report is least recently used
+            os.utime(artifactStore.getArtifactPath('key1'), (10**9, 10**9))
+            artifactStore.putArtifact('key2', reportPaths[2], startDt, startDt)
+            self.assertTrue(artifactStore.getReportArtifact('week_1.docx') is None)
+            self.assertTrue(artifactStore.getReportArtifact('week_0.docx') is not None)
+            self.assertTrue(artifactStore.getReportArtifact('week_2.docx') is not None)
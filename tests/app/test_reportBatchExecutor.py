@@ -0,0 +1,68 @@
+import os
+import unittest
+import tempfile
+import datetime as dt
+from src.app.reportBatchExecutor import ReportBatchExecutor
+from tests.app.test_weeklyReportGenerator import SlowSectionsReportGenerator
+from src.utils.timeUtils import getWeekWindows
+
+
+class NoDbReportGenerator(SlowSectionsReportGenerator):
+    """report generator that fails if week contexts are fetched
+    """
+
+    def getReportContextObjs(self, weekWindows, refreshCache=False, tmplPath=None, refreshSections=None):
+        raise Exception("week contexts should not be fetched")
+
+
+class TestReportBatchExecutor(unittest.TestCase):
+    def test_pipelinedRun(self) -> None:
+        """tests that all weeks are fetched and rendered by worker processes
+        """
+        weekWindows = getWeekWindows(dt.datetime(2020, 8, 10), dt.datetime(2020, 8, 23))
+        wklyRprtGntr = SlowSectionsReportGenerator(None, fetchWorkers=5)
+        batchExecutor = ReportBatchExecutor(wklyRprtGntr, renderWorkers=2, prefetchWeeks=1)
+        doneWeeks = {}
+        with tempfile.TemporaryDirectory() as dumpFolder:
+            weekResults = batchExecutor.run(weekWindows, 'assets/weekly_report_template.docx', dumpFolder,
+                                            onWeekDone=lambda weekInd, outPath: doneWeeks.update({weekInd: outPath}))
+            self.assertTrue(weekResults == [True, True])
+            self.assertTrue(sorted(doneWeeks.keys()) == [0, 1])
+            self.assertTrue(os.path.isfile(doneWeeks[1]))
+            self.assertTrue(os.path.basename(doneWeeks[0]) ==
+                            'Weekly_no_20_10-08-2020_to_16-08-2020.docx')
+
+    def test_failedWeek(self) -> None:
+        """tests that a week with missing template is reported as failed
+        """
+        weekWindows = getWeekWindows(dt.datetime(2020, 8, 10), dt.datetime(2020, 8, 16))
+        wklyRprtGntr = SlowSectionsReportGenerator(None, fetchWorkers=5)
+        batchExecutor = ReportBatchExecutor(wklyRprtGntr, renderWorkers=0)
+        with tempfile.TemporaryDirectory() as dumpFolder:
+            weekResults = batchExecutor.run(
+                weekWindows, os.path.join(dumpFolder, 'missing.docx'), dumpFolder)
+            self.assertTrue(weekResults == [False])
+
+    def test_snapshotReplay(self) -> None:
+        """tests that reports are rendered again from saved context snapshots without fetching
+        """
+        weekWindows = getWeekWindows(dt.datetime(2020, 8, 10), dt.datetime(2020, 8, 23))
+        tmplPath = 'assets/weekly_report_template.docx'
+        with tempfile.TemporaryDirectory() as dumpFolder:
+            batchExecutor = ReportBatchExecutor(
+                SlowSectionsReportGenerator(None, fetchWorkers=5), renderWorkers=0)
+            self.assertTrue(batchExecutor.run(weekWindows, tmplPath, dumpFolder) == [True, True])
+            self.assertTrue(os.path.isfile(os.path.join(
+                dumpFolder, 'Weekly_no_20_10-08-2020_to_16-08-2020.ctx.json.gz')))
+            os.remove(os.path.join(dumpFolder, 'Weekly_no_20_10-08-2020_to_16-08-2020.docx'))
+
+            batchExecutor = ReportBatchExecutor(NoDbReportGenerator(None), renderWorkers=2)
+            weekResults = batchExecutor.run(weekWindows, tmplPath, dumpFolder, fromSnapshot=True)
+            self.assertTrue(weekResults == [True, True])
+            self.assertTrue(os.path.isfile(os.path.join(
+                dumpFolder, 'Weekly_no_20_10-08-2020_to_16-08-2020.docx')))
+
+            # week without snapshot is reported as failed
+            weekResults = batchExecutor.run(getWeekWindows(dt.datetime(2020, 8, 24), dt.datetime(2020, 8, 30)),
+                                            tmplPath, dumpFolder, fromSnapshot=True)
+            self.assertTrue(weekResults == [False])
@@ -0,0 +1,51 @@
+import time
+import unittest
+import datetime as dt
+from src.app.reportJobsManager import ReportJobsManager
+from src.utils.timeUtils import getWeekWindows
+
+
+class TestReportJobsManager(unittest.TestCase):
+    def waitForJob(self, jobsMgr: ReportJobsManager, jobId: str) -> dict:
+        for _ in range(100):
+            job = jobsMgr.getJob(jobId)
+            if job['status'] in ['done', 'failed']:
+                return job
+            time.sleep(0.05)
+        return job
+
+    def test_jobProgress(self) -> None:
+        """tests that a multi week job reports per week progress and output paths
+        """
+        jobsMgr = ReportJobsManager(maxWorkers=1)
+        weekWindows = getWeekWindows(dt.datetime(2020, 8, 10), dt.datetime(2020, 8, 30))
+
+        def generateWeeks(weekWindows, onWeekDone):
+            for weekInd, (startDt, endDt) in enumerate(weekWindows):
+                # second week fails
+                onWeekDone(weekInd, None if weekInd == 1 else 'report_{0}.docx'.format(startDt.day))
+        jobId = jobsMgr.submitJob(weekWindows, generateWeeks)
+        job = self.waitForJob(jobsMgr, jobId)
+        self.assertTrue(job['status'] == 'failed')
+        self.assertTrue(job['numWeeks'] == 3 and job['numWeeksDone'] == 3)
+        self.assertTrue([w['status'] for w in job['weeks']] == ['done', 'failed', 'done'])
+        self.assertTrue(job['weeks'][2]['outputPath'] == 'report_24.docx')
+        self.assertTrue(jobsMgr.getJob('unknown') is None)
+
+    def test_queueLimitAndTtl(self) -> None:
+        """tests that jobs beyond pending limit are rejected and finished jobs expire
+        """
+        jobsMgr = ReportJobsManager(maxWorkers=1, maxPendingJobs=1, jobTtlSecs=0)
+        weekWindows = getWeekWindows(dt.datetime(2020, 8, 10), dt.datetime(2020, 8, 16))
+        jobId = jobsMgr.submitJob(weekWindows, lambda w, cb: time.sleep(0.2) or cb(0, 'a.docx'))
+        self.assertTrue(jobsMgr.submitJob(weekWindows, lambda w, cb: cb(0, 'b.docx')) is None)
+        time.sleep(0.5)
+        self.assertTrue(jobsMgr.getJob(jobId) is None)
+        self.assertTrue(jobsMgr.submitJob(weekWindows, lambda w, cb: cb(0, 'b.docx')) is not None)
+
+    def test_emptyWeeks(self) -> None:
+        """tests that a job without weeks is rejected
+        """
+        jobsMgr = ReportJobsManager(maxWorkers=1)
+        with self.assertRaises(ValueError):
+            jobsMgr.submitJob([], lambda w, cb: None)
@@ -0,0 +1,33 @@
+import unittest
+import tempfile
+import datetime as dt
+from src.app.sectionCache import SectionCache
+
+
+class TestSectionCache(unittest.TestCase):
+    def test_getPut(self) -> None:
+        """tests storing and fetching section payloads with LRU eviction
+        """
+        startDt = dt.datetime(2020, 8, 10)
+        endDt = dt.datetime(2020, 8, 16, 23, 59, 59)
+        with tempfile.TemporaryDirectory() as cacheFolder:
+            sectionCache = SectionCache(cacheFolder, maxSizeBytes=1000)
+            self.assertTrue(sectionCache.isServable(endDt))
+            self.assertTrue(sectionCache.get('ictCons', startDt, endDt) is None)
+
+            sectionCxt = {'ictCons': [{'ict': 'a', 'season': 'b', 'description': 'c'}]}
+            entryBytes = sectionCache.put('ictCons', startDt, endDt, sectionCxt)
+            self.assertTrue(entryBytes == sectionCache.getStats()['sizeBytes'])
+            self.assertTrue(sectionCache.get('ictCons', startDt, endDt) == sectionCxt)
+            # other windows are not served
+            self.assertTrue(sectionCache.get('ictCons', startDt, startDt) is None)
+
+            # older entries get evicted once size limit is crossed
+            sectionCache.put('transCons', startDt, endDt, {'transCons': ['x'*600]})
+            sectionCache.put('hvNodes', startDt, endDt, {'hvNodes': ['x'*600]})
+            self.assertTrue(sectionCache.get('transCons', startDt, endDt) is None)
+            self.assertTrue(sectionCache.get('hvNodes', startDt, endDt) is not None)
+
+            cacheStats = sectionCache.getStats()
+            self.assertTrue(cacheStats['hits'] == 2 and cacheStats['misses'] == 3)
+            self.assertTrue(cacheStats['sizeBytes'] <= 1000)
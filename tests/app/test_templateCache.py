@@ -0,0 +1,39 @@
+import os
+import shutil
+import tempfile
+import unittest
+from src.app.templateCache import TemplateCache, CachingJinjaEnv
+
+
+class TestTemplateCache(unittest.TestCase):
+    def test_mtimeInvalidation(self) -> None:
+        """tests that a template is parsed once and parsed again only after the file changes
+        """
+        with tempfile.TemporaryDirectory() as tmpFolder:
+            tmplPath = os.path.join(tmpFolder, 'tmpl.docx')
+            shutil.copy('assets/weekly_report_template.docx', tmplPath)
+            tmplCache = TemplateCache()
+            doc1 = tmplCache.getTemplate(tmplPath)
+            doc2 = tmplCache.getTemplate(tmplPath)
+            # each render gets its own template sharing the parsed contents
+            self.assertTrue(doc1 is not doc2)
+            self.assertTrue(doc1.parsedTmpl is doc2.parsedTmpl)
+
+            tmplVars = tmplCache.getTemplateVariables(tmplPath)
+            self.assertTrue({'genOtgs', 'voltStats', 'wkNum'}.issubset(tmplVars))
+            self.assertTrue(tmplCache.getTemplateVariables(tmplPath) is tmplVars)
+
+            mtime = os.path.getmtime(tmplPath)
+            os.utime(tmplPath, (mtime + 10, mtime + 10))
+            doc3 = tmplCache.getTemplate(tmplPath)
+            self.assertTrue(doc3.parsedTmpl is not doc1.parsedTmpl)
+            self.assertTrue(doc3.parsedTmpl.tmplVars is None)
+
+    def test_jinjaCompileCache(self) -> None:
+        """tests that same template source is compiled only once
+        """
+        jinjaEnv = CachingJinjaEnv()
+        tmpl1 = jinjaEnv.from_string('week {{ wkNum }}')
+        tmpl2 = jinjaEnv.from_string('week {{ wkNum }}')
+        self.assertTrue(tmpl1 is tmpl2)
+        self.assertTrue(tmpl1.render({'wkNum': 5}) == 'week 5')
@@ -0,0 +1,286 @@
+import os
+import sqlite3
+import unittest
+import time
+import tempfile
+import datetime as dt
+from unittest import mock
+from docx import Document
+from src.app.weeklyReportGenerator import WeeklyReportGenerator
+from src.app.sectionCache import SectionCache
+from src.app.daySliceStore import DaySliceStore
+from src.app.appMetrics import getAppMetrics
+from src.fetchers.iegcViolMsgsFetcher import IegcViolMsgsFetcher
+from src.db.sqliteDataSource import SqliteDataSource, WarehouseConnection, UpperCaseCursor
+from src.db.syntheticWarehouse import generateSyntheticWarehouse
+from src.utils.timeUtils import getWeekWindows, getWeekNumOfFinYr, getFinYearForDt, getFinYearLabel
+
+
+class HungViolMsgsCursor(UpperCaseCursor):
+    """cursor that hangs on iegc violation messages queries like a locked table
+    """
+
+    def execute(self, sql, *args):
+        if 'IEGC_VIOLATION_MESSAGE_DATA' in sql.upper():
+            time.sleep(3)
+        return super().execute(sql, *args)
+
+
+class HungViolMsgsConnection(WarehouseConnection):
+    def cursor(self, factory=HungViolMsgsCursor):
+        return super().cursor(factory)
+
+
+class HungViolMsgsDataSource(SqliteDataSource):
+    connectionFactory = HungViolMsgsConnection
+
+
+class SlowSectionsReportGenerator(WeeklyReportGenerator):
+    """report generator with slow dummy sections instead of db fetches
+    """
+
+    def getReportSections(self):
+        def slowSection(cxtKey):
+            def fetch(startDate, endDate):
+                time.sleep(0.2)
+                return {cxtKey: [cxtKey]}
+            return fetch
+
+        def failingSection(startDate, endDate):
+            raise Exception("dummy fetch error")
+
+        sections = [{'name': k, 'cxtKeys': [k], 'fetch': slowSection(k), 'successMsg': k, 'errorMsg': k}
+                    for k in ['genOtgs', 'transOtgs', 'ictCons', 'hvNodes']]
+        sections.append({'name': 'lvNodes', 'fetch': failingSection,
+                         'successMsg': 'lvNodes', 'errorMsg': 'lvNodes'})
+        return sections
+
+
+class RangeSectionsReportGenerator(WeeklyReportGenerator):
+    """report generator with dummy range fetch sections that count the fetches
+    """
+
+    def getReportSections(self):
+        self.numRangeFetches = 0
+
+        def fetchWeeks(weekWindows):
+            self.numRangeFetches += 1
+            return [{'genOtgs': [startDate.day]} for startDate, _ in weekWindows]
+        return [{'name': 'genOtgs', 'fetchWeeks': fetchWeeks, 'successMsg': 'genOtgs', 'errorMsg': 'genOtgs'}]
+
+
+class TestWeeklyReportGenerator(unittest.TestCase):
+    def test_concurrentFetch(self) -> None:
+        """tests that report sections are fetched concurrently with per section error isolation
+        """
+        startDate = dt.datetime(2020, 8, 10)
+        endDate = dt.datetime(2020, 8, 16)
+
+        appMetrics = getAppMetrics()
+        numFailures = appMetrics.sectionFailures.getValue('lvNodes')
+        numHvNodesFetches = appMetrics.sectionFetchSecs.getCount('hvNodes')
+        wklyRprtGntr = SlowSectionsReportGenerator(None, fetchWorkers=5)
+        fetchStartTime = time.time()
+        reportCxt = wklyRprtGntr.getReportContextObj(startDate, endDate)
+        fetchSecs = time.time() - fetchStartTime
+
+        self.assertTrue(fetchSecs < 0.6)
+        self.assertTrue(reportCxt['genOtgs'] == ['genOtgs'])
+        self.assertTrue(reportCxt['hvNodes'] == ['hvNodes'])
+        self.assertTrue(reportCxt['lvNodes'] == [])
+        self.assertTrue(reportCxt['wkNum'] == 20)
+        self.assertTrue(appMetrics.sectionFailures.getValue('lvNodes') == numFailures + 1)
+        self.assertTrue(appMetrics.sectionFetchSecs.getCount('hvNodes') == numHvNodesFetches + 1)
+
+    def test_sectionCache(self) -> None:
+        """tests that sections of old weeks are served from section cache unless refresh is requested
+        """
+        startDate = dt.datetime(2020, 8, 10)
+        endDate = dt.datetime(2020, 8, 16)
+        appMetrics = getAppMetrics()
+        with tempfile.TemporaryDirectory() as cacheFolder:
+            sectionCache = SectionCache(cacheFolder, maxSizeBytes=10**6)
+            wklyRprtGntr = SlowSectionsReportGenerator(
+                None, fetchWorkers=5, sectionCache=sectionCache)
+            numIctConsBytes = appMetrics.sectionBytes.getValue('ictCons')
+            wklyRprtGntr.getReportContextObj(startDate, endDate)
+            self.assertTrue(sectionCache.getStats()['numEntries'] == 4)
+            # payload bytes of the fetch are the bytes saved in section cache
+            ictConsEntryPath = sectionCache.getEntryPath('ictCons', startDate, endDate.replace(hour=23, minute=59, second=59))
+            self.assertTrue(appMetrics.sectionBytes.getValue('ictCons') - numIctConsBytes ==
+                            os.path.getsize(ictConsEntryPath))
+
+            numIctConsHits = appMetrics.sectionCacheHits.getValue('ictCons')
+            fetchStartTime = time.time()
+            reportCxt = wklyRprtGntr.getReportContextObj(startDate, endDate)
+            self.assertTrue(time.time() - fetchStartTime < 0.2)
+            self.assertTrue(reportCxt['ictCons'] == ['ictCons'])
+            self.assertTrue(sectionCache.getStats()['hits'] == 4)
+            self.assertTrue(appMetrics.sectionCacheHits.getValue('ictCons') == numIctConsHits + 1)
+
+            wklyRprtGntr.getReportContextObj(startDate, endDate, refreshCache=True)
+            self.assertTrue(sectionCache.getStats()['hits'] == 4)
+
+    def test_rangeFetch(self) -> None:
+        """tests that a section is fetched once for many weeks and served per week from section cache later
+        """
+        weekWindows = [(dt.datetime(2020, 8, 10), dt.datetime(2020, 8, 16)),
+                       (dt.datetime(2020, 8, 17), dt.datetime(2020, 8, 23)),
+                       (dt.datetime(2020, 8, 24), dt.datetime(2020, 8, 30))]
+        with tempfile.TemporaryDirectory() as cacheFolder:
+            sectionCache = SectionCache(cacheFolder, maxSizeBytes=10**6)
+            wklyRprtGntr = RangeSectionsReportGenerator(None, sectionCache=sectionCache)
+            reportCxts = wklyRprtGntr.getReportContextObjs(weekWindows[0:2])
+            self.assertTrue(wklyRprtGntr.numRangeFetches == 1)
+            self.assertTrue([c['genOtgs'] for c in reportCxts] == [[10], [17]])
+            self.assertTrue(reportCxts[1]['endDtObj'] == dt.datetime(2020, 8, 23, 23, 59, 59))
+
+            # only the week missing in section cache is fetched
+            reportCxts = wklyRprtGntr.getReportContextObjs(weekWindows)
+            self.assertTrue(wklyRprtGntr.numRangeFetches == 1)
+            self.assertTrue([c['genOtgs'] for c in reportCxts] == [[10], [17], [24]])
+            self.assertTrue(sectionCache.getStats()['hits'] == 2)
+
+    def test_finWeeksOfBatch(self) -> None:
+        """tests that week numbers and financial years of a batch are taken from the bulk financial weeks calendar
+        """
+        weekWindows = getWeekWindows(dt.datetime(2021, 3, 15), dt.datetime(2021, 4, 18))
+        wklyRprtGntr = RangeSectionsReportGenerator(None)
+        with mock.patch('src.app.weeklyReportGenerator.getWeekNumOfFinYr', side_effect=AssertionError):
+            reportCxts = wklyRprtGntr.getReportContextObjs(weekWindows)
+        self.assertTrue([(c['wkNum'], c['finYr']) for c in reportCxts] ==
+                        [(getWeekNumOfFinYr(s), getFinYearLabel(getFinYearForDt(s))) for s, _ in weekWindows])
+        self.assertTrue([c['finYr'] for c in reportCxts] == ['2020-21', '2020-21', '2021-22', '2021-22', '2021-22'])
+
+    def test_templatePlannedSections(self) -> None:
+        """tests that only the sections used by the template are fetched
+        """
+        startDate = dt.datetime(2020, 8, 10)
+        endDate = dt.datetime(2020, 8, 16)
+        with tempfile.TemporaryDirectory() as tmpFolder:
+            # summary template that uses only genOtgs among the sections
+            tmplPath = os.path.join(tmpFolder, 'summary_template.docx')
+            doc = Document()
+            doc.add_paragraph('Week {{ wkNum }}')
+            doc.add_paragraph('{% for otg in genOtgs %}{{ otg }}{% endfor %}')
+            doc.save(tmplPath)
+
+            wklyRprtGntr = SlowSectionsReportGenerator(None)
+            fetchStartTime = time.time()
+            reportCxt = wklyRprtGntr.getReportContextObj(
+                startDate, endDate, tmplPath=tmplPath)
+            self.assertTrue(time.time() - fetchStartTime < 0.4)
+            self.assertTrue(reportCxt['genOtgs'] == ['genOtgs'])
+            self.assertTrue(reportCxt['hvNodes'] == [])
+            # lvNodes section has no context keys, hence it is fetched for every template
+            self.assertTrue(reportCxt['lvNodes'] == [])
+
+    def test_refreshSections(self) -> None:
+        """tests that only the requested sections are fetched again and other sections are reused from section cache
+        """
+        startDate = dt.datetime(2020, 8, 10)
+        endDate = dt.datetime(2020, 8, 16)
+        appMetrics = getAppMetrics()
+        with tempfile.TemporaryDirectory() as cacheFolder:
+            # cache with huge min age, so that the week is treated as a recent week
+            sectionCache = SectionCache(cacheFolder, maxSizeBytes=10**6, minAgeDays=10**6)
+            wklyRprtGntr = SlowSectionsReportGenerator(
+                None, fetchWorkers=5, sectionCache=sectionCache)
+            wklyRprtGntr.getReportContextObj(startDate, endDate)
+            self.assertTrue(sectionCache.getStats()['hits'] == 0)
+
+            numGenOtgsFetches = appMetrics.sectionFetchSecs.getCount('genOtgs')
+            numHvNodesFetches = appMetrics.sectionFetchSecs.getCount('hvNodes')
+            reportCxt = wklyRprtGntr.getReportContextObj(
+                startDate, endDate, refreshSections=['hvNodes'])
+            self.assertTrue(sectionCache.getStats()['hits'] == 3)
+            self.assertTrue(appMetrics.sectionFetchSecs.getCount('genOtgs') == numGenOtgsFetches)
+            self.assertTrue(appMetrics.sectionFetchSecs.getCount('hvNodes') == numHvNodesFetches + 1)
+            self.assertTrue(reportCxt['genOtgs'] == ['genOtgs'])
+            self.assertTrue(reportCxt['hvNodes'] == ['hvNodes'])
+
+            with self.assertRaises(ValueError):
+                wklyRprtGntr.getReportContextObj(
+                    startDate, endDate, refreshSections=['iegcMsgs'])
+            # other sections can not be reused without section cache
+            with self.assertRaises(ValueError):
+                SlowSectionsReportGenerator(None).getReportContextObj(
+                    startDate, endDate, refreshSections=['hvNodes'])
+
+    def test_daySlices(self) -> None:
+        """tests that daily sections built from accumulated day slices and a catch up fetch match a full fetch
+        """
+        startDate = dt.datetime(2020, 8, 10)
+        endDate = dt.datetime(2020, 8, 16)
+        dailyCxtKeys = ['freqProfRows', 'weeklyFdi', 'voltStats', 'violMsgs', 'wideViols', 'adjViols']
+        with tempfile.TemporaryDirectory() as tmpFolder:
+            dbPath = os.path.join(tmpFolder, 'mis_warehouse.db')
+            dataSource = generateSyntheticWarehouse(
+                dbPath, dt.datetime(2020, 8, 1), dt.datetime(2020, 8, 31))
+            fullCxt = WeeklyReportGenerator(dataSource).getReportContextObj(startDate, endDate)
+            # day slices can not be accumulated without a day slice store
+            with self.assertRaises(ValueError):
+                WeeklyReportGenerator(dataSource).accumulateDaySlices(dt.datetime(2020, 8, 13))
+
+            daySliceStore = DaySliceStore(os.path.join(tmpFolder, 'day_slices'), retentionDays=10**5)
+            wklyRprtGntr = WeeklyReportGenerator(dataSource, daySliceStore=daySliceStore)
+            numDataDays = wklyRprtGntr.accumulateDaySlices(dt.datetime(2020, 8, 13))
+            self.assertTrue(numDataDays['freqProfile'] == 4)
+            self.assertTrue(daySliceStore.get('freqProfile', dt.datetime(2020, 8, 13)) is not None)
+            self.assertTrue(daySliceStore.get('freqProfile', dt.datetime(2020, 8, 14)) is None)
+
+            reportCxt = wklyRprtGntr.getReportContextObj(startDate, endDate)
+            for cxtKey in dailyCxtKeys:
+                self.assertTrue(reportCxt[cxtKey] == fullCxt[cxtKey])
+            # days fetched in catch up fetch are also stored
+            self.assertTrue(daySliceStore.get('freqProfile', dt.datetime(2020, 8, 16)) is not None)
+
+    def test_intradayDaySlices(self) -> None:
+        """tests that rows with intraday timestamps are kept in the day slices of their calendar day
+        """
+        startDate = dt.datetime(2020, 8, 10)
+        endDate = dt.datetime(2020, 8, 16)
+        with tempfile.TemporaryDirectory() as tmpFolder:
+            dbPath = os.path.join(tmpFolder, 'mis_warehouse.db')
+            dataSource = generateSyntheticWarehouse(
+                dbPath, dt.datetime(2020, 8, 1), dt.datetime(2020, 8, 31))
+            con = sqlite3.connect(dbPath)
+            con.executemany('insert into IEGC_VIOLATION_MESSAGE_DATA values (?,?,?,?,?,?,?)',
+                            [(10**6+1, 'WR-intraday-1', '2020-08-12 10:30:00', 'GUVNL', 100.0, 150.0, 50.0),
+                             (10**6+2, 'WR-intraday-2', '2020-08-13 23:15:00', 'MSEDCL', 200.0, 120.0, -80.0)])
+            con.commit()
+            con.close()
+            weekViolMsgs = IegcViolMsgsFetcher(dataSource).fetchIegcViolMsgsForWeeks([(startDate, endDate)])
+            self.assertTrue(len([m for m in weekViolMsgs[0] if m['msgId'].startswith('WR-intraday')]) == 2)
+
+            wklyRprtGntr = WeeklyReportGenerator(dataSource)
+            days = [startDate + dt.timedelta(days=d) for d in range(7)]
+            daySlices = wklyRprtGntr.fetchViolMsgsDaySlices(days)
+            self.assertTrue(sum([len(s) for s in daySlices]) == len(weekViolMsgs[0]))
+            self.assertTrue(wklyRprtGntr.buildViolMsgsSections(daySlices, [(startDate, endDate)]) ==
+                            [{'violMsgs': weekViolMsgs[0]}])
+
+    def test_generationDeadline(self) -> None:
+        """tests that a hung section is abandoned at the deadline and marked as data unavailable
+        """
+        startDate = dt.datetime(2020, 8, 10)
+        endDate = dt.datetime(2020, 8, 16)
+        with tempfile.TemporaryDirectory() as tmpFolder:
+            dbPath = os.path.join(tmpFolder, 'mis_warehouse.db')
+            generateSyntheticWarehouse(dbPath, dt.datetime(2020, 8, 1), dt.datetime(2020, 8, 31))
+            dataSource = HungViolMsgsDataSource(dbPath)
+
+            appMetrics = getAppMetrics()
+            numFailures = appMetrics.sectionFailures.getValue('violMsgs')
+            wklyRprtGntr = WeeklyReportGenerator(
+                dataSource, fetchWorkers=4, sectionTimeoutSecs=1, deadlineSecs=2)
+            fetchStartTime = time.time()
+            reportCxt = wklyRprtGntr.getReportContextObj(startDate, endDate)
+            self.assertTrue(time.time() - fetchStartTime < 2.5)
+            self.assertTrue(reportCxt['violMsgs'] == [])
+            self.assertTrue(reportCxt['unavailableSections'] == ['IEGC violation messages'])
+            self.assertTrue(len(reportCxt['freqProfRows']) > 0)
+            self.assertTrue(len(reportCxt['voltStats']) > 0)
+            self.assertTrue(appMetrics.sectionFailures.getValue('violMsgs') == numFailures + 1)
+            # let the abandoned query finish before the db file is deleted
+            time.sleep(1.5)
@@ -0,0 +1,43 @@
+import os
+import json
+import unittest
+import tempfile
+from src.config.appConfig import getConfig, getConfigVal
+
+
+class TestAppConfig(unittest.TestCase):
+    def test_cachedConfig(self) -> None:
+        """tests that config is parsed again only when the config file is modified
+        """
+        with tempfile.TemporaryDirectory() as tmpFolder:
+            configFilename = os.path.join(tmpFolder, 'config.json')
+            with open(configFilename, 'w') as f:
+                json.dump({'dumpFolder': 'dumps/', 'fetchWorkers': 4}, f)
+            appConfig = getConfig(configFilename)
+            self.assertTrue(appConfig['fetchWorkers'] == 4)
+
+            # changes by a caller do not leak into the cached config
+            appConfig['fetchWorkers'] = 1
+            self.assertTrue(getConfig(configFilename)['fetchWorkers'] == 4)
+
+            configMtime = os.path.getmtime(configFilename)
+            with open(configFilename, 'w') as f:
+                json.dump({'dumpFolder': 'dumps/', 'fetchWorkers': 8}, f)
+            os.utime(configFilename, (configMtime, configMtime))
+            self.assertTrue(getConfig(configFilename)['fetchWorkers'] == 4)
+            os.utime(configFilename, (configMtime + 10, configMtime + 10))
+            self.assertTrue(getConfig(configFilename)['fetchWorkers'] == 8)
+
+    def test_tomlAndXlsxConfig(self) -> None:
+        """tests that toml config and config.xlsx give the same config values
+        """
+        with tempfile.TemporaryDirectory() as tmpFolder:
+            configFilename = os.path.join(tmpFolder, 'config.toml')
+            with open(configFilename, 'w') as f:
+                f.write('dumpFolder = "dumps/"\nfetchWorkers = 4\n')
+            appConfig = getConfig(configFilename)
+        xlsxConfig = getConfig('config_dummy.xlsx')
+        self.assertTrue(appConfig['dumpFolder'] == xlsxConfig['dumpFolder'])
+        self.assertTrue(appConfig['fetchWorkers'] == xlsxConfig['fetchWorkers'])
+        self.assertTrue(getConfigVal(xlsxConfig, 'logstashHost', 'NA') == 'NA')
+        self.assertTrue(getConfigVal(appConfig, 'logstashHost') is None)
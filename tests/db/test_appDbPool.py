@@ -0,0 +1,12 @@
+import unittest
+from src.db.appDbPool import parseConStr
+
+
+class TestAppDbPool(unittest.TestCase):
+    def test_parseConStr(self) -> None:
+        """tests the function that splits the connection string into user, password and dsn
+        """
+        user, password, dsn = parseConStr('mis_user/p@ss/word@localhost:1521/xepdb1')
+        self.assertTrue(user == 'mis_user')
+        self.assertTrue(password == 'p@ss/word')
+        self.assertTrue(dsn == 'localhost:1521/xepdb1')
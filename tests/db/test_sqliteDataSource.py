@@ -0,0 +1,85 @@
+import os
+import unittest
+import tempfile
+import datetime as dt
+from src.db.syntheticWarehouse import generateSyntheticWarehouse
+from src.fetchers.freqProfileFetcher import FrequencyProfileFetcher
+from src.fetchers.voltStatsFetcher import VoltStatsFetcher
+from src.fetchers.vdiFetcher import VdiFetcher
+from src.fetchers.angleViolFetcher import AnglViolationsFetcher
+from src.fetchers.iegcViolMsgsFetcher import IegcViolMsgsFetcher
+from src.fetchers.ictConstraintsFetcher import IctConstraintsFetcher
+from src.fetchers.outageEventsFetcher import OutageEventsFetcher, iterOutageEvents
+from src.fetchers.transElOutagesFetcher import fetchTransElOutages
+
+
+class TestSqliteDataSource(unittest.TestCase):
+    startDate = dt.datetime(2020, 8, 10)
+    endDate = dt.datetime(2020, 8, 16, 23, 59, 59)
+
+    def setUp(self):
+        self.tmpFolder = tempfile.TemporaryDirectory()
+        self.dbPath = os.path.join(self.tmpFolder.name, 'mis_warehouse.db')
+        self.dataSource = generateSyntheticWarehouse(
+            self.dbPath, dt.datetime(2020, 8, 1), dt.datetime(2020, 8, 31))
+
+    def tearDown(self):
+        self.tmpFolder.cleanup()
+
+    def test_fetchers(self) -> None:
+        """tests that the fetcher queries run unchanged on the synthetic sqlite warehouse
+        """
+        freqProfile = FrequencyProfileFetcher(self.dataSource).fetchDerivedFrequency(
+            self.startDate, self.endDate)
+        self.assertTrue([r['date_day'] for r in freqProfile['freqProfRows']] == list(range(10, 17)))
+
+        voltStats = VoltStatsFetcher(self.dataSource).fetchDerivedVoltage(
+            self.startDate, self.endDate)
+        self.assertTrue(len(voltStats['table1']) == 7)
+
+        vdiData = VdiFetcher(self.dataSource).fetchWeeklyVDI(self.startDate)
+        self.assertTrue(len(vdiData['vdi400Rows']) > 0 and len(vdiData['vdi765Rows']) > 0)
+
+        anglViols = AnglViolationsFetcher(self.dataSource).fetchPairsAnglViolations(
+            self.startDate, self.endDate)
+        self.assertTrue(len(anglViols['wideAnglViols']) == 25)
+
+        violMsgs = IegcViolMsgsFetcher(self.dataSource).fetchIegcViolMsgs(
+            self.startDate, self.endDate)
+        self.assertTrue(len(violMsgs) > 0)
+        self.assertTrue(all([m['entity'] != 'nan' for m in violMsgs]))
+
+        ictCons = IctConstraintsFetcher(self.dataSource).fetchIctConstraints(
+            self.startDate, self.endDate)
+        self.assertTrue(len(ictCons) == 15)
+
+        transOtgs = OutageEventsFetcher(self.dataSource).fetchTransElOutages(
+            self.startDate, self.endDate)
+        self.assertTrue(len(transOtgs) > 0)
+        self.assertTrue(self.dataSource.getStats()['busySessions'] == 0)
+
+    def test_seededData(self) -> None:
+        """tests that same seed generates the same data
+        """
+        otherDbPath = os.path.join(self.tmpFolder.name, 'other.db')
+        otherDataSource = generateSyntheticWarehouse(
+            otherDbPath, dt.datetime(2020, 8, 1), dt.datetime(2020, 8, 31))
+        otgs = OutageEventsFetcher(self.dataSource).fetchTransElOutages(self.startDate, self.endDate)
+        otherOtgs = OutageEventsFetcher(otherDataSource).fetchTransElOutages(self.startDate, self.endDate)
+        self.assertTrue(otgs == otherOtgs)
+
+    def test_streamedOutages(self) -> None:
+        """tests that outages streamed in small cursor batches are same as the fetched outages
+        and the connection is released even if the stream is not consumed fully
+        """
+        cursorOpts = {'arraySize': 7, 'prefetchRows': 7}
+        streamedOtgs = fetchTransElOutages(self.dataSource, self.startDate, self.endDate, cursorOpts)
+        otgs = OutageEventsFetcher(self.dataSource).fetchTransElOutages(self.startDate, self.endDate)
+        self.assertTrue(len(streamedOtgs) > 7)
+        self.assertTrue(streamedOtgs == otgs)
+
+        outageEvents = iterOutageEvents(self.dataSource, self.startDate, self.endDate, cursorOpts=cursorOpts)
+        next(outageEvents)
+        self.assertTrue(self.dataSource.getStats()['busySessions'] == 1)
+        outageEvents.close()
+        self.assertTrue(self.dataSource.getStats()['busySessions'] == 0)
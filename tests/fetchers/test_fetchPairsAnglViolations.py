@@ -1,17 +1,18 @@
 import unittest
 import datetime as dt
 from src.config.appConfig import getConfig
+from src.db.appDbPool import initAppDbPool, AppDbPool
 from src.fetchers.angleViolFetcher import AnglViolationsFetcher
 from src.typeDefs.angleViolSummary import IAngleViolSummary
 from typing import List
 
 
 class TestAnglViolationsFetch(unittest.TestCase):
-    appDbConStr: str = ''
+    appDbPool: AppDbPool = None
 
     def setUp(self):
         appConfig = getConfig()
-        self.appDbConStr = appConfig['appDbConStr']
+        self.appDbPool = initAppDbPool(appConfig)
 
     def test_run(self) -> None:
         """tests the function that fetches the ouatges from reporting software
@@ -19,7 +20,7 @@ class TestAnglViolationsFetch(unittest.TestCase):
         startDate = dt.datetime(2020, 8, 9)
         endDate = dt.datetime(2020, 8, 15)
 
-        anglViolFetcher = AnglViolationsFetcher(self.appDbConStr)
+        anglViolFetcher = AnglViolationsFetcher(self.appDbPool)
         violData: IAngleViolSummary = anglViolFetcher.fetchPairsAnglViolations(
             startDate, endDate)
         # print(outages)
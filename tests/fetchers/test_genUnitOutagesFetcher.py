@@ -1,17 +1,18 @@
 import unittest
 import datetime as dt
 from src.config.appConfig import getConfig
+from src.db.appDbPool import initAppDbPool, AppDbPool
 from src.fetchers.genUnitOutagesFetcher import fetchMajorGenUnitOutages
 from src.typeDefs.outage import IOutage
 from typing import List
 
 
 class TestFetchGenUnitOutages(unittest.TestCase):
-    appDbConStr: str = ''
+    appDbPool: AppDbPool = None
 
     def setUp(self):
         appConfig = getConfig()
-        self.appDbConStr = appConfig['appDbConStr']
+        self.appDbPool = initAppDbPool(appConfig)
 
     def test_run(self) -> None:
         """tests the function that fetches the ouatges from reporting software
@@ -20,6 +21,6 @@ class TestFetchGenUnitOutages(unittest.TestCase):
         endDate = dt.datetime(2020, 8, 8)
 
         outages: List[IOutage] = fetchMajorGenUnitOutages(
-            self.appDbConStr, startDate, endDate)
+            self.appDbPool, startDate, endDate)
         # print(outages)
         self.assertTrue(len(outages) > 0)
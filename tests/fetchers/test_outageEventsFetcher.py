@@ -0,0 +1,70 @@
+import unittest
+import datetime as dt
+from src.fetchers.outageEventsFetcher import filterMajorGenUnitOutages, filterTransElOutages, filterLongTimeUnrevivedForcedOutages, partitionOutageEvents
+
+
+def getOutageEvent(elName, owners, capacity, entityName, shutdownTypeName, outageDt, revivalDt):
+    return {'elName': elName, 'owners': owners, 'capacity': capacity, 'entityName': entityName,
+            'shutdownTypeName': shutdownTypeName, 'outageDt': outageDt, 'revivalDt': revivalDt,
+            'outageDate': dt.datetime.strftime(outageDt, "%d-%m-%Y"), 'outageTime': '00:00',
+            'revivalDate': 'Still out', 'revivalTime': 'Still out', 'reason': ''}
+
+
+class TestOutageEventsFetcher(unittest.TestCase):
+    startDt = dt.datetime(2020, 8, 10)
+    endDt = dt.datetime(2020, 8, 16, 23, 59, 59)
+    outageEvents = [
+        getOutageEvent('unit1', 'B', 210, 'GENERATING_UNIT', 'PLANNED',
+                       dt.datetime(2020, 8, 11), None),
+        getOutageEvent('unit2', 'A', 500, 'GENERATING_UNIT', 'FORCED',
+                       dt.datetime(2020, 8, 1), dt.datetime(2020, 8, 12)),
+        getOutageEvent('unit3', 'A', 500, 'GENERATING_UNIT', 'FORCED',
+                       dt.datetime(2020, 8, 12), dt.datetime(2020, 8, 13)),
+        getOutageEvent('unit4', 'A', 50, 'GENERATING_UNIT', 'FORCED',
+                       dt.datetime(2020, 8, 1), None),
+        getOutageEvent('unit5', 'A', 660, 'GENERATING_UNIT', 'FORCED',
+                       dt.datetime(2020, 8, 3), dt.datetime(2020, 8, 13)),
+        getOutageEvent('line1', 'C', 400, 'AC_TRANSMISSION_LINE_CIRCUIT', 'FORCED',
+                       dt.datetime(2019, 1, 1), None),
+        getOutageEvent('line2', 'C', 400, 'AC_TRANSMISSION_LINE_CIRCUIT', 'FORCED',
+                       dt.datetime(2020, 7, 1), dt.datetime(2020, 8, 5)),
+        getOutageEvent('ict1', 'D', 765, 'ICT', 'FORCED',
+                       dt.datetime(2020, 1, 1), dt.datetime(2020, 9, 1))
+    ]
+
+    def test_filterMajorGenUnitOutages(self) -> None:
+        """tests the function that derives major generating unit outages from outage events
+        """
+        outages = filterMajorGenUnitOutages(
+            self.outageEvents, self.startDt, self.endDt)
+        self.assertTrue([o['elName'] for o in outages] == ['unit5', 'unit2', 'unit1'])
+        self.assertTrue(outages[0]['capacity'] == '660')
+
+    def test_filterTransElOutages(self) -> None:
+        """tests the function that derives transmission element outages from outage events
+        """
+        outages = filterTransElOutages(
+            self.outageEvents, self.startDt, self.endDt)
+        self.assertTrue([o['elName'] for o in outages] == ['ict1', 'line1'])
+        self.assertTrue(outages[0]['capacity'] == '765')
+
+    def test_filterLongTimeUnrevivedForcedOutages(self) -> None:
+        """tests the function that derives long time unrevived forced outages from outage events
+        """
+        outages = filterLongTimeUnrevivedForcedOutages(
+            self.outageEvents, self.endDt)
+        self.assertTrue([o['elName'] for o in outages] == ['line1', 'ict1'])
+
+    def test_partitionOutageEvents(self) -> None:
+        """tests that outage sections of each week derived in a single pass of streamed events match the section filters
+        """
+        weekWindows = [(dt.datetime(2020, 8, 3), dt.datetime(2020, 8, 9, 23, 59, 59)), (self.startDt, self.endDt)]
+        outageSections = partitionOutageEvents((e for e in self.outageEvents), weekWindows)
+        for weekInd, (startDt, endDt) in enumerate(weekWindows):
+            self.assertTrue(outageSections['genOtgs'][weekInd] ==
+                            filterMajorGenUnitOutages(self.outageEvents, startDt, endDt))
+            self.assertTrue(outageSections['transOtgs'][weekInd] ==
+                            filterTransElOutages(self.outageEvents, startDt, endDt))
+            self.assertTrue(outageSections['longTimeOtgs'][weekInd] ==
+                            filterLongTimeUnrevivedForcedOutages(self.outageEvents, endDt))
+        self.assertTrue([o['elName'] for o in outageSections['transOtgs'][0]] == ['line2', 'ict1', 'line1'])
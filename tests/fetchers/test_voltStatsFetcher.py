@@ -0,0 +1,55 @@
+import unittest
+import datetime as dt
+import pandas as pd
+from src.fetchers.voltStatsFetcher import VoltStatsFetcher
+from src.config.voltStatsLayout import getVoltStatsLayout
+
+
+class TestVoltStatsFetcher(unittest.TestCase):
+    def test_toVoltStatsDict(self) -> None:
+        """tests the function that builds the daily voltage tables from derived voltage rows of all days
+        """
+        layout = getVoltStatsLayout()
+        stnNodes = [k.split('|') for k in layout['stnColIndsMap'].keys()]
+        rows = []
+        for dayInd in range(7):
+            for stnInd, (voltLvl, nodeName) in enumerate(stnNodes):
+                # no data for the first station on the second day
+                if dayInd == 1 and stnInd == 0:
+                    continue
+                rows.append({'DATE_KEY': dt.datetime(2020, 8, 10+dayInd),
+                             'NODE_NAME': nodeName.upper(),
+                             'NODE_VOLTAGE': int(voltLvl),
+                             'MAXIMUM': 400.4 + stnInd, 'MINIMUM': 380.6 + dayInd})
+        # station not present in layout
+        rows.append({'DATE_KEY': dt.datetime(2020, 8, 10), 'NODE_NAME': 'unknown',
+                     'NODE_VOLTAGE': 400, 'MAXIMUM': 401, 'MINIMUM': 399})
+        # rows of the result set need not be in sorted order
+        df = pd.DataFrame(rows).sample(frac=1, random_state=0)
+
+        with self.assertLogs(level='WARNING') as logCtx:
+            voltStats = VoltStatsFetcher(None).toVoltStatsDict(df)
+        self.assertTrue(any(["'400|unknown'" in m for m in logCtx.output]))
+        self.assertTrue([len(voltStats[t]) for t in ['table1', 'table2', 'table3', 'table4']] == [7, 7, 7, 7])
+        self.assertTrue(voltStats['table1'][0]['date'] == 10)
+        self.assertTrue(voltStats['table1'][0]['amreliMax'] == 400)
+        self.assertTrue(voltStats['table1'][1]['amreliMax'] == '-')
+        self.assertTrue(voltStats['table1'][2]['amreliMin'] == 383)
+        self.assertTrue(voltStats['table3'][0]['gwaliorMax'] == 400 + stnNodes.index(['765', 'gwalior']))
+        self.assertTrue(voltStats['table4'][6]['wardhaMax'] == 433)
+        self.assertTrue(list(voltStats['table4'][0].keys())[0:3] == ['date', 'sasanMax', 'sasanMin'])
+
+    def test_positionalFallback(self) -> None:
+        """tests that stations are placed by their sorted position if no node name matches the layout
+        """
+        layout = getVoltStatsLayout()
+        rows = [{'DATE_KEY': dt.datetime(2020, 8, 10), 'NODE_NAME': 'NODE {0:02d}'.format(stnInd),
+                 'NODE_VOLTAGE': 765 if stnInd >= 30 else 400, 'MAXIMUM': 400 + stnInd, 'MINIMUM': 390}
+                for stnInd in range(layout['numStns'])]
+        df = pd.DataFrame(rows).sample(frac=1, random_state=0)
+
+        with self.assertLogs(level='WARNING'):
+            voltStats = VoltStatsFetcher(None).toVoltStatsDict(df)
+        self.assertTrue(voltStats['table1'][0]['amreliMax'] == 400)
+        self.assertTrue(voltStats['table2'][0]['indoreMax'] == 409)
+        self.assertTrue(voltStats['table4'][0]['wardhaMax'] == 400 + layout['numStns'] - 1)
@@ -0,0 +1,15 @@
+import unittest
+from benchmarks.benchmarkSuite import findRegressions
+
+
+class TestBenchmarkSuite(unittest.TestCase):
+    def test_findRegressions(self) -> None:
+        """tests that only benchmarks slower than the median of recent runs by more than threshold are regressions
+        """
+        history = [{'results': {'a': 1.0, 'b': 1.0}},
+                   {'results': {'a': 1.1, 'b': 3.0}},
+                   {'results': {'a': 0.9, 'b': 1.0}}]
+        regressions = findRegressions(
+            {'a': 1.3, 'b': 1.1, 'c': 5.0}, history, threshold=0.2)
+        self.assertTrue(list(regressions.keys()) == ['a'])
+        self.assertTrue(regressions['a'] == (1.0, 1.3))
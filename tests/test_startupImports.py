@@ -0,0 +1,25 @@
+import sys
+import unittest
+import subprocess
+
+
+class TestStartupImports(unittest.TestCase):
+    def test_lazyImports(self) -> None:
+        """tests that the modules imported by entry points do not load the heavy libraries
+        """
+        checkCode = 'import sys, src.app.reportBatchExecutor, src.app.reportJobsManager, src.db.appDbPool, src.appLogger; ' + \
+            'print(sorted([m for m in ["pandas", "numpy", "docxtpl", "cx_Oracle", "logstash_async"] if m in sys.modules]))'
+        proc = subprocess.run([sys.executable, '-c', checkCode],
+                              stdout=subprocess.PIPE, text=True, check=True)
+        self.assertTrue(proc.stdout.strip() == '[]')
+
+    def test_spawnedWorkerImport(self) -> None:
+        """tests that the service is not set up again when a spawned render worker imports server.py,
+        spawned workers run the main file as __mp_main__ like runpy.run_path
+        """
+        checkCode = 'import runpy; from src.db.appDbPool import AppDbPool; ' + \
+            'serverGlobals = runpy.run_path("server.py", run_name="__mp_main__"); ' + \
+            'print(AppDbPool._AppDbPool__instance is None, "reportJobsManager" in serverGlobals)'
+        proc = subprocess.run([sys.executable, '-c', checkCode],
+                              stdout=subprocess.PIPE, text=True, check=True)
+        self.assertTrue(proc.stdout.strip() == 'True False')
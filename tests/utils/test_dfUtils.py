@@ -0,0 +1,41 @@
+import unittest
+import datetime as dt
+import pandas as pd
+from src.utils.dfUtils import buildRowsFromColumns, toFixed2Strs, toRound2, toRoundedInts, toHrsSpanStrs, getDateStrsFormatter, partitionByWeeks
+
+
+class TestDfUtils(unittest.TestCase):
+    def test_buildRowsFromColumns(self) -> None:
+        """tests the function that builds context rows from dataframe columns
+        """
+        df = pd.DataFrame({'NAME': ['a', 'b'], 'VAL': [1.005, 49.9], 'ANGLE': [2.675, 10.0],
+                           'MW': [10.5, -11.5], 'HRS': [29.6, 0.25],
+                           'DATE_TIME': [dt.datetime(2020, 8, 2), dt.datetime(2020, 8, 13)]},
+                          index=[5, 3])
+        rows = buildRowsFromColumns(df, {
+            'name': ('NAME', None),
+            'val': ('VAL', toFixed2Strs),
+            'angle': ('ANGLE', toRound2),
+            'mw': ('MW', toRoundedInts),
+            'hrs': ('HRS', toHrsSpanStrs),
+            'date': ('DATE_TIME', getDateStrsFormatter('%d-%m-%Y'))
+        })
+        # results must be same as formatting each cell of the dataframe
+        expectedRows = [{'name': df['NAME'][i], 'val': "{:0.2f}".format(df['VAL'][i]),
+                         'angle': round(df['ANGLE'][i], 2), 'mw': int(round(df['MW'][i])),
+                         'hrs': '29:36' if i == 5 else '00:15',
+                         'date': dt.datetime.strftime(df['DATE_TIME'][i], '%d-%m-%Y')} for i in df.index]
+        self.assertTrue(rows == expectedRows)
+        self.assertTrue(buildRowsFromColumns(df.iloc[0:0], {'name': ('NAME', None)}) == [])
+
+    def test_partitionByWeeks(self) -> None:
+        """tests the function that splits the rows of a date range into weeks
+        """
+        df = pd.DataFrame({'DATE_KEY': [dt.datetime(2020, 8, 16), dt.datetime(2020, 8, 10),
+                                        dt.datetime(2020, 8, 17), dt.datetime(2020, 8, 23, 10)],
+                           'VAL': [1, 2, 3, 4]})
+        weekDfs = partitionByWeeks(df, 'DATE_KEY', [(dt.datetime(2020, 8, 10), dt.datetime(2020, 8, 16, 23, 59, 59)),
+                                                    (dt.datetime(2020, 8, 17), dt.datetime(2020, 8, 23, 23, 59, 59))])
+        self.assertTrue(weekDfs[0]['VAL'].tolist() == [1, 2])
+        # rows after 00:00 of week end day are not included like sql to_date
+        self.assertTrue(weekDfs[1]['VAL'].tolist() == [3])
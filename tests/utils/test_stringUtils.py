@@ -1,6 +1,9 @@
+import os
+import json
 import unittest
+import tempfile
 import datetime as dt
-from src.utils.stringUtils import removeRedundantRemarks, combineTagReasonRemarks
+from src.utils.stringUtils import removeRedundantRemarks, combineTagReasonRemarks, removeRedundantRemarksBatch, cleanOutageReasons
 
 
 class TestStringUtils(unittest.TestCase):
@@ -59,3 +62,27 @@ class TestStringUtils(unittest.TestCase):
 
         self.assertTrue(combineTagReasonRemarks(
             "RSD", "adsd", None) == "RSD / adsd")
+
+    def test_removeRedundantRemarksBatch(self) -> None:
+        """tests that the batch api cleans the columns same as row wise cleaning
+        """
+        rows = [("RSD", "rsd", "rsd."), ("Outage", "RSD", None),
+                ("Voltage Regulation", " VR", "vr. to control voltage"), ("RSD", "rsd", "rsd.")]
+        tags, reasons, remarks = removeRedundantRemarksBatch(*zip(*rows))
+        self.assertTrue(list(zip(tags, reasons, remarks)) ==
+                        [removeRedundantRemarks(*r) for r in rows])
+        self.assertTrue(cleanOutageReasons(*zip(*rows)) ==
+                        ["RSD", "RSD", "Voltage Regulation /  to control voltage", "RSD"])
+
+    def test_configuredTagRule(self) -> None:
+        """tests that a new tag rule works with only a rules file entry
+        """
+        with tempfile.TemporaryDirectory() as tmpFolder:
+            rulesFilename = os.path.join(tmpFolder, 'remarks_rules.json')
+            with open(rulesFilename, 'w') as f:
+                json.dump({'ignoredTags': ['outage'],
+                           'rules': [{'tags': ['Line Tripped'], 'undesiredRemarks': ['lt', 'trip'],
+                                      'undesiredStartRegex': r'^(lt|trip)\.?'}]}, f)
+            tag, reas, rem = removeRedundantRemarks(
+                "Line tripped", " TRIP", "lt. on DT received", rulesFilename=rulesFilename)
+            self.assertTrue((tag == "Line tripped") and (reas == None) and (rem == " on DT received"))
@@ -1,6 +1,6 @@
 import unittest
 import datetime as dt
-from src.utils.timeUtils import getWeekNumOfFinYr, getFinYearForDt, getSundayAfterDt, getMondayBeforeDt
+from src.utils.timeUtils import getWeekNumOfFinYr, getFinYearForDt, getSundayAfterDt, getMondayBeforeDt, getWeekWindows, getFinWeeks
 
 
 class TestTimeUtils(unittest.TestCase):
@@ -33,3 +33,25 @@ class TestTimeUtils(unittest.TestCase):
         mondayDt = getMondayBeforeDt(inpDt)
         self.assertTrue((mondayDt - dt.datetime(2020, 9, 28))
                         == dt.timedelta(days=0))
+
+    def test_getWeekWindows(self) -> None:
+        """tests the function that gets the Monday to Sunday weeks of a date range
+        """
+        weekWindows = getWeekWindows(
+            dt.datetime(2020, 10, 1), dt.datetime(2020, 10, 12))
+        self.assertTrue(weekWindows == [(dt.datetime(2020, 9, 28), dt.datetime(2020, 10, 4)),
+                                        (dt.datetime(2020, 10, 5), dt.datetime(2020, 10, 11)),
+                                        (dt.datetime(2020, 10, 12), dt.datetime(2020, 10, 18))])
+
+    def test_getFinWeeks(self) -> None:
+        """tests that the financial year weeks of a date range match the week number and financial year of each week
+        """
+        finWeeks = getFinWeeks(dt.datetime(2020, 3, 25), dt.datetime(2022, 4, 6))
+        self.assertTrue(len(finWeeks) == 107)
+        for finWeek in finWeeks:
+            self.assertTrue(finWeek['wkNum'] == getWeekNumOfFinYr(finWeek['startDt']))
+            self.assertTrue(finWeek['finYr'] == getFinYearForDt(finWeek['startDt']))
+        self.assertTrue(finWeeks[1]['startDt'] == dt.datetime(2020, 3, 30))
+        self.assertTrue(finWeeks[1]['wkNum'] == 1)
+        self.assertTrue(finWeeks[1]['finYrStr'] == '2020-21')
+        self.assertTrue(getFinWeeks(dt.datetime(2020, 3, 25), dt.datetime(2020, 3, 24)) == [])